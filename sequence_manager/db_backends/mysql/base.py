@@ -0,0 +1,15 @@
+from django.db.backends.mysql import base as mysql_base
+
+from sequence_manager.utils.connection_pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, mysql_base.DatabaseWrapper):
+    """MySQL backend checking its connections out of a connection pool."""
+
+    @classmethod
+    def is_connection_alive(cls, connection) -> bool:
+        try:
+            connection.ping()
+        except cls.Database.Error:
+            return False
+        return True
@@ -0,0 +1,206 @@
+import logging
+
+from asgiref.sync import sync_to_async
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.serializers import (
+    FibonacciNumberQuerySerializer,
+    FibonacciNumberSerializer,
+    NumberRangeSerializer,
+    ValueEncodingSerializer,
+)
+from sequence_manager.fibonacci.services import BlacklistService, FibonacciSequenceService
+from sequence_manager.fibonacci.utils.paginators import FibonacciNumberPagination
+from sequence_manager.fibonacci.utils.sequences import FibonacciNumberSequence
+from sequence_manager.fibonacci.utils.value_encodings import DECIMAL_ENCODING, encode_value
+from sequence_manager.utils.custom_responses import JsonResponseError, JsonResponseSuccess
+from sequence_manager.utils.metrics import timed_phase
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_thread(func):
+    """Wraps a CPU-heavy function so that awaiting it does not block the event loop."""
+    return sync_to_async(func, thread_sensitive=False)
+
+
+def build_fib_number_response(number: int, fib_num: int, value_encoding: str):
+    return JsonResponseSuccess({"number": number, "value": encode_value(fib_num, value_encoding)})
+
+
+async def get_fib_number_response(
+    number: int, value_encoding: str = DECIMAL_ENCODING
+) -> JsonResponseSuccess:
+    # The computation, the encoding and the serialization of a big value are all CPU-bound
+    with timed_phase("compute"):
+        fib_num = await FibonacciComputationExecutor().aget_fib_number(number - 1)
+    return await run_in_thread(build_fib_number_response)(number, fib_num, value_encoding)
+
+
+class AsyncFibonacciNumberView(View):
+
+    async def get(self, request, number: int, *args, **kwargs):
+        """Retrieve the value from the Fibonacci sequence for a given number.
+
+        GET /api/v1/async/fibonacci/<number>/
+
+        Description:
+            Async counterpart of `GET /api/v1/fibonacci/<number>/`, with the same parameters and
+            responses. The blacklist is checked with the async ORM, and the value is computed in a
+            worker thread, so the event loop keeps serving other requests in the meantime.
+        """
+        serializer = FibonacciNumberSerializer(data={"number": number})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        query_serializer = FibonacciNumberQuerySerializer(data=request.GET)
+
+        if not query_serializer.is_valid():
+            return JsonResponseError(
+                query_serializer.errors, message="Validation error", status=400
+            )
+
+        with timed_phase("blacklist"):
+            is_blacklisted = await BlacklistService().ais_blacklisted(number)
+
+        if is_blacklisted:
+            return JsonResponseError("This number is blacklisted and cannot be used.", status=403)
+
+        if query_serializer.validated_data["mode"] == "approx":
+            significant_digits = query_serializer.validated_data["significant_digits"]
+            approx = FibonacciSequenceService().get_fib_number_approx(
+                number - 1, significant_digits=significant_digits
+            )
+            return JsonResponseSuccess({"number": number, "mode": "approx", **approx})
+
+        modulus = query_serializer.validated_data.get("mod")
+        value_encoding = query_serializer.validated_data["value_encoding"]
+        if modulus is not None:
+            get_fib_number_mod = run_in_thread(FibonacciSequenceService().get_fib_number_mod)
+            fib_num = await get_fib_number_mod(number - 1, modulus)
+            return JsonResponseSuccess(
+                {
+                    "number": number,
+                    "modulus": modulus,
+                    "value": encode_value(fib_num, value_encoding),
+                }
+            )
+
+        try:
+            return await get_fib_number_response(number, value_encoding)
+        except APIException as exc:
+            return JsonResponseError(exc.detail, status=exc.status_code)
+
+
+class AsyncFibonacciNumberListView(View):
+
+    async def get(self, request, number: int, *args, **kwargs):
+        """Retrieve a list of Fibonacci numbers up to a given position, excluding blacklisted values.
+
+        GET /api/v1/async/fibonacci/list/<number>/
+
+        Description:
+            Async counterpart of `GET /api/v1/fibonacci/list/<number>/`, supporting the same page
+            number and cursor pagination. The page is computed in a worker thread.
+        """
+        serializer = FibonacciNumberSerializer(data={"number": number})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        return await self.get_sequence_response(request, number)
+
+    async def get_sequence_response(self, request, stop: int, start: int = 1):
+        """Returns a page of the visible Fibonacci numbers between two positions."""
+        query_serializer = ValueEncodingSerializer(data=request.GET)
+
+        if not query_serializer.is_valid():
+            return JsonResponseError(
+                query_serializer.errors, message="Validation error", status=400
+            )
+
+        with timed_phase("blacklist"):
+            blacklist = await BlacklistService().aget_blacklist_index()
+        fib_nums = FibonacciNumberSequence(
+            stop,
+            start=start,
+            blacklist=blacklist,
+            value_encoding=query_serializer.validated_data["value_encoding"],
+        )
+
+        paginator = FibonacciNumberPagination()
+        try:
+            return await run_in_thread(paginator.paginate)(fib_nums, Request(request))
+        except APIException as exc:
+            return JsonResponseError(exc.detail, status=exc.status_code)
+
+
+class AsyncFibonacciNumberRangeView(AsyncFibonacciNumberListView):
+
+    async def get(self, request, start: int, end: int, *args, **kwargs):
+        """Retrieve the Fibonacci numbers between two positions, excluding blacklisted values.
+
+        GET /api/v1/async/fibonacci/range/<start>/<end>/
+
+        Description:
+            Async counterpart of `GET /api/v1/fibonacci/range/<start>/<end>/`.
+        """
+        serializer = NumberRangeSerializer(data={"start": start, "end": end})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        return await self.get_sequence_response(request, end, start=start)
+
+
+class AsyncBlacklistNumberView(View):
+
+    async def post(self, request, number: int, *args, **kwargs):
+        """Add a Fibonacci number to the blacklist.
+
+        POST /api/v1/async/blacklist/<number>/
+
+        Description:
+            Async counterpart of `POST /api/v1/blacklist/<number>/`, with the same responses.
+        """
+        serializer = FibonacciNumberSerializer(data={"number": number})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        try:
+            await BlacklistService().aadd_to_blacklist(number)
+        except APIException as exc:
+            return JsonResponseError(exc.detail, status=exc.status_code)
+
+        success_message = f"Number {number} has been added to the blacklist!"
+        logger.info(success_message)
+
+        return JsonResponseSuccess(success_message, status=201)
+
+    async def delete(self, request, number: int, *args, **kwargs):
+        """Remove a Fibonacci number from the blacklist.
+
+        DELETE /api/v1/async/blacklist/<number>/
+
+        Description:
+            Async counterpart of `DELETE /api/v1/blacklist/<number>/`, with the same responses.
+        """
+        serializer = FibonacciNumberSerializer(data={"number": number})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        try:
+            await BlacklistService().aremove_from_blacklist(number)
+        except APIException as exc:
+            return JsonResponseError(exc.detail, status=exc.status_code)
+
+        success_message = f"Number {number} has been deleted from the blacklist!"
+        logger.info(success_message)
+
+        return JsonResponseSuccess(success_message)
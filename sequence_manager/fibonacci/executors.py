@@ -0,0 +1,268 @@
+import logging
+import multiprocessing
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from asgiref.sync import sync_to_async
+
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.api_exceptions import (
+    ComputationTooLargeApiException,
+    ComputationUnavailableApiException,
+    ResponseTooLargeApiException,
+)
+from sequence_manager.fibonacci.utils.engines import (
+    ComputationBudgetExceeded,
+    compute_fib_number,
+    compute_fib_numbers,
+    compute_fib_pair,
+    estimate_fib_bytes,
+    estimate_fib_digits,
+)
+from sequence_manager.utils.constants import (
+    FIB_COMPUTE_TIMEOUT,
+    FIB_CPU_TIME_BUDGET,
+    FIB_MAX_RESPONSE_BYTES,
+    FIB_MAX_RESULT_BYTES,
+    FIB_MAX_RESULT_DIGITS,
+    FIB_OFFLOAD_MAX_WORKERS,
+    FIB_OFFLOAD_THRESHOLD,
+)
+from sequence_manager.utils.metrics import timed_phase
+
+
+logger = logging.getLogger(__name__)
+
+
+class FibonacciComputationExecutor:
+    """Runs Fibonacci computations under result-size and CPU-time budgets.
+
+    Requests whose result would exceed `max_result_bytes`, or `max_result_digits` decimal digits
+    once rendered, are rejected before any work is done, as are requests for many values (a batch
+    or a list page) which together would exceed `max_response_bytes`.
+    Indexes below `offload_threshold` are computed in-process by `FibonacciSequenceService`, while
+    larger ones are sent to a process pool shared by all executors of the process, so pure-Python
+    big-int arithmetic does not hold the GIL of the request worker. Pool computations abort
+    themselves once they use up `cpu_time_budget` seconds of CPU time, and the caller stops
+    waiting after `timeout` seconds.
+
+    Concurrent requests for the same large index share a single computation through the
+    `single_flight` of the service, both for threads (`get_fib_number`) and for asyncio tasks
+    (`aget_fib_number`). Values are looked up in the precomputed table and in the result cache of
+    the service before being computed.
+    """
+
+    offload_threshold: int = FIB_OFFLOAD_THRESHOLD
+    max_workers: int = FIB_OFFLOAD_MAX_WORKERS
+    cpu_time_budget: float = FIB_CPU_TIME_BUDGET
+    timeout: float = FIB_COMPUTE_TIMEOUT
+    max_result_bytes: int = FIB_MAX_RESULT_BYTES
+    max_result_digits: int = FIB_MAX_RESULT_DIGITS
+    max_response_bytes: int = FIB_MAX_RESPONSE_BYTES
+
+    _pool: ProcessPoolExecutor | None = None
+    _pool_lock = threading.Lock()
+
+    def __init__(self, service: FibonacciSequenceService | None = None):
+        """Initializes the executor.
+
+        Args:
+            service (FibonacciSequenceService, optional): The service used for in-process
+                computations, its engine is also used in the pool. Defaults to a service with the
+                default engine.
+        """
+        self.service = service or FibonacciSequenceService()
+
+    @timed_phase("compute")
+    def get_fib_number(self, index: int) -> int:
+        """Returns the Fibonacci number at the given index within the configured budgets.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            int: The Fibonacci number at the specified index.
+
+        Raises:
+            ValueError: If the input index is negative.
+            ComputationTooLargeApiException: If the result would exceed the size budget.
+            ComputationUnavailableApiException: If the computation exceeds the time budget.
+        """
+        self._check_index(index)
+
+        fib_num = self.service.get_known_fib_number(index)
+        if fib_num is not None:
+            return fib_num
+
+        if self.service.is_coalesced(index):
+            return self.service.single_flight.do(
+                self._get_flight_key(index), self._compute_fib_number, index
+            )
+
+        return self._compute_fib_number(index)
+
+    async def aget_fib_number(self, index: int) -> int:
+        """Async version of `get_fib_number`, the computation runs in a worker thread.
+
+        Coalesced tasks wait for the in-flight computation without occupying a thread.
+        """
+        self._check_index(index)
+
+        fib_num = self.service.get_known_fib_number(index)
+        if fib_num is not None:
+            return fib_num
+
+        compute = sync_to_async(self._compute_fib_number, thread_sensitive=False)
+        if self.service.is_coalesced(index):
+            return await self.service.single_flight.ado(self._get_flight_key(index), compute, index)
+
+        return await compute(index)
+
+    @timed_phase("compute")
+    def get_fib_numbers(self, indexes: Iterable[int]) -> dict[int, int]:
+        """Returns the Fibonacci numbers at many indexes within the configured budgets.
+
+        Args:
+            indexes (Iterable[int]): The indexes in the Fibonacci sequence (0-based).
+
+        Returns:
+            dict[int, int]: Maps every distinct index to its Fibonacci number.
+
+        Raises:
+            ValueError: If any of the indexes is negative.
+            ComputationTooLargeApiException: If any result would exceed the size budget.
+            ResponseTooLargeApiException: If the results would together exceed the response budget.
+            ComputationUnavailableApiException: If the computation exceeds the time budget.
+        """
+        indexes = sorted(set(indexes))
+        if not indexes:
+            return {}
+
+        if indexes[0] < 0:
+            raise ValueError("The 'index' argument cannot be negative.")
+
+        self.check_result_size(indexes[-1])
+        self.check_response_size(sum(estimate_fib_bytes(index) for index in indexes))
+
+        if indexes[-1] < self.offload_threshold:
+            return self.service.get_fib_numbers(indexes)
+
+        return self._run_in_pool(compute_fib_numbers, indexes, self.service.engine)
+
+    @timed_phase("compute")
+    def get_fib_pair(self, index: int) -> tuple[int, int]:
+        """Returns the pair (F(index), F(index + 1)) within the configured budgets.
+
+        This is the fast jump seeding list pages and streams, which is offloaded to the process
+        pool at or above `offload_threshold` like single values.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            tuple[int, int]: The Fibonacci numbers at positions `index` and `index + 1`.
+
+        Raises:
+            ValueError: If the input index is negative.
+            ComputationTooLargeApiException: If the result would exceed the size budget.
+            ComputationUnavailableApiException: If the computation exceeds the time budget.
+        """
+        self._check_index(index)
+
+        if index < self.offload_threshold:
+            return self.service.get_fib_pair(index)
+
+        fib_pair = self.service.get_known_fib_pair(index)
+        if fib_pair is not None:
+            return fib_pair
+
+        if self.service.is_coalesced(index):
+            return self.service.single_flight.do(
+                ("pair", self.service.engine, index),
+                self._run_in_pool,
+                compute_fib_pair,
+                index,
+                self.service.engine,
+            )
+
+        return self._run_in_pool(compute_fib_pair, index, self.service.engine)
+
+    def check_result_size(self, index: int):
+        """Rejects indexes whose Fibonacci number would exceed the result-size budget.
+
+        Raises:
+            ComputationTooLargeApiException: If the result would exceed the size budget.
+        """
+        if self.max_result_bytes and estimate_fib_bytes(index) > self.max_result_bytes:
+            raise ComputationTooLargeApiException()
+
+        if self.max_result_digits and estimate_fib_digits(index) > self.max_result_digits:
+            raise ComputationTooLargeApiException()
+
+    def check_response_size(self, estimated_bytes: int):
+        """Rejects responses whose values would together exceed the response-size budget.
+
+        Args:
+            estimated_bytes (int): The estimated size of all values, see `estimate_fib_bytes`.
+
+        Raises:
+            ResponseTooLargeApiException: If the values would exceed the response budget.
+        """
+        if self.max_response_bytes and estimated_bytes > self.max_response_bytes:
+            raise ResponseTooLargeApiException()
+
+    def _check_index(self, index: int):
+        if index < 0:
+            raise ValueError("The 'index' argument cannot be negative.")
+
+        self.check_result_size(index)
+
+    def _get_flight_key(self, index: int) -> tuple:
+        return ("fib", self.service.engine, index)
+
+    def _compute_fib_number(self, index: int) -> int:
+        if index < self.offload_threshold:
+            fib_num = compute_fib_number(index, self.service.engine)
+        else:
+            fib_num = self._run_in_pool(compute_fib_number, index, self.service.engine)
+
+        self.service.result_cache.set(index, fib_num)
+        return fib_num
+
+    def _run_in_pool(self, func, *args):
+        future = self._get_pool().submit(func, *args, self.cpu_time_budget)
+
+        try:
+            return future.result(timeout=self.timeout or None)
+        except FutureTimeoutError:
+            # A running computation stops by itself once it uses up its CPU-time budget
+            future.cancel()
+            logger.warning(f"Computation {func.__name__} timed out after {self.timeout}s.")
+            raise ComputationUnavailableApiException()
+        except ComputationBudgetExceeded:
+            logger.warning(f"Computation {func.__name__} exceeded its CPU-time budget.")
+            raise ComputationUnavailableApiException()
+        except BrokenProcessPool:
+            logger.error("The computation process pool is broken and will be recreated.")
+            self._reset_pool()
+            raise ComputationUnavailableApiException()
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        with cls._pool_lock:
+            if cls._pool is None:
+                # Spawned workers start clean, without inherited database connections or locks
+                cls._pool = ProcessPoolExecutor(
+                    max_workers=cls.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return cls._pool
+
+    @classmethod
+    def _reset_pool(cls):
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.shutdown(wait=False, cancel_futures=True)
+                cls._pool = None
@@ -0,0 +1,92 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from sequence_manager.fibonacci.utils.benchmarks import compare_with_baseline, run_benchmarks
+
+
+# Sizes small enough for a run of a few seconds, e.g. as a smoke test in CI
+QUICK_SCENARIOS = {
+    "fib_indexes": (1_000, 10_000),
+    "all_fib_indexes": (1_000,),
+    "page_depths": (1, 10),
+    "blacklist_sizes": (0, 1_000),
+    "json_indexes": (10_000,),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the hot paths of the service and prints the p50/p95 timings and memory peaks "
+        "of every scenario as JSON. The scenarios run against a temporary in-memory SQLite "
+        "database, start the command with DB_ENGINE=sqlite."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="The number of timed runs per scenario."
+        )
+        parser.add_argument(
+            "--quick", action="store_true", help="Run the scenarios with small sizes only."
+        )
+        parser.add_argument("--output", help="Write the results to this file instead of stdout.")
+        parser.add_argument("--baseline", help="Compare the results with this saved run.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="The relative slowdown reported as a regression (default: 0.2).",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error if any scenario regressed compared to the baseline.",
+        )
+
+    def handle(self, *args, repeat: int, quick: bool, baseline: str | None, **options):
+        if repeat < 1:
+            raise CommandError("The number of runs must be at least 1.")
+
+        baseline_results = self._load_baseline(baseline) if baseline else None
+
+        if connection.vendor != "sqlite":
+            raise CommandError(
+                "The benchmarks populate the database, start the command with DB_ENGINE=sqlite."
+            )
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            # Query logging of the debug mode would skew the timings and the memory peaks
+            with override_settings(DEBUG=False):
+                results = run_benchmarks(
+                    repeat=repeat,
+                    log=lambda name: self.stderr.write(f"Running {name}..."),
+                    **(QUICK_SCENARIOS if quick else {}),
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        if baseline_results is not None:
+            results["comparison"] = compare_with_baseline(
+                results, baseline_results, tolerance=options["tolerance"]
+            )
+
+        output = json.dumps(results, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+        regressions = results.get("comparison", {}).get("regressions")
+        if regressions and options["fail_on_regression"]:
+            raise CommandError(f"Regressed scenarios: {', '.join(regressions)}.")
+
+    def _load_baseline(self, path: str) -> dict:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read the baseline '{path}': {exc}")
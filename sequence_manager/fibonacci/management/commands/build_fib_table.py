@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from sequence_manager.fibonacci.utils.fib_table import FibonacciTable
+from sequence_manager.utils.constants import FIB_TABLE_PATH, FIB_TABLE_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds the memory-mapped table of precomputed Fibonacci numbers served by the API. "
+        "The table holds the values of the positions 1..N, so the endpoints need no computation "
+        "for them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=FIB_TABLE_SIZE,
+            help=f"The number of positions to precompute (default: {FIB_TABLE_SIZE}).",
+        )
+        parser.add_argument(
+            "--path",
+            default=FIB_TABLE_PATH,
+            help="The path of the table file (default: the FIB_TABLE_PATH setting).",
+        )
+
+    def handle(self, *args, size: int, path: str, **options):
+        if not path:
+            raise CommandError("No table path given, pass --path or set FIB_TABLE_PATH.")
+
+        if size < 2:
+            raise CommandError("The table size must be at least 2.")
+
+        file_size = FibonacciTable(path).build(size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fibonacci table of {size} positions written to '{path}' ({file_size} bytes)."
+            )
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def create_blacklist_version(apps, schema_editor):
+    BlacklistVersion = apps.get_model("fibonacci", "BlacklistVersion")
+    BlacklistVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fibonacci", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlacklistVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_blacklist_version, migrations.RunPython.noop),
+    ]
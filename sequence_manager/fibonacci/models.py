@@ -12,3 +12,20 @@ class BlacklistedFibonacciNumber(models.Model):
 
     def __str__(self):
         return str(self.number)
+
+
+class BlacklistVersion(models.Model):
+    """Holds the version of the blacklist.
+
+    The table contains a single row whose version is incremented every time the blacklist is
+    modified. Readers compare it with the version of their cached blacklist snapshot to find out
+    whether the snapshot has to be reloaded.
+    """
+
+    SINGLETON_ID = 1
+
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return str(self.version)
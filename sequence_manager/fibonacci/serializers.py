@@ -1,7 +1,100 @@
 from rest_framework import serializers
 
+from sequence_manager.fibonacci.utils.value_encodings import DECIMAL_ENCODING, VALUE_ENCODERS
+from sequence_manager.utils.constants import BLACKLIST_BULK_MAX_ITEMS, FIB_BATCH_MAX_ITEMS
+from sequence_manager.utils.metrics import timed_phase
 
-class FibonacciNumberSerializer(serializers.Serializer):
+
+class TimedSerializer(serializers.Serializer):
+    """Base serializer whose validation is reported as the `validate` phase of the request."""
+
+    def is_valid(self, *, raise_exception=False):
+        with timed_phase("validate"):
+            return super().is_valid(raise_exception=raise_exception)
+
+
+class FibonacciNumberSerializer(TimedSerializer):
     number = serializers.IntegerField(
         min_value=1, help_text="Must be a positive integer (1 or greater)."
     )
+
+
+class ValueEncodingSerializer(TimedSerializer):
+    value_encoding = serializers.ChoiceField(
+        choices=list(VALUE_ENCODERS),
+        default=DECIMAL_ENCODING,
+        help_text="Encoding of the values: decimal numbers, or hex or base64 strings.",
+    )
+
+
+class FibonacciNumberQuerySerializer(ValueEncodingSerializer):
+    mod = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=10**18,
+        help_text="Optional modulus, the value is returned as F(n) mod m.",
+    )
+    mode = serializers.ChoiceField(
+        choices=["exact", "approx"],
+        default="exact",
+        help_text="Set to 'approx' to only describe the digits of the value.",
+    )
+    significant_digits = serializers.IntegerField(
+        min_value=1,
+        max_value=100,
+        default=10,
+        help_text="Number of leading and trailing digits returned in the approx mode.",
+    )
+
+    def validate(self, attrs):
+        if attrs["mode"] == "approx" and attrs.get("mod") is not None:
+            raise serializers.ValidationError("'mod' cannot be combined with the approx mode.")
+        return attrs
+
+
+class FibonacciBatchSerializer(TimedSerializer):
+    numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=FIB_BATCH_MAX_ITEMS,
+        help_text="Positions in the Fibonacci sequence, each a positive integer.",
+    )
+
+
+class NumberRangeSerializer(TimedSerializer):
+    start = serializers.IntegerField(min_value=1, help_text="First number of the range.")
+    end = serializers.IntegerField(min_value=1, help_text="Last number (inclusive) of the range.")
+
+    def validate(self, attrs):
+        if attrs["end"] < attrs["start"]:
+            raise serializers.ValidationError("'end' must be greater than or equal to 'start'.")
+        return attrs
+
+
+class BlacklistBulkSerializer(TimedSerializer):
+    numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, default=list
+    )
+    ranges = NumberRangeSerializer(many=True, required=False, default=list)
+
+    def validate(self, attrs):
+        item_count = len(attrs["numbers"]) + sum(
+            item["end"] - item["start"] + 1 for item in attrs["ranges"]
+        )
+
+        if item_count == 0:
+            raise serializers.ValidationError("At least one number or range is required.")
+
+        if item_count > BLACKLIST_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"At most {BLACKLIST_BULK_MAX_ITEMS} numbers can be processed in one request."
+            )
+
+        return attrs
+
+    def get_numbers(self) -> list[int]:
+        """Returns the validated numbers followed by the expanded ranges, without duplicates."""
+        numbers = list(self.validated_data["numbers"])
+        for item in self.validated_data["ranges"]:
+            numbers.extend(range(item["start"], item["end"] + 1))
+        return list(dict.fromkeys(numbers))
@@ -1,14 +1,135 @@
-from django.db import IntegrityError
+import decimal
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
 
-from sequence_manager.fibonacci.models import BlacklistedFibonacciNumber
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from sequence_manager.fibonacci.models import BlacklistedFibonacciNumber, BlacklistVersion
 from sequence_manager.fibonacci.utils.api_exceptions import (
     BlacklistConflictApiException,
     BlacklistNotFoundApiException,
 )
+from sequence_manager.fibonacci.utils.blacklist_cache import (
+    BlacklistSnapshot,
+    BlacklistSnapshotCache,
+    BlacklistVersionStateCache,
+)
+from sequence_manager.fibonacci.utils.blacklist_index import BlacklistIndex
+from sequence_manager.fibonacci.utils.blacklist_store import BlacklistArrayStore
+from sequence_manager.fibonacci.utils.engines import (
+    APPROX_EXACT_INDEX_LIMIT,
+    FIB_PAIR_ENGINES,
+    fib_log10,
+    fib_numbers_walk,
+    fib_pair_mod,
+    get_pisano_period_multiple,
+)
+from sequence_manager.fibonacci.utils.fib_table import FibonacciTable
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+from sequence_manager.fibonacci.utils.single_flight import SingleFlight
+from sequence_manager.utils.constants import (
+    BLACKLIST_BULK_BATCH_SIZE,
+    BLACKLIST_STORE_PATH,
+    BLACKLIST_VERSION_CHECK_INTERVAL,
+    FIB_COALESCE_THRESHOLD,
+    FIB_ENGINE,
+    FIB_RESULT_CACHE_BYTES,
+    FIB_TABLE_PATH,
+)
+from sequence_manager.utils.metrics import registry, timed_phase
+
+logger = logging.getLogger(__name__)
+
+# Blacklist version state shared by the reads of the current request, see
+# `BlacklistService.pin_version_state`
+_pinned_version_state: ContextVar[tuple[int, datetime | None] | None] = ContextVar(
+    "pinned_blacklist_version_state", default=None
+)
 
 
 class FibonacciSequenceService:
-    """Service class for calculating Fibonacci numbers."""
+    """Service class for calculating Fibonacci numbers.
+
+    Single values are computed by a pluggable engine (see `FIB_PAIR_ENGINES`). The default
+    `fast_doubling` engine needs O(log n) multiplications, while the `iterative` engine walks the
+    sequence step by step and is kept as a reference implementation.
+
+    Concurrent computations for the same index at or above `coalesce_threshold` are coalesced by
+    the process-wide `single_flight`, so a popular large index is computed once for all the
+    requests waiting for it. The same instance coalesces identical list windows and pool
+    computations (see `FibonacciNumberSequence` and `FibonacciComputationExecutor`).
+
+    Single values are memoised by the process-wide `result_cache`, which evicts the least recently
+    used values once their total size exceeds `FIB_RESULT_CACHE_BYTES`.
+
+    When `FIB_TABLE_PATH` is set, values covered by the precomputed table built with
+    `manage.py build_fib_table` are read from that memory-mapped file instead of being computed.
+    """
+
+    single_flight = SingleFlight()
+    result_cache = ByteBudgetLRUCache(FIB_RESULT_CACHE_BYTES)
+    table = FibonacciTable(FIB_TABLE_PATH) if FIB_TABLE_PATH else None
+    coalesce_threshold: int = FIB_COALESCE_THRESHOLD
+
+    def __init__(self, engine: str = FIB_ENGINE):
+        """Initializes the service with the given calculation engine.
+
+        Args:
+            engine (str, optional): The name of the engine used for single values. Defaults to the
+                `FIB_ENGINE` setting.
+
+        Raises:
+            ValueError: If the engine name is unknown.
+        """
+        if engine not in FIB_PAIR_ENGINES:
+            raise ValueError(f"Unknown Fibonacci engine '{engine}'.")
+
+        self.engine = engine
+        self._fib_pair = FIB_PAIR_ENGINES[engine]
+
+    def get_fib_pair(self, index: int) -> tuple[int, int]:
+        """Returns the pair of consecutive Fibonacci numbers starting at the given index.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            tuple[int, int]: The Fibonacci numbers at positions `index` and `index + 1`.
+
+        Raises:
+            ValueError: If the input index is negative.
+        """
+        if index < 0:
+            raise ValueError("The 'index' argument cannot be negative.")
+
+        fib_pair = self.get_known_fib_pair(index)
+        if fib_pair is not None:
+            return fib_pair
+
+        if self.is_coalesced(index):
+            return self.single_flight.do(("pair", self.engine, index), self._fib_pair, index)
+
+        return self._fib_pair(index)
+
+    def get_known_fib_pair(self, index: int) -> tuple[int, int] | None:
+        """Returns the pair starting at the given index if it does not need to be computed.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            tuple[int, int] | None: The pair read from the precomputed table, or None.
+        """
+        if self.table is None:
+            return None
+
+        return self.table.get_fib_pair(index)
 
     def get_fib_number(self, index: int) -> int:
         """Returns the Fibonacci number at the given index.
@@ -22,16 +143,159 @@ class FibonacciSequenceService:
         Raises:
             ValueError: If the input index is negative.
         """
+        fib_num = self.get_known_fib_number(index)
+        if fib_num is None:
+            fib_num = self.get_fib_pair(index)[0]
+            self.result_cache.set(index, fib_num)
+        return fib_num
+
+    def get_known_fib_number(self, index: int) -> int | None:
+        """Returns the Fibonacci number at the given index if it does not need to be computed.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            int | None: The value read from the precomputed table or the result cache, or None.
+        """
+        if self.table is not None:
+            fib_num = self.table.get_fib_number(index)
+            if fib_num is not None:
+                return fib_num
+
+        return self.result_cache.get(index)
+
+    @timed_phase("compute")
+    def get_fib_number_mod(self, index: int, modulus: int, reduce_period: bool = True) -> int:
+        """Returns the Fibonacci number at the given index modulo `modulus`.
+
+        The residue is computed with modular fast doubling, so only O(log n) operations on ints
+        below the modulus squared are needed, whatever the size of F(index). With
+        `reduce_period`, indexes larger than the Pisano period of the modulus are first reduced
+        modulo a multiple of that period.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+            modulus (int): The modulus, a positive integer.
+            reduce_period (bool, optional): Whether to reduce the index by the Pisano period.
+                Defaults to True.
+
+        Returns:
+            int: F(index) mod `modulus`.
+
+        Raises:
+            ValueError: If the index is negative or the modulus is not positive.
+        """
         if index < 0:
             raise ValueError("The 'index' argument cannot be negative.")
 
-        if index <= 1:
-            return index
+        if modulus < 1:
+            raise ValueError("The 'modulus' argument must be a positive integer.")
 
-        prev2, prev1 = 0, 1
-        for _ in range(2, index + 1):
-            prev2, prev1 = prev1, prev1 + prev2
-        return prev1
+        # The Pisano period never exceeds 6 * m, so smaller indexes cannot be reduced
+        if reduce_period and index > 6 * modulus:
+            period = get_pisano_period_multiple(modulus)
+            if period is not None:
+                index %= period
+
+        return fib_pair_mod(index, modulus)[0]
+
+    @timed_phase("compute")
+    def get_fib_number_approx(self, index: int, significant_digits: int = 10) -> dict:
+        """Describes the Fibonacci number at the given index without computing it in full.
+
+        The digit count and the leading digits are derived from log10(F(n)) given by Binet's
+        formula, and the trailing digits from F(n) mod 10^k, so the cost does not depend on the
+        size of F(index). Small indexes, for which the formula is not accurate, are computed
+        exactly.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+            significant_digits (int, optional): The number k of leading and trailing digits to
+                return. Defaults to 10.
+
+        Returns:
+            dict: The number of decimal digits (`digit_count`), the k leading digits
+                (`leading_digits`, truncated), the k trailing digits (`trailing_digits`) and the
+                value in scientific notation (`scientific`, e.g. "4.346655768e208"), where the
+                digits are strings.
+
+        Raises:
+            ValueError: If the index is negative or `significant_digits` is not positive.
+        """
+        if index < 0:
+            raise ValueError("The 'index' argument cannot be negative.")
+
+        if significant_digits < 1:
+            raise ValueError("The 'significant_digits' argument must be a positive integer.")
+
+        if index < APPROX_EXACT_INDEX_LIMIT:
+            digits = str(self.get_fib_number(index))
+            exponent = len(digits) - 1
+            leading_digits = digits[:significant_digits]
+        else:
+            precision = len(str(index)) + significant_digits + 10
+            log10 = fib_log10(index, precision)
+            exponent = int(log10)
+            mantissa = decimal.Context(prec=precision).power(10, log10 - exponent)
+            leading_digits = str(int(mantissa.scaleb(significant_digits - 1)))[:significant_digits]
+
+        digit_count = exponent + 1
+        trailing_count = min(significant_digits, digit_count)
+        trailing_digits = str(self.get_fib_number_mod(index, 10**trailing_count))
+
+        mantissa_digits = leading_digits.rstrip("0") or "0"
+        if len(mantissa_digits) > 1:
+            mantissa_digits = f"{mantissa_digits[0]}.{mantissa_digits[1:]}"
+
+        return {
+            "digit_count": digit_count,
+            "leading_digits": leading_digits,
+            "trailing_digits": trailing_digits.zfill(trailing_count),
+            "scientific": f"{mantissa_digits}e{exponent}",
+        }
+
+    def get_fib_numbers(self, indexes: Iterable[int]) -> dict[int, int]:
+        """Returns the Fibonacci numbers at many arbitrary indexes.
+
+        The indexes are visited in ascending order. Close indexes are reached by stepping forward
+        from the previous one, while distant ones are reached with a fast jump, so the cost does
+        not depend on the order of the input or on the largest gap.
+
+        Args:
+            indexes (Iterable[int]): The indexes in the Fibonacci sequence (0-based).
+
+        Returns:
+            dict[int, int]: Maps every distinct index to its Fibonacci number.
+
+        Raises:
+            ValueError: If any of the indexes is negative.
+        """
+        indexes = list(indexes)
+        if indexes and min(indexes) < 0:
+            raise ValueError("The 'index' argument cannot be negative.")
+
+        return fib_numbers_walk(indexes, engine=self.engine)
+
+    def is_coalesced(self, index: int) -> bool:
+        """Returns whether concurrent computations around the given index are coalesced."""
+        return index >= self.coalesce_threshold
+
+    def get_coalescing_stats(self) -> dict:
+        """Returns the counters of the process-wide single-flight coalescing.
+
+        Returns:
+            dict: The number of calls, actual executions, coalesced calls and in-flight executions.
+        """
+        return self.single_flight.get_stats()
+
+    def get_cache_stats(self) -> dict:
+        """Returns the counters and the memory usage of the process-wide result cache.
+
+        Returns:
+            dict: The hit ratio and the resident bytes of the cache, among other counters.
+        """
+        return self.result_cache.get_stats()
 
     def get_all_fib_numbers(self, index: int) -> list[int]:
         """Returns a list of Fibonacci numbers up to the given index.
@@ -58,7 +322,23 @@ class FibonacciSequenceService:
 
 
 class BlacklistService:
-    """Service for managing blacklisted Fibonacci numbers."""
+    """Service for managing blacklisted Fibonacci numbers.
+
+    Reads are served from a process-wide snapshot of the blacklist which is only reloaded when the
+    blacklist version stored in the database changes. Every modification of the blacklist bumps
+    that version in the same transaction.
+
+    When `BLACKLIST_STORE_PATH` is set, the blacklist is additionally published to a memory-mapped
+    sorted array file after every modification. Reads are then served from that file, which is
+    shared by all worker processes of the host, and only check the database version, at most once
+    per `BLACKLIST_VERSION_CHECK_INTERVAL`, to publish the file again when it is behind.
+    """
+
+    snapshot_cache = BlacklistSnapshotCache(version_check_interval=BLACKLIST_VERSION_CHECK_INTERVAL)
+    version_state_cache = BlacklistVersionStateCache(
+        version_check_interval=BLACKLIST_VERSION_CHECK_INTERVAL
+    )
+    store = BlacklistArrayStore(BLACKLIST_STORE_PATH) if BLACKLIST_STORE_PATH else None
 
     def add_to_blacklist(self, number: int):
         """Adds a Fibonacci number to the blacklist.
@@ -71,11 +351,16 @@ class BlacklistService:
             APIException: For any unexpected errors during the operation.
         """
         try:
-            BlacklistedFibonacciNumber.objects.create(number=number)
+            with transaction.atomic():
+                BlacklistedFibonacciNumber.objects.create(number=number)
+                self._bump_version()
+                transaction.on_commit(self.publish_store)
         except IntegrityError:
             # Handle the case where there is a constraint violation (e.g. uniqueness)
             raise BlacklistConflictApiException()
 
+        self._invalidate_caches()
+
     def remove_from_blacklist(self, number: int):
         """Removes a Fibonacci number from the blacklist.
 
@@ -87,11 +372,81 @@ class BlacklistService:
             APIException: For any unexpected errors during the operation.
         """
         try:
-            obj = BlacklistedFibonacciNumber.objects.get(number=number)
-            obj.delete()
+            with transaction.atomic():
+                obj = BlacklistedFibonacciNumber.objects.get(number=number)
+                obj.delete()
+                self._bump_version()
+                transaction.on_commit(self.publish_store)
         except BlacklistedFibonacciNumber.DoesNotExist:
             raise BlacklistNotFoundApiException()
 
+        self._invalidate_caches()
+
+    def add_many_to_blacklist(self, numbers: Iterable[int]) -> dict[int, bool]:
+        """Adds several Fibonacci numbers to the blacklist in a single transaction.
+
+        Numbers that are already blacklisted are skipped instead of failing the whole operation,
+        and the blacklist version is bumped only once.
+
+        Args:
+            numbers (Iterable[int]): The Fibonacci numbers to blacklist.
+
+        Returns:
+            dict[int, bool]: Maps every number, in input order, to True if it has been added and
+                to False if it was already blacklisted.
+        """
+        numbers = list(dict.fromkeys(numbers))
+
+        with transaction.atomic():
+            existing = self._filter_blacklisted(numbers)
+            new_objs = [
+                BlacklistedFibonacciNumber(number=number)
+                for number in numbers
+                if number not in existing
+            ]
+            BlacklistedFibonacciNumber.objects.bulk_create(
+                new_objs, batch_size=BLACKLIST_BULK_BATCH_SIZE, ignore_conflicts=True
+            )
+            if new_objs:
+                self._bump_version()
+                transaction.on_commit(self.publish_store)
+
+        if new_objs:
+            self._invalidate_caches()
+
+        return {number: number not in existing for number in numbers}
+
+    def remove_many_from_blacklist(self, numbers: Iterable[int]) -> dict[int, bool]:
+        """Removes several Fibonacci numbers from the blacklist in a single transaction.
+
+        Numbers that are not blacklisted are skipped instead of failing the whole operation, and
+        the blacklist version is bumped only once.
+
+        Args:
+            numbers (Iterable[int]): The Fibonacci numbers to remove.
+
+        Returns:
+            dict[int, bool]: Maps every number, in input order, to True if it has been removed and
+                to False if it was not found in the blacklist.
+        """
+        numbers = list(dict.fromkeys(numbers))
+
+        with transaction.atomic():
+            existing = self._filter_blacklisted(numbers)
+            sorted_existing = sorted(existing)
+            for idx in range(0, len(sorted_existing), BLACKLIST_BULK_BATCH_SIZE):
+                batch = sorted_existing[idx : idx + BLACKLIST_BULK_BATCH_SIZE]
+                BlacklistedFibonacciNumber.objects.filter(number__in=batch).delete()
+            if existing:
+                self._bump_version()
+                transaction.on_commit(self.publish_store)
+
+        if existing:
+            self._invalidate_caches()
+
+        return {number: number in existing for number in numbers}
+
+    @timed_phase("blacklist")
     def is_blacklisted(self, number: int) -> bool:
         """Checks whether a given Fibonacci number is blacklisted.
 
@@ -101,12 +456,344 @@ class BlacklistService:
         Returns:
             bool: True if the number is blacklisted, False otherwise.
         """
-        return BlacklistedFibonacciNumber.objects.filter(number=number).exists()
+        store = self._get_store()
+        if store is not None:
+            return store.contains(number)
+
+        return number in self.get_snapshot().numbers
 
-    def get_blacklisted_numbers(self) -> list[int]:
+    @timed_phase("blacklist")
+    def get_blacklisted_numbers(self) -> frozenset[int]:
         """Retrieves all blacklisted Fibonacci numbers in a set.
 
         Returns:
-            set[int]: A set of all blacklisted Fibonacci numbers.
+            frozenset[int]: A set of all blacklisted Fibonacci numbers.
+        """
+        return self.get_snapshot().numbers
+
+    @timed_phase("blacklist")
+    def get_blacklist_index(self) -> BlacklistIndex:
+        """Returns an index over the sorted blacklisted Fibonacci numbers.
+
+        Returns:
+            BlacklistIndex: An index answering membership and pagination queries in O(log b).
         """
-        return set(BlacklistedFibonacciNumber.objects.values_list("number", flat=True))
+        return self.get_snapshot().index
+
+    def get_version(self) -> int:
+        """Retrieves the current version of the blacklist from the database.
+
+        Returns:
+            int: The blacklist version, 0 if the blacklist has never been modified.
+        """
+        version = (
+            BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return version or 0
+
+    @timed_phase("blacklist")
+    def get_version_state(self) -> tuple[int, datetime | None]:
+        """Retrieves the current version of the blacklist and the time it was last modified.
+
+        Within `pin_version_state`, the pinned state is returned without querying the database.
+
+        Returns:
+            tuple[int, datetime | None]: The blacklist version and its modification time, or 0 and
+                None if the blacklist has never been modified.
+        """
+        pinned_state = _pinned_version_state.get()
+        if pinned_state is not None:
+            return pinned_state
+
+        state = (
+            BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID)
+            .values_list("version", "updated_at")
+            .first()
+        )
+        return state or (0, None)
+
+    def get_snapshot(self) -> BlacklistSnapshot:
+        """Returns the cached blacklist snapshot, reloading it only if the version has changed.
+
+        Returns:
+            BlacklistSnapshot: The blacklist snapshot matching the current version.
+        """
+        store = self._get_store()
+        if store is not None:
+            return self.snapshot_cache.get(lambda: (store.get_version(), None), store.iter_numbers)
+
+        return self.snapshot_cache.get(self.get_version_state, self._load_blacklisted_numbers)
+
+    @contextmanager
+    def pin_version_state(self) -> Iterator[tuple[int, datetime | None]]:
+        """Serves all version checks of the block, in the current context, from one state.
+
+        A request pinning the version state reads it once, however many blacklist reads it makes,
+        and its validators (ETag and Last-Modified) match the version of the blacklist it is
+        served from. Without the array store, the state is the one of the cached snapshot. With
+        it, the file is first brought up to date with the database version, read at most once
+        per `BLACKLIST_VERSION_CHECK_INTERVAL`, and the state is the version of the file, so no
+        snapshot is built and a stale file can never be tagged with a newer version. A file
+        replaced while the request runs can only make the items newer than their tag, which a
+        later revalidation corrects.
+
+        Yields:
+            tuple[int, datetime | None]: The blacklist version and its modification time, None if
+                unknown.
+        """
+        with timed_phase("blacklist"):
+            store = None
+            if self.store is not None:
+                version, updated_at = self.version_state_cache.get(self.get_version_state)
+                store = self._get_store(version)
+            if store is not None:
+                store_version = store.get_version()
+                state = (store_version, updated_at if store_version == version else None)
+            else:
+                snapshot = self.get_snapshot()
+                state = (snapshot.version, snapshot.updated_at)
+
+        token = _pinned_version_state.set(state)
+        try:
+            yield state
+        finally:
+            _pinned_version_state.reset(token)
+
+    def get_cache_stats(self) -> dict:
+        """Returns the hit, miss and reload counters of the blacklist snapshot cache.
+
+        Returns:
+            dict: The cache counters together with the cached version and its size.
+        """
+        return self.snapshot_cache.get_stats()
+
+    async def aadd_to_blacklist(self, number: int):
+        """Async version of `add_to_blacklist`.
+
+        The insert and the version bump have to share a transaction, which the async ORM does not
+        support yet, so the write runs in the thread dedicated to synchronous database access.
+        """
+        await sync_to_async(self.add_to_blacklist)(number)
+
+    async def aremove_from_blacklist(self, number: int):
+        """Async version of `remove_from_blacklist`, see `aadd_to_blacklist`."""
+        await sync_to_async(self.remove_from_blacklist)(number)
+
+    async def ais_blacklisted(self, number: int) -> bool:
+        """Async version of `is_blacklisted` using the async ORM."""
+        store = await self._aget_store()
+        if store is not None:
+            return store.contains(number)
+
+        return number in (await self.aget_snapshot()).numbers
+
+    async def aget_blacklist_index(self) -> BlacklistIndex:
+        """Async version of `get_blacklist_index` using the async ORM."""
+        return (await self.aget_snapshot()).index
+
+    async def aget_version(self) -> int:
+        """Async version of `get_version` using the async ORM."""
+        version = (
+            await BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID)
+            .values_list("version", flat=True)
+            .afirst()
+        )
+        return version or 0
+
+    async def aget_version_state(self) -> tuple[int, datetime | None]:
+        """Async version of `get_version_state` using the async ORM."""
+        state = (
+            await BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID)
+            .values_list("version", "updated_at")
+            .afirst()
+        )
+        return state or (0, None)
+
+    async def aget_snapshot(self) -> BlacklistSnapshot:
+        """Async version of `get_snapshot` using the async ORM."""
+        store = await self._aget_store()
+        if store is not None:
+            return self.snapshot_cache.get(lambda: (store.get_version(), None), store.iter_numbers)
+
+        return await self.snapshot_cache.aget(
+            self.aget_version_state, self._aload_blacklisted_numbers
+        )
+
+    def publish_store(self):
+        """Rebuilds the shared array file from the database, if the array store is enabled."""
+        if self.store is not None:
+            self.store.publish(self._load_versioned_blacklisted_numbers)
+
+    def _get_store(self, version: int | None = None) -> BlacklistArrayStore | None:
+        """Returns the array store if it is enabled and not behind the database.
+
+        The file is published when missing, and published again when its version is behind the
+        database one, e.g. after a write made on a host which does not share the file, a direct
+        database change or a failed publish. If the file cannot be brought up to date, None is
+        returned so that the reads fall back to the snapshot cache.
+
+        Args:
+            version (int | None, optional): The database version, read from the pinned or cached
+                version state if not given. Defaults to None.
+        """
+        if self.store is None:
+            return None
+
+        if version is None:
+            version, _ = _pinned_version_state.get() or self.version_state_cache.get(
+                self.get_version_state
+            )
+        if self.store.exists() and self.store.get_version() >= version:
+            return self.store
+
+        try:
+            self.publish_store()
+        except Exception:
+            logger.exception(
+                f"The blacklist array store '{self.store.path}' could not be published."
+            )
+            return None
+        return self.store
+
+    async def _aget_store(self) -> BlacklistArrayStore | None:
+        """Async version of `_get_store`."""
+        if self.store is None:
+            return None
+
+        version, _ = await self.version_state_cache.aget(self.aget_version_state)
+        if self.store.exists() and self.store.get_version() >= version:
+            return self.store
+
+        try:
+            await sync_to_async(self.publish_store)()
+        except Exception:
+            logger.exception(
+                f"The blacklist array store '{self.store.path}' could not be published."
+            )
+            return None
+        return self.store
+
+    def _invalidate_caches(self):
+        """Drops the cached blacklist and version state after a local modification."""
+        self.snapshot_cache.invalidate()
+        self.version_state_cache.invalidate()
+
+    def _filter_blacklisted(self, numbers: list[int]) -> set[int]:
+        """Returns the subset of the given numbers stored in the blacklist table."""
+        existing = set()
+        for idx in range(0, len(numbers), BLACKLIST_BULK_BATCH_SIZE):
+            batch = numbers[idx : idx + BLACKLIST_BULK_BATCH_SIZE]
+            existing.update(
+                BlacklistedFibonacciNumber.objects.filter(number__in=batch).values_list(
+                    "number", flat=True
+                )
+            )
+        return existing
+
+    def _load_blacklisted_numbers(self) -> list[int]:
+        return list(BlacklistedFibonacciNumber.objects.values_list("number", flat=True))
+
+    async def _aload_blacklisted_numbers(self) -> list[int]:
+        queryset = BlacklistedFibonacciNumber.objects.values_list("number", flat=True)
+        return [number async for number in queryset]
+
+    def _load_versioned_blacklisted_numbers(self) -> tuple[int, list[int]]:
+        with transaction.atomic():
+            return self.get_version(), self._load_blacklisted_numbers()
+
+    def _bump_version(self):
+        """Increments the blacklist version, must be called within the modifying transaction."""
+        updated = BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID).update(
+            version=F("version") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            BlacklistVersion.objects.create(pk=BlacklistVersion.SINGLETON_ID, version=1)
+
+
+def _stats_callback(get_stats: Callable[[], dict], keys: dict[tuple[str, ...], str]):
+    """Returns a metric callback reading the given keys of a stats dict when metrics are rendered.
+
+    Args:
+        get_stats (Callable[[], dict]): Returns the stats, e.g. `ResultCache.get_stats`.
+        keys (dict[tuple[str, ...], str]): The stats key of every label values tuple.
+    """
+
+    def callback():
+        stats = get_stats()
+        return [(label_values, stats[key] or 0) for label_values, key in keys.items()]
+
+    return callback
+
+
+# The stats are read from the class attributes at render time, so replaced caches are reported
+# and the hot paths of the caches do not update any metric
+def _result_cache_stats() -> dict:
+    return FibonacciSequenceService.result_cache.get_stats()
+
+
+def _single_flight_stats() -> dict:
+    return FibonacciSequenceService.single_flight.get_stats()
+
+
+def _snapshot_cache_stats() -> dict:
+    return BlacklistService.snapshot_cache.get_stats()
+
+
+registry.callback(
+    "fib_result_cache_lookups_total",
+    "Lookups of the Fibonacci result cache by result.",
+    _stats_callback(_result_cache_stats, {("hit",): "hits", ("miss",): "misses"}),
+    ("result",),
+    type_name="counter",
+)
+registry.callback(
+    "fib_result_cache_evictions_total",
+    "Values evicted from the Fibonacci result cache.",
+    _stats_callback(_result_cache_stats, {(): "evictions"}),
+    type_name="counter",
+)
+registry.callback(
+    "fib_result_cache_entries",
+    "Values held by the Fibonacci result cache.",
+    _stats_callback(_result_cache_stats, {(): "entries"}),
+)
+registry.callback(
+    "fib_result_cache_bytes",
+    "Bytes held by the Fibonacci result cache, and its limit.",
+    _stats_callback(_result_cache_stats, {("resident",): "resident_bytes", ("max",): "max_bytes"}),
+    ("kind",),
+)
+registry.callback(
+    "fib_coalescing_calls_total",
+    "Coalesced Fibonacci computations by outcome.",
+    _stats_callback(
+        _single_flight_stats, {("executed",): "executions", ("coalesced",): "coalesced"}
+    ),
+    ("outcome",),
+    type_name="counter",
+)
+registry.callback(
+    "fib_coalescing_in_flight",
+    "Fibonacci computations currently in flight.",
+    _stats_callback(_single_flight_stats, {(): "in_flight"}),
+)
+registry.callback(
+    "blacklist_snapshot_lookups_total",
+    "Reads of the cached blacklist snapshot by result.",
+    _stats_callback(_snapshot_cache_stats, {("hit",): "hits", ("miss",): "misses"}),
+    ("result",),
+    type_name="counter",
+)
+registry.callback(
+    "blacklist_snapshot_reloads_total",
+    "Reloads of the blacklist snapshot after a version change.",
+    _stats_callback(_snapshot_cache_stats, {(): "reloads"}),
+    type_name="counter",
+)
+registry.callback(
+    "blacklist_snapshot_size",
+    "Blacklisted numbers in the cached blacklist snapshot.",
+    _stats_callback(_snapshot_cache_stats, {(): "size"}),
+)
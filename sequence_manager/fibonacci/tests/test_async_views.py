@@ -0,0 +1,142 @@
+import logging
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import BlacklistService
+
+
+class AsyncFibonacciNumberViewTests(TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    async def test_get_fib_number_success(self):
+        """Test getting fibonacci number for a valid input."""
+        response = await self.async_client.get(reverse("async-fibonacci-number", args=[8]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertDictEqual(response_data["data"], {"number": 8, "value": 13})
+
+    async def test_get_fib_number_mod(self):
+        """Test getting the residue of a fibonacci number for a given modulus."""
+        response = await self.async_client.get(
+            reverse("async-fibonacci-number", args=[1000]), {"mod": 1000}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json()["data"], {"number": 1000, "modulus": 1000, "value": 626}
+        )
+
+    async def test_get_fib_number_validation_error(self):
+        """Test getting fibonacci number for an invalid input."""
+        response = await self.async_client.get(reverse("async-fibonacci-number", args=[0]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["number"][0],
+            "Ensure this value is greater than or equal to 1.",
+        )
+
+    async def test_get_blacklisted_fib_number(self):
+        """Test getting fibonacci number that has been blacklisted."""
+        response = await self.async_client.post(reverse("async-manage-blacklist", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = await self.async_client.get(reverse("async-fibonacci-number", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.json()["error"], "This number is blacklisted and cannot be used.")
+
+
+class AsyncFibonacciNumberListViewTests(TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    async def test_get_fib_list_with_blacklisted_number(self):
+        """Test blacklisted numbers are excluded from an async list page."""
+        await BlacklistService().aadd_to_blacklist(2)
+
+        response = await self.async_client.get(
+            reverse("async-fibonacci-list", args=[10]), {"page_size": 3, "page": 2}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertEqual(response_data["data"]["count"], 9)
+        self.assertListEqual(
+            response_data["data"]["results"],
+            [{"number": 5, "value": 3}, {"number": 6, "value": 5}, {"number": 7, "value": 8}],
+        )
+
+    async def test_get_fib_range(self):
+        """Test retrieving a range through the async view."""
+        response = await self.async_client.get(reverse("async-fibonacci-range", args=[10, 11]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(
+            response.json()["data"]["results"],
+            [{"number": 10, "value": 34}, {"number": 11, "value": 55}],
+        )
+
+    async def test_get_fib_range_result_size_budget(self):
+        """Test async ranges beyond the result-size budgets are rejected within the envelope."""
+        url = reverse("async-fibonacci-range", args=[20_000, 20_001])
+        for budget in ({"max_result_bytes": 1024}, {"max_result_digits": 1000}):
+            with mock.patch.multiple(FibonacciComputationExecutor, **budget):
+                response = await self.async_client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            self.assertEqual(
+                response.json()["error"],
+                "The requested Fibonacci number exceeds the allowed result size.",
+            )
+
+    async def test_get_fib_range_result_size_budget_applies_to_the_page(self):
+        """Test a long async range is paginated as long as the values of the page fit."""
+        url = reverse("async-fibonacci-range", args=[1, 20_000_000])
+        response = await self.async_client.get(url, {"page_size": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(
+            [item["value"] for item in response.json()["data"]["results"]], [0, 1, 1]
+        )
+
+
+class AsyncBlacklistNumberViewTests(TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    async def test_blacklist_already_existing_fib_number(self):
+        """Test adding the same fibonacci number into the blacklist twice."""
+        response = await self.async_client.post(reverse("async-manage-blacklist", args=[13]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = await self.async_client.post(reverse("async-manage-blacklist", args=[13]))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.json()["error"], "This Fibonacci number is already blacklisted.")
+
+    async def test_removing_fib_number(self):
+        """Test removing a blacklisted number and then a number that is not blacklisted."""
+        await BlacklistService().aadd_to_blacklist(13)
+
+        response = await self.async_client.delete(reverse("async-manage-blacklist", args=[13]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(await BlacklistService().ais_blacklisted(13))
+
+        response = await self.async_client.delete(reverse("async-manage-blacklist", args=[13]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json()["error"], "This number is not found in the blacklist.")
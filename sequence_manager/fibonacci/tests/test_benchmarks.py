@@ -0,0 +1,110 @@
+import logging
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from sequence_manager.fibonacci.services import BlacklistService
+from sequence_manager.fibonacci.utils.benchmarks import (
+    compare_with_baseline,
+    get_percentile,
+    measure,
+    run_benchmarks,
+)
+
+
+class BenchmarkUtilsTests(SimpleTestCase):
+
+    def test_get_percentile(self):
+        """Test the nearest-rank percentiles of sorted samples."""
+        samples = [float(value) for value in range(1, 21)]
+        self.assertEqual(get_percentile(samples, 50), 10.0)
+        self.assertEqual(get_percentile(samples, 95), 19.0)
+        self.assertEqual(get_percentile(samples, 100), 20.0)
+        self.assertEqual(get_percentile([3.0], 95), 3.0)
+
+    def test_measure_runs_setup_before_every_run(self):
+        """Test a scenario is run once traced plus the requested number of timed runs."""
+        func = mock.Mock(side_effect=lambda: bytearray(100_000))
+        setup = mock.Mock()
+
+        result = measure("scenario", func, repeat=5, setup=setup)
+
+        self.assertEqual(func.call_count, 6)
+        self.assertEqual(setup.call_count, 6)
+        self.assertEqual(result.samples, 5)
+        self.assertLessEqual(result.min_ms, result.p50_ms)
+        self.assertLessEqual(result.p50_ms, result.p95_ms)
+        self.assertLessEqual(result.p95_ms, result.max_ms)
+        self.assertGreaterEqual(result.peak_memory_bytes, 100_000)
+
+    def test_compare_with_baseline(self):
+        """Test scenarios slower than the baseline beyond the tolerance are reported."""
+        baseline = {
+            "scenarios": {
+                "fast": {"p50_ms": 1.0, "p95_ms": 2.0, "peak_memory_bytes": 100},
+                "slow": {"p50_ms": 1.0, "p95_ms": 2.0, "peak_memory_bytes": 100},
+            }
+        }
+        results = {
+            "scenarios": {
+                "fast": {"p50_ms": 1.1, "p95_ms": 1.5, "peak_memory_bytes": 100},
+                "slow": {"p50_ms": 1.5, "p95_ms": 2.0, "peak_memory_bytes": 100},
+                "new": {"p50_ms": 1.0, "p95_ms": 1.0, "peak_memory_bytes": 0},
+            }
+        }
+
+        comparison = compare_with_baseline(results, baseline, tolerance=0.2)
+
+        self.assertListEqual(comparison["regressions"], ["slow"])
+        self.assertDictEqual(
+            comparison["ratios"]["fast"], {"p50_ms": 1.1, "p95_ms": 0.75, "peak_memory_bytes": 1.0}
+        )
+        self.assertNotIn("new", comparison["ratios"])
+
+    def test_bench_command_rejects_unreadable_baseline(self):
+        """Test the command fails before running when the baseline cannot be read."""
+        with self.assertRaises(CommandError):
+            call_command("bench", baseline="/nonexistent/baseline.json")
+
+
+class RunBenchmarksTests(TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        BlacklistService.snapshot_cache.clear()
+
+    def test_run_benchmarks(self):
+        """Test every scenario is reported and the blacklists are populated."""
+        results = run_benchmarks(
+            repeat=2,
+            fib_indexes=(100,),
+            all_fib_indexes=(100,),
+            page_depths=(1, 2),
+            blacklist_sizes=(0, 50),
+            json_indexes=(20_000,),
+            page_size=10,
+        )
+
+        self.assertListEqual(
+            list(results["scenarios"]),
+            [
+                "get_fib_number[100]",
+                "get_all_fib_numbers[100]",
+                "list_page[page=1]",
+                "list_page[page=2]",
+                "blacklist_lookup[size=0]",
+                "blacklist_reload[size=0]",
+                "list_page[blacklist=0]",
+                "blacklist_lookup[size=50]",
+                "blacklist_reload[size=50]",
+                "list_page[blacklist=50]",
+                "render_json[20000]",
+            ],
+        )
+        self.assertEqual(results["environment"]["repeat"], 2)
+        self.assertEqual(results["scenarios"]["list_page[page=2]"]["samples"], 2)
+        self.assertEqual(len(BlacklistService().get_blacklisted_numbers()), 50)
@@ -0,0 +1,142 @@
+import logging
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.models import BlacklistedFibonacciNumber
+from sequence_manager.fibonacci.services import BlacklistService
+
+
+class BlacklistBulkViewPostMethodTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_bulk_blacklist_success(self):
+        """Test adding numbers and ranges reports an outcome for every number."""
+        response = self.client.post(reverse("manage-blacklist", args=[5]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = {"numbers": [13, 5, 13], "ranges": [{"start": 20, "end": 22}]}
+        response = self.client.post(reverse("manage-blacklist-bulk"), data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertDictEqual(
+            response_data["data"],
+            {
+                "processed": 5,
+                "changed": 4,
+                "results": [
+                    {"number": 13, "status": "added"},
+                    {"number": 5, "status": "already_blacklisted"},
+                    {"number": 20, "status": "added"},
+                    {"number": 21, "status": "added"},
+                    {"number": 22, "status": "added"},
+                ],
+            },
+        )
+        self.assertSetEqual(set(BlacklistService().get_blacklisted_numbers()), {5, 13, 20, 21, 22})
+
+    def test_bulk_blacklist_plain_array(self):
+        """Test the body can be a plain JSON array of numbers."""
+        response = self.client.post(reverse("manage-blacklist-bulk"), data=[3, 8], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["changed"], 2)
+        self.assertEqual(BlacklistedFibonacciNumber.objects.count(), 2)
+
+    def test_bulk_blacklist_bumps_version_once(self):
+        """Test the blacklist version is bumped once per bulk operation."""
+        service = BlacklistService()
+        version = service.get_version()
+
+        data = {"ranges": [{"start": 1, "end": 2500}]}
+        response = self.client.post(reverse("manage-blacklist-bulk"), data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(service.get_version(), version + 1)
+        self.assertEqual(len(service.get_blacklisted_numbers()), 2500)
+
+    def test_bulk_blacklist_validation_error(self):
+        """Test invalid numbers and inverted ranges are rejected."""
+        data = {"numbers": [0], "ranges": [{"start": 10, "end": 5}]}
+        response = self.client.post(reverse("manage-blacklist-bulk"), data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response_data = response.json()
+        self.assertFalse(response_data["success"])
+        self.assertEqual(
+            response_data["error"]["numbers"]["0"][0],
+            "Ensure this value is greater than or equal to 1.",
+        )
+        self.assertEqual(
+            response_data["error"]["ranges"][0]["non_field_errors"][0],
+            "'end' must be greater than or equal to 'start'.",
+        )
+
+    def test_bulk_blacklist_empty_body(self):
+        """Test a request without any number is rejected."""
+        response = self.client.post(reverse("manage-blacklist-bulk"), data={}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["non_field_errors"][0],
+            "At least one number or range is required.",
+        )
+
+
+class BlacklistBulkViewDeleteMethodTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_bulk_remove_success(self):
+        """Test removing numbers reports which ones were not blacklisted."""
+        data = {"ranges": [{"start": 1, "end": 5}]}
+        response = self.client.post(reverse("manage-blacklist-bulk"), data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        service = BlacklistService()
+        version = service.get_version()
+
+        response = self.client.delete(
+            reverse("manage-blacklist-bulk"), data={"numbers": [2, 4, 6]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertDictEqual(
+            response_data["data"],
+            {
+                "processed": 3,
+                "changed": 2,
+                "results": [
+                    {"number": 2, "status": "deleted"},
+                    {"number": 4, "status": "deleted"},
+                    {"number": 6, "status": "not_found"},
+                ],
+            },
+        )
+        self.assertSetEqual(set(service.get_blacklisted_numbers()), {1, 3, 5})
+        self.assertEqual(service.get_version(), version + 1)
+
+    def test_bulk_remove_nothing_found_keeps_version(self):
+        """Test removing only unknown numbers leaves the blacklist version untouched."""
+        service = BlacklistService()
+        version = service.get_version()
+
+        response = self.client.delete(reverse("manage-blacklist-bulk"), data=[7], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["changed"], 0)
+        self.assertEqual(service.get_version(), version)
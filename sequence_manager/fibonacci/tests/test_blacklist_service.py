@@ -0,0 +1,275 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.models import BlacklistedFibonacciNumber, BlacklistVersion
+from sequence_manager.fibonacci.services import BlacklistService
+from sequence_manager.fibonacci.utils.api_exceptions import BlacklistConflictApiException
+from sequence_manager.fibonacci.utils.blacklist_store import BlacklistArrayStore
+
+
+class BlacklistServiceSnapshotCacheTests(TestCase):
+
+    def setUp(self):
+        self.service = BlacklistService()
+        self.service.snapshot_cache.clear()
+
+    def tearDown(self):
+        self.service.snapshot_cache.clear()
+
+    def test_modifications_bump_version(self):
+        """Test adding and removing a number increments the blacklist version each time."""
+        initial_version = self.service.get_version()
+
+        self.service.add_to_blacklist(13)
+        self.assertEqual(self.service.get_version(), initial_version + 1)
+
+        self.service.remove_from_blacklist(13)
+        self.assertEqual(self.service.get_version(), initial_version + 2)
+
+    def test_conflict_does_not_bump_version(self):
+        """Test a rejected duplicate does not change the blacklist version."""
+        self.service.add_to_blacklist(13)
+        version = self.service.get_version()
+
+        with self.assertRaises(BlacklistConflictApiException):
+            self.service.add_to_blacklist(13)
+        self.assertEqual(self.service.get_version(), version)
+
+    def test_snapshot_reused_while_version_unchanged(self):
+        """Test repeated reads hit the cache and only read the version from the database."""
+        self.service.add_to_blacklist(5)
+
+        self.assertTrue(self.service.is_blacklisted(5))
+        with self.assertNumQueries(1):
+            self.assertFalse(self.service.is_blacklisted(8))
+        with self.assertNumQueries(1):
+            self.assertSetEqual(set(self.service.get_blacklisted_numbers()), {5})
+
+        stats = self.service.get_cache_stats()
+        self.assertEqual(stats["reloads"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+
+    def test_snapshot_reloaded_when_version_changes_elsewhere(self):
+        """Test a version bump made by another process triggers a reload."""
+        self.assertFalse(self.service.is_blacklisted(21))
+
+        # Simulate a modification made by a different worker process
+        BlacklistedFibonacciNumber.objects.create(number=21)
+        BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID).update(version=100)
+
+        self.assertTrue(self.service.is_blacklisted(21))
+        self.assertEqual(self.service.get_cache_stats()["reloads"], 2)
+        self.assertEqual(self.service.get_cache_stats()["version"], 100)
+
+    def test_version_check_interval_skips_database(self):
+        """Test no query is made while the version check interval has not elapsed."""
+        self.service.add_to_blacklist(3)
+        self.service.snapshot_cache.version_check_interval = 60
+        try:
+            self.assertTrue(self.service.is_blacklisted(3))
+            with self.assertNumQueries(0):
+                self.assertTrue(self.service.is_blacklisted(3))
+        finally:
+            self.service.snapshot_cache.version_check_interval = 0
+
+    def test_pinned_version_state_checks_version_once(self):
+        """Test reads within a pinned version state make one query and ignore concurrent changes."""
+        self.service.add_to_blacklist(3)
+        self.assertTrue(self.service.is_blacklisted(3))
+
+        with self.assertNumQueries(1), self.service.pin_version_state() as (version, updated_at):
+            self.assertTrue(self.service.is_blacklisted(3))
+            self.assertListEqual(list(self.service.get_blacklist_index()), [3])
+            self.assertTupleEqual(self.service.get_version_state(), (version, updated_at))
+        self.assertIsNotNone(updated_at)
+
+        with self.service.pin_version_state():
+            snapshot = self.service.get_snapshot()
+            # Simulate a modification made by a different worker process
+            BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID).update(version=100)
+            self.assertIs(self.service.get_snapshot(), snapshot)
+
+        self.assertEqual(self.service.get_snapshot().version, 100)
+
+
+class BlacklistArrayStoreTests(SimpleTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BlacklistArrayStore(os.path.join(self.tmp_dir.name, "blacklist.bin"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_publish_and_read(self):
+        """Test published positions are found by a binary search and listed in order."""
+        self.store.publish(lambda: (7, [17, 1, 8, 64, 9]))
+
+        self.assertEqual(self.store.get_version(), 7)
+        self.assertListEqual(list(self.store.iter_numbers()), [1, 8, 9, 17, 64])
+        self.assertTrue(self.store.contains(64))
+        self.assertFalse(self.store.contains(65))
+        self.assertFalse(self.store.contains(10**9))
+
+    def test_readers_see_replaced_file(self):
+        """Test an existing reader picks up a file published by another writer."""
+        self.store.publish(lambda: (1, [3]))
+        self.assertTrue(self.store.contains(3))
+
+        other_writer = BlacklistArrayStore(self.store.path)
+        other_writer.publish(lambda: (2, [5]))
+
+        self.assertEqual(self.store.get_version(), 2)
+        self.assertFalse(self.store.contains(3))
+        self.assertTrue(self.store.contains(5))
+
+    def test_file_size_depends_on_count(self):
+        """Test the file holds one uint32 per position, however large the positions are."""
+        self.store.publish(lambda: (1, [3, 400_000_000, 2**32 - 1]))
+
+        self.assertEqual(os.path.getsize(self.store.path), BlacklistArrayStore.HEADER.size + 3 * 4)
+        self.assertTrue(self.store.contains(2**32 - 1))
+        self.assertFalse(self.store.contains(2**32))
+
+        with self.assertRaises(ValueError):
+            self.store.publish(lambda: (2, [2**32]))
+        self.assertEqual(self.store.get_version(), 1)
+
+    def test_empty_blacklist(self):
+        """Test an empty blacklist is published as a header-only file."""
+        self.store.publish(lambda: (0, []))
+        self.assertListEqual(list(self.store.iter_numbers()), [])
+        self.assertFalse(self.store.contains(1))
+
+
+class BlacklistServiceArrayStoreTests(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        store = BlacklistArrayStore(os.path.join(self.tmp_dir.name, "blacklist.bin"))
+        self.store_patcher = mock.patch.object(BlacklistService, "store", store)
+        self.store_patcher.start()
+        self.service = BlacklistService()
+        self.service.snapshot_cache.clear()
+        self.service.version_state_cache.invalidate()
+
+    def tearDown(self):
+        self.store_patcher.stop()
+        self.service.snapshot_cache.clear()
+        self.service.version_state_cache.invalidate()
+        self.tmp_dir.cleanup()
+
+    def test_modifications_are_published(self):
+        """Test the array file follows additions and removals."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(13)
+        self.assertTrue(self.service.store.contains(13))
+        self.assertEqual(self.service.store.get_version(), self.service.get_version())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.remove_from_blacklist(13)
+        self.assertFalse(self.service.store.contains(13))
+
+    def test_reads_do_not_query_database(self):
+        """Test lookups and snapshots are served from the array file within the check interval."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(21)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.is_blacklisted(21))
+        with (
+            mock.patch.object(self.service.version_state_cache, "version_check_interval", 60),
+            self.assertNumQueries(0),
+        ):
+            self.assertFalse(self.service.is_blacklisted(34))
+            self.assertSetEqual(set(self.service.get_blacklisted_numbers()), {21})
+
+    def test_stale_file_is_published_again(self):
+        """Test a file left behind by a write from another host is rebuilt before being read."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(21)
+
+        # Simulate a writer which does not share the array file
+        other_store = BlacklistArrayStore(os.path.join(self.tmp_dir.name, "other.bin"))
+        with (
+            mock.patch.object(BlacklistService, "store", other_store),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.service.add_to_blacklist(8)
+        self.assertFalse(self.service.store.contains(8))
+
+        self.assertTrue(self.service.is_blacklisted(8))
+        self.assertEqual(self.service.store.get_version(), self.service.get_version())
+        response = APIClient().get(reverse("fibonacci-number", args=[8]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_failed_publish_falls_back_to_database(self):
+        """Test reads are served from the database while a stale file cannot be rebuilt."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(21)
+        BlacklistedFibonacciNumber.objects.create(number=8)
+        BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID).update(version=100)
+
+        with (
+            mock.patch.object(self.service.store, "publish", side_effect=OSError),
+            self.assertLogs("sequence_manager.fibonacci.services", "ERROR"),
+        ):
+            self.assertTrue(self.service.is_blacklisted(8))
+            self.assertSetEqual(set(self.service.get_blacklisted_numbers()), {8, 21})
+
+    def test_pinned_lookups_use_the_store(self):
+        """Test a pinned version state reads the version row only and builds no snapshot."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(21)
+
+        with (
+            mock.patch.object(self.service.store, "iter_numbers") as iter_numbers,
+            self.assertNumQueries(1),
+            self.service.pin_version_state() as (version, updated_at),
+        ):
+            self.assertTrue(self.service.is_blacklisted(21))
+            self.assertFalse(self.service.is_blacklisted(34))
+        iter_numbers.assert_not_called()
+        self.assertEqual(version, self.service.store.get_version())
+        self.assertIsNotNone(updated_at)
+
+        with (
+            mock.patch.object(self.service.version_state_cache, "version_check_interval", 60),
+            self.assertNumQueries(0),
+            self.service.pin_version_state(),
+        ):
+            self.assertTrue(self.service.is_blacklisted(21))
+
+    def test_pinned_version_is_the_served_one(self):
+        """Test the pinned version is the one of the file the lookups are served from."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.add_to_blacklist(21)
+
+        # A file published by another process after the database version was read
+        self.service.store.publish(lambda: (100, [21, 34]))
+        with self.service.pin_version_state() as (version, updated_at):
+            self.assertTrue(self.service.is_blacklisted(34))
+        self.assertEqual(version, 100)
+        self.assertIsNone(updated_at)
+
+        # A stale file is published again before being pinned
+        BlacklistedFibonacciNumber.objects.create(number=8)
+        BlacklistVersion.objects.filter(pk=BlacklistVersion.SINGLETON_ID).update(version=200)
+        with self.service.pin_version_state() as (version, updated_at):
+            self.assertTrue(self.service.is_blacklisted(8))
+        self.assertEqual(version, 200)
+        self.assertIsNotNone(updated_at)
+
+    def test_missing_file_is_published_on_first_read(self):
+        """Test the initial array file is built from the database when missing."""
+        BlacklistedFibonacciNumber.objects.create(number=8)
+
+        self.assertTrue(self.service.is_blacklisted(8))
+        self.assertTrue(self.service.store.exists())
@@ -0,0 +1,116 @@
+import logging
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils import conditional
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+
+
+class ConditionalRequestTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_responses_carry_validators(self):
+        """Test successful responses carry a strong ETag and caching headers."""
+        for url in (
+            reverse("fibonacci-number", args=[8]),
+            reverse("fibonacci-list", args=[20]),
+            reverse("fibonacci-range", args=[5, 10]),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, msg=url)
+            self.assertRegex(response["ETag"], r'^"[0-9a-f]{32}"$')
+            self.assertIn("public", response["Cache-Control"])
+            self.assertIn("no-cache", response["Cache-Control"])
+            self.assertNotIn("max-age", response["Cache-Control"])
+            self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_configured_max_age(self):
+        """Test a positive `HTTP_CACHE_MAX_AGE` lets caches serve responses without revalidation."""
+        with mock.patch.object(conditional, "HTTP_CACHE_MAX_AGE", 60):
+            response = self.client.get(reverse("fibonacci-number", args=[8]))
+
+        self.assertIn("max-age=60", response["Cache-Control"])
+        self.assertNotIn("no-cache", response["Cache-Control"])
+
+    def test_matching_etag_is_answered_without_computation(self):
+        """Test a matching `If-None-Match` gets 304 before any number is computed."""
+        url = reverse("fibonacci-number", args=[500])
+        etag = self.client.get(url)["ETag"]
+
+        with (
+            mock.patch.object(FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)),
+            mock.patch.object(FibonacciComputationExecutor, "get_fib_number") as get_fib_number,
+        ):
+            response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("public", response["Cache-Control"])
+        get_fib_number.assert_not_called()
+
+    def test_etag_depends_on_the_request(self):
+        """Test requests for different numbers, pages or formats get different ETags."""
+        url = reverse("fibonacci-list", args=[500])
+        etags = {
+            self.client.get(url)["ETag"],
+            self.client.get(url, {"page": 2})["ETag"],
+            self.client.get(url, {"page_size": 5})["ETag"],
+            self.client.get(url, {"format": "ndjson"})["ETag"],
+            self.client.get(reverse("fibonacci-list", args=[501]))["ETag"],
+            self.client.get(reverse("fibonacci-number", args=[500]))["ETag"],
+        }
+        self.assertEqual(len(etags), 6)
+        self.assertEqual(
+            self.client.get(url, {"page": 2})["ETag"], self.client.get(url, {"page": 2})["ETag"]
+        )
+
+    def test_last_modified_follows_the_blacklist(self):
+        """Test responses carry the time of the last blacklist change, only the ETag revalidates."""
+        url = reverse("fibonacci-number", args=[500])
+        self.client.post(reverse("manage-blacklist", args=[3]))
+        response = self.client.get(url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["Last-Modified"], last_modified)
+
+        # A second change within the same second keeps the Last-Modified time
+        self.client.post(reverse("manage-blacklist", args=[5]))
+        response = self.client.get(url, headers={"If-Modified-Since": last_modified})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_blacklist_change_invalidates_etag(self):
+        """Test a blacklist modification changes the ETag so stale copies are not revalidated."""
+        url = reverse("fibonacci-list", args=[20])
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.post(reverse("manage-blacklist", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn(3, [item["number"] for item in response.json()["data"]["results"]])
+
+    def test_error_responses_carry_no_validators(self):
+        """Test error responses are neither tagged nor marked as cacheable."""
+        response = self.client.get(reverse("fibonacci-number", args=[0]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+        self.assertNotIn("public", response.get("Cache-Control", ""))
@@ -0,0 +1,219 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.db.backends.sqlite3 import base as sqlite_base
+from django.db.utils import ConnectionHandler, OperationalError
+from django.test import SimpleTestCase
+
+from sequence_manager import settings as project_settings
+from sequence_manager.utils.connection_pool import (
+    POOL_CLOSED_TOTAL,
+    POOL_TIMEOUTS_TOTAL,
+    ConnectionPool,
+    PooledDatabaseWrapperMixin,
+    PoolTimeoutError,
+)
+from sequence_manager.utils.metrics import registry
+
+
+class PooledSQLiteDatabaseWrapper(PooledDatabaseWrapperMixin, sqlite_base.DatabaseWrapper):
+    """Local stand-in for the pooled MySQL backend."""
+
+
+class ConnectionPoolTests(SimpleTestCase):
+
+    def setUp(self):
+        registry.clear()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "pool.sqlite3")
+
+    def tearDown(self):
+        registry.clear()
+        self.tmp_dir.cleanup()
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def get_pool(self, **options) -> ConnectionPool:
+        options = {
+            "max_idle": 1,
+            "max_size": 2,
+            "timeout": 0.05,
+            "recycle": 0,
+            "pre_ping": True,
+            **options,
+        }
+        return ConnectionPool(
+            "test", ping=PooledSQLiteDatabaseWrapper.is_connection_alive, **options
+        )
+
+    def test_reuses_released_connections(self):
+        """Test a released connection is handed out again."""
+        pool = self.get_pool()
+
+        connection, reused = pool.acquire(self.connect)
+        self.assertFalse(reused)
+        pool.release(connection)
+        self.assertDictEqual(pool.get_stats(), {"idle": 1, "in_use": 0, "size": 1})
+
+        self.assertTupleEqual(pool.acquire(self.connect), (connection, True))
+        self.assertDictEqual(pool.get_stats(), {"idle": 0, "in_use": 1, "size": 1})
+
+    def test_overflow_connections_are_closed(self):
+        """Test only `max_idle` connections are kept idle."""
+        pool = self.get_pool()
+        first, _ = pool.acquire(self.connect)
+        second, _ = pool.acquire(self.connect)
+
+        pool.release(first)
+        pool.release(second)
+
+        self.assertDictEqual(pool.get_stats(), {"idle": 1, "in_use": 0, "size": 1})
+        self.assertEqual(POOL_CLOSED_TOTAL.get(("test", "overflow")), 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            second.execute("SELECT 1")
+
+    def test_exhausted_pool(self):
+        """Test checkouts wait for a released connection and time out on an exhausted pool."""
+        pool = self.get_pool(max_size=1, timeout=1)
+        connection, _ = pool.acquire(self.connect)
+
+        threading.Timer(0.05, pool.release, (connection,)).start()
+        self.assertTupleEqual(pool.acquire(self.connect), (connection, True))
+
+        pool.timeout = 0.05
+        with self.assertRaises(PoolTimeoutError):
+            pool.acquire(self.connect)
+        self.assertEqual(POOL_TIMEOUTS_TOTAL.get(("test",)), 1)
+
+    def test_recycle(self):
+        """Test connections older than `recycle` seconds are replaced."""
+        pool = self.get_pool(recycle=0.01)
+        connection, _ = pool.acquire(self.connect)
+        pool.release(connection)
+        time.sleep(0.02)
+
+        new_connection, reused = pool.acquire(self.connect)
+        self.assertIsNot(new_connection, connection)
+        self.assertFalse(reused)
+        self.assertEqual(POOL_CLOSED_TOTAL.get(("test", "recycle")), 1)
+
+    def test_pre_ping(self):
+        """Test a dead idle connection is replaced before being handed out."""
+        pool = self.get_pool()
+        connection, _ = pool.acquire(self.connect)
+        pool.release(connection)
+        connection.close()
+
+        new_connection, reused = pool.acquire(self.connect)
+        self.assertIsNot(new_connection, connection)
+        self.assertFalse(reused)
+        self.assertEqual(POOL_CLOSED_TOTAL.get(("test", "ping")), 1)
+        self.assertDictEqual(pool.get_stats(), {"idle": 0, "in_use": 1, "size": 1})
+
+    def test_metrics(self):
+        """Test the pool waits, checkouts and connections are exposed."""
+        pool = self.get_pool()
+        connection, _ = pool.acquire(self.connect)
+        pool.release(connection)
+        pool.acquire(self.connect)
+
+        content = registry.render()
+        self.assertIn('db_pool_wait_seconds_count{pool="test"} 2', content)
+        self.assertIn('db_pool_checkouts_total{pool="test"} 2', content)
+        self.assertIn("# TYPE db_pool_connections gauge", content)
+        self.assertIn('db_pool_connections{pool="test",state="idle"} 0', content)
+        self.assertIn('db_pool_connections{pool="test",state="in_use"} 1', content)
+
+
+class PooledDatabaseWrapperTests(SimpleTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        handler = ConnectionHandler(
+            {
+                "default": {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": os.path.join(self.tmp_dir.name, "pool.sqlite3"),
+                    "OPTIONS": {
+                        "pool": {
+                            "max_idle": 1,
+                            "max_size": 1,
+                            "timeout": 0.05,
+                            "recycle": 0,
+                            "pre_ping": True,
+                        },
+                    },
+                }
+            }
+        )
+        self.wrapper = PooledSQLiteDatabaseWrapper(handler.settings["default"], self.id())
+
+    def tearDown(self):
+        self.wrapper.close()
+        PooledSQLiteDatabaseWrapper.close_pools()
+        self.tmp_dir.cleanup()
+
+    def execute(self, sql: str):
+        with self.wrapper.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    def test_connections_are_returned_to_the_pool(self):
+        """Test closing the Django connection returns the raw connection to the pool."""
+        self.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+        raw_connection = self.wrapper.connection
+        self.wrapper.close()
+
+        self.execute("INSERT INTO item VALUES (1)")
+        self.assertIs(self.wrapper.connection, raw_connection)
+        self.assertListEqual(self.execute("SELECT id FROM item"), [(1,)])
+
+    def test_broken_connections_are_discarded(self):
+        """Test a connection closed during a transaction or after an error is not reused."""
+        self.execute("SELECT 1")
+        raw_connection = self.wrapper.connection
+        self.wrapper.set_autocommit(False)
+        self.wrapper.close()
+        self.wrapper.connect()
+        self.assertIsNot(self.wrapper.connection, raw_connection)
+
+        raw_connection = self.wrapper.connection
+        self.wrapper.errors_occurred = True
+        self.wrapper.close()
+        self.wrapper.connect()
+        self.assertIsNot(self.wrapper.connection, raw_connection)
+
+    def test_changed_settings_get_a_new_pool(self):
+        """Test idle connections to a previous database are not reused once `NAME` changes."""
+        self.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+        raw_connection = self.wrapper.connection
+        self.wrapper.close()
+
+        self.wrapper.settings_dict["NAME"] = os.path.join(self.tmp_dir.name, "other.sqlite3")
+        self.assertListEqual(self.execute("SELECT name FROM sqlite_master"), [])
+        self.assertIsNot(self.wrapper.connection, raw_connection)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            raw_connection.execute("SELECT 1")
+
+    def test_exhausted_pool(self):
+        """Test an exhausted pool surfaces as a database error."""
+        self.execute("SELECT 1")
+        other = PooledSQLiteDatabaseWrapper(self.wrapper.settings_dict, self.id())
+
+        with self.assertRaises(OperationalError):
+            other.ensure_connection()
+
+    def test_project_settings(self):
+        """Test the MySQL database is pooled and its connection options are nested correctly."""
+        database = project_settings.DATABASES["default"]
+        if project_settings.DB_ENGINE == "sqlite":
+            self.skipTest("The local stand-in database is not pooled")
+
+        self.assertEqual(database["ENGINE"], "sequence_manager.db_backends.mysql")
+        self.assertIn("connect_timeout", database["OPTIONS"])
+        self.assertEqual(database["OPTIONS"]["pool"]["max_size"], project_settings.DB_POOL_MAX_SIZE)
+        self.assertNotIn("OPTIONS", project_settings.DATABASES)
@@ -0,0 +1,96 @@
+import logging
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.api_exceptions import (
+    ComputationTooLargeApiException,
+    ComputationUnavailableApiException,
+    ResponseTooLargeApiException,
+)
+from sequence_manager.fibonacci.utils.engines import (
+    ComputationBudgetExceeded,
+    estimate_fib_bytes,
+    fib_pair_fast_doubling,
+    fib_pair_iterative,
+)
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+
+
+class FibonacciComputationExecutorTests(SimpleTestCase):
+
+    def setUp(self):
+        self.executor = FibonacciComputationExecutor()
+        self.service = FibonacciSequenceService()
+        self.cache_patch = mock.patch.object(
+            FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)
+        )
+        self.cache_patch.start()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        self.cache_patch.stop()
+        logging.disable(logging.NOTSET)
+
+    def test_small_index_computed_in_process(self):
+        """Test indexes below the threshold do not use the process pool."""
+        with mock.patch.object(FibonacciComputationExecutor, "_get_pool") as get_pool:
+            self.assertEqual(self.executor.get_fib_number(10), 55)
+        get_pool.assert_not_called()
+
+    def test_large_index_computed_in_pool(self):
+        """Test indexes above the threshold are computed by the process pool."""
+        with mock.patch.object(FibonacciComputationExecutor, "offload_threshold", 1000):
+            self.assertEqual(self.executor.get_fib_number(5000), self.service.get_fib_number(5000))
+            self.assertDictEqual(
+                self.executor.get_fib_numbers([5000, 10, 1001]),
+                self.service.get_fib_numbers([5000, 10, 1001]),
+            )
+
+    def test_result_size_budget(self):
+        """Test indexes whose result exceeds the size budget are rejected upfront."""
+        with mock.patch.object(FibonacciComputationExecutor, "max_result_bytes", 1024):
+            self.executor.get_fib_number(11_000)
+            with self.assertRaises(ComputationTooLargeApiException):
+                self.executor.get_fib_number(12_000)
+            with self.assertRaises(ComputationTooLargeApiException):
+                self.executor.get_fib_numbers([1, 12_000])
+
+    def test_large_pair_computed_in_pool(self):
+        """Test the jumps seeding list pages are offloaded like single values."""
+        with mock.patch.object(FibonacciComputationExecutor, "_get_pool") as get_pool:
+            self.assertTupleEqual(self.executor.get_fib_pair(10), (55, 89))
+        get_pool.assert_not_called()
+
+        with mock.patch.object(FibonacciComputationExecutor, "offload_threshold", 1000):
+            self.assertTupleEqual(self.executor.get_fib_pair(5000), self.service.get_fib_pair(5000))
+
+    def test_response_size_budget(self):
+        """Test batches whose results together exceed the response budget are rejected."""
+        with mock.patch.object(FibonacciComputationExecutor, "max_response_bytes", 4096):
+            self.executor.get_fib_numbers([10_000, 20_000])
+            with self.assertRaises(ResponseTooLargeApiException):
+                self.executor.get_fib_numbers(range(10_000, 10_010))
+
+    def test_cpu_time_budget(self):
+        """Test a pool computation exceeding its CPU-time budget is reported as unavailable."""
+        with (
+            mock.patch.object(FibonacciComputationExecutor, "offload_threshold", 0),
+            mock.patch.object(FibonacciComputationExecutor, "cpu_time_budget", 1e-9),
+        ):
+            with self.assertRaises(ComputationUnavailableApiException):
+                self.executor.get_fib_number(5_000_000)
+
+    def test_engines_honor_cpu_deadline(self):
+        """Test both engines abort once the CPU deadline has passed."""
+        for fib_pair in (fib_pair_fast_doubling, fib_pair_iterative):
+            with self.assertRaises(ComputationBudgetExceeded):
+                fib_pair(100_000, cpu_deadline=0)
+
+    def test_estimate_fib_bytes_is_upper_bound(self):
+        """Test the size estimate never underestimates the real size."""
+        for idx in (1, 2, 10, 93, 94, 1000, 4096, 25_000):
+            fib_num = self.service.get_fib_number(idx)
+            self.assertGreaterEqual(estimate_fib_bytes(idx), (fib_num.bit_length() + 7) // 8)
@@ -0,0 +1,65 @@
+import logging
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+
+
+class FibonacciNumberBatchViewTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_get_fib_batch_success(self):
+        """Test the values are returned in request order, including duplicates."""
+        data = {"numbers": [8, 1, 5000, 8, 2]}
+        response = self.client.post(reverse("fibonacci-batch"), data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertListEqual(
+            response_data["data"],
+            [
+                {"number": 8, "value": 13},
+                {"number": 1, "value": 0},
+                {"number": 5000, "value": FibonacciSequenceService().get_fib_number(4999)},
+                {"number": 8, "value": 13},
+                {"number": 2, "value": 1},
+            ],
+        )
+
+    def test_get_fib_batch_with_blacklisted_number(self):
+        """Test blacklisted positions are reported without failing the whole batch."""
+        response = self.client.post(reverse("manage-blacklist", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(reverse("fibonacci-batch"), data=[3, 4], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(
+            response.json()["data"],
+            [
+                {"number": 3, "error": "This number is blacklisted and cannot be used."},
+                {"number": 4, "value": 2},
+            ],
+        )
+
+    def test_get_fib_batch_validation_error(self):
+        """Test an empty batch and invalid positions are rejected."""
+        response = self.client.post(reverse("fibonacci-batch"), data=[], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.json()["success"])
+
+        response = self.client.post(reverse("fibonacci-batch"), data=[5, 0], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["numbers"]["1"][0],
+            "Ensure this value is greater than or equal to 1.",
+        )
@@ -1,10 +1,20 @@
+import base64
+import gzip
+import json
 import logging
+from unittest import mock
 
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.paginators import FibonacciNumberPagination
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+from sequence_manager.fibonacci.utils.value_encodings import BINARY_RECORD_HEADER
+
 
 class FibonacciNumberListViewTests(TestCase):
 
@@ -137,3 +147,223 @@ class FibonacciNumberListViewTests(TestCase):
         response_data = response.json()
         self.assertFalse(response_data["success"])
         self.assertEqual(response_data["error"], "Invalid page")
+
+    def test_get_fib_list_deep_page(self):
+        """Test a deep page of a long sequence returns the correct values."""
+        params = {"page_size": 5, "page": 3000}
+        response = self.client.get(reverse("fibonacci-list", args=[20000]), data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertEqual(response_data["data"]["count"], 20000)
+        self.assertListEqual(
+            [item["number"] for item in response_data["data"]["results"]],
+            [14996, 14997, 14998, 14999, 15000],
+        )
+        self.assertEqual(
+            response_data["data"]["results"][-1]["value"],
+            FibonacciSequenceService().get_fib_number(14999),
+        )
+
+    def test_get_fib_list_result_size_budget_applies_to_the_page(self):
+        """Test a long sequence is paginated as long as the values of the page fit the budget."""
+        url = reverse("fibonacci-list", args=[20_000_000])
+        for params in (
+            {"page": 1, "page_size": 3},
+            {"pagination": "cursor", "page_size": 3},
+        ):
+            response = self.client.get(url, data=params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, msg=params)
+            self.assertListEqual(
+                [item["value"] for item in response.json()["data"]["results"]], [0, 1, 1]
+            )
+
+        with mock.patch.object(FibonacciComputationExecutor, "max_result_bytes", 1024):
+            response = self.client.get(url, data={"page": 5000, "page_size": 3})
+            self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+            # A stream computes every value up to the end of the sequence
+            response = self.client.get(url, data={"format": "ndjson"})
+            self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            self.assertFalse(response.streaming)
+
+
+class FibonacciNumberListViewStreamingTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_get_fib_list_ndjson_format_param(self):
+        """Test streaming the whole sequence as NDJSON with the format query parameter."""
+        response = self.client.post(reverse("manage-blacklist", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(reverse("fibonacci-list", args=[250]), data={"format": "ndjson"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(records), 249)
+        self.assertListEqual(
+            records[:3],
+            [
+                {"number": 1, "value": 0},
+                {"number": 2, "value": 1},
+                {"number": 4, "value": 2},
+            ],
+        )
+        self.assertDictEqual(
+            records[-1], {"number": 250, "value": FibonacciSequenceService().get_fib_number(249)}
+        )
+
+    def test_get_fib_list_ndjson_accept_header_gzip(self):
+        """Test the NDJSON stream is negotiated by headers and compressed when accepted."""
+        response = self.client.get(
+            reverse("fibonacci-list", args=[10]),
+            HTTP_ACCEPT="application/x-ndjson",
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+        content = gzip.decompress(b"".join(response.streaming_content))
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertListEqual(
+            [record["value"] for record in records], [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+        )
+
+    def test_get_fib_list_binary_format(self):
+        """Test streaming the whole sequence as length-prefixed little-endian records."""
+        response = self.client.post(reverse("manage-blacklist", args=[3]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(
+            reverse("fibonacci-list", args=[300]), HTTP_ACCEPT="application/octet-stream"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/octet-stream")
+
+        content, offset, records = b"".join(response.streaming_content), 0, {}
+        while offset < len(content):
+            number, length = BINARY_RECORD_HEADER.unpack_from(content, offset)
+            offset += BINARY_RECORD_HEADER.size
+            records[number] = int.from_bytes(content[offset : offset + length], "little")
+            offset += length
+
+        service = FibonacciSequenceService()
+        self.assertDictEqual(
+            records, {idx: service.get_fib_number(idx - 1) for idx in range(1, 301) if idx != 3}
+        )
+
+    def test_get_fib_list_value_encodings(self):
+        """Test the values of a page are returned as hex or base64 strings when requested."""
+        fib_num = FibonacciSequenceService().get_fib_number(99)
+        expected = {
+            "hex": format(fib_num, "x"),
+            "base64": base64.b64encode(fib_num.to_bytes(9, "big")).decode(),
+        }
+
+        for value_encoding, value in expected.items():
+            response = self.client.get(
+                reverse("fibonacci-range", args=[100, 200]),
+                data={"value_encoding": value_encoding, "page_size": 1},
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertListEqual(
+                response.json()["data"]["results"], [{"number": 100, "value": value}]
+            )
+
+        response = self.client.get(
+            reverse("fibonacci-list", args=[10]), data={"value_encoding": "octal"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["value_encoding"][0], '"octal" is not a valid choice.'
+        )
+
+
+class FibonacciNumberListViewCursorTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_walk_sequence_with_cursors(self):
+        """Test following the cursor links visits every visible number exactly once."""
+        for number in (3, 4, 9):
+            response = self.client.post(reverse("manage-blacklist", args=[number]))
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        url = reverse("fibonacci-list", args=[20])
+        response = self.client.get(url, data={"pagination": "cursor", "page_size": 4})
+
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response_data = response.json()
+            self.assertTrue(response_data["success"])
+            self.assertEqual(response_data["data"]["count"], 17)
+            pages.append([item["number"] for item in response_data["data"]["results"]])
+
+            if response_data["data"]["next"] is None:
+                break
+            response = self.client.get(response_data["data"]["next"])
+
+        self.assertListEqual(
+            pages,
+            [[1, 2, 5, 6], [7, 8, 10, 11], [12, 13, 14, 15], [16, 17, 18, 19], [20]],
+        )
+        self.assertEqual(
+            response_data["data"]["results"][0]["value"],
+            FibonacciSequenceService().get_fib_number(19),
+        )
+
+    def test_cursor_previous_link(self):
+        """Test the previous link of a cursor page points to the preceding page."""
+        url = reverse("fibonacci-list", args=[20])
+        response = self.client.get(url, data={"pagination": "cursor", "page_size": 5})
+        self.assertIsNone(response.json()["data"]["previous"])
+
+        response = self.client.get(response.json()["data"]["next"])
+        response = self.client.get(response.json()["data"]["next"])
+        self.assertListEqual(
+            [item["number"] for item in response.json()["data"]["results"]], [11, 12, 13, 14, 15]
+        )
+
+        response = self.client.get(response.json()["data"]["previous"])
+        self.assertListEqual(
+            [item["number"] for item in response.json()["data"]["results"]], [6, 7, 8, 9, 10]
+        )
+
+    def test_cursor_states_bounded_by_bytes(self):
+        """Test the cursor states are evicted by their size, however few of them there are."""
+        cursor_states = ByteBudgetLRUCache(600)
+        url = reverse("fibonacci-list", args=[3000])
+        with mock.patch.object(FibonacciNumberPagination, "cursor_states", cursor_states):
+            response = self.client.get(url, data={"pagination": "cursor", "page_size": 1000})
+            response = self.client.get(response.json()["data"]["next"])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["data"]["results"][0]["number"], 1001)
+
+        # The states at positions 1001 and 2001 take about 300 and 480 bytes, they do not fit together
+        self.assertEqual(cursor_states.get_stats()["entries"], 1)
+        self.assertEqual(cursor_states.get_stats()["evictions"], 1)
+        self.assertLessEqual(cursor_states.resident_bytes, cursor_states.max_bytes)
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is rejected."""
+        response = self.client.get(reverse("fibonacci-list", args=[20]), data={"cursor": "bogus"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response_data = response.json()
+        self.assertFalse(response_data["success"])
+        self.assertEqual(response_data["error"], "Invalid cursor")
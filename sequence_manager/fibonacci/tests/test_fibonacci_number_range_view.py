@@ -0,0 +1,126 @@
+import json
+import logging
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+
+
+class FibonacciNumberRangeViewTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_get_fib_range_success(self):
+        """Test retrieving a range of fibonacci numbers for a valid input."""
+        response = self.client.get(reverse("fibonacci-range", args=[10, 12]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertTrue(response_data["success"])
+        self.assertDictEqual(
+            response_data["data"],
+            {
+                "count": 3,
+                "next": None,
+                "previous": None,
+                "results": [
+                    {"number": 10, "value": 34},
+                    {"number": 11, "value": 55},
+                    {"number": 12, "value": 89},
+                ],
+            },
+        )
+
+    def test_get_fib_range_deep_in_sequence(self):
+        """Test a range far from the beginning of the sequence with blacklisted numbers."""
+        response = self.client.post(reverse("manage-blacklist", args=[10_002]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        params = {"page_size": 2, "page": 2}
+        response = self.client.get(reverse("fibonacci-range", args=[10_000, 10_005]), data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertEqual(response_data["data"]["count"], 5)
+        service = FibonacciSequenceService()
+        self.assertListEqual(
+            response_data["data"]["results"],
+            [
+                {"number": 10_003, "value": service.get_fib_number(10_002)},
+                {"number": 10_004, "value": service.get_fib_number(10_003)},
+            ],
+        )
+
+    def test_get_fib_range_ndjson(self):
+        """Test streaming a range as NDJSON."""
+        response = self.client.get(
+            reverse("fibonacci-range", args=[5, 8]), HTTP_ACCEPT="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertListEqual([json.loads(line)["value"] for line in lines], [3, 5, 8, 13])
+
+    def test_get_fib_range_response_size_budget(self):
+        """Test pages whose values together exceed the response budget are rejected."""
+        url = reverse("fibonacci-range", args=[10_000, 10_009])
+        with mock.patch.object(FibonacciComputationExecutor, "max_response_bytes", 4096):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            self.assertEqual(
+                response.json()["error"],
+                "The requested Fibonacci numbers together exceed the allowed response size.",
+            )
+
+            response = self.client.get(url, {"page_size": 2})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_fib_range_long_range_first_page(self):
+        """Test the first page of a range with a far end is served without computing the end."""
+        response = self.client.get(
+            reverse("fibonacci-range", args=[1, 20_000_000]), {"page_size": 3}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["count"], 20_000_000)
+
+    def test_get_fib_range_jump_budget(self):
+        """Test the jump to a far range runs under the CPU-time budget of the executor."""
+        url = reverse("fibonacci-range", args=[5_000_000, 5_000_001])
+        with (
+            mock.patch.object(FibonacciComputationExecutor, "offload_threshold", 0),
+            mock.patch.object(FibonacciComputationExecutor, "cpu_time_budget", 1e-9),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+            response = self.client.get(url, HTTP_ACCEPT="application/x-ndjson")
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertFalse(response.streaming)
+
+    def test_get_fib_range_validation_error(self):
+        """Test a range whose end precedes its start is rejected."""
+        response = self.client.get(reverse("fibonacci-range", args=[12, 10]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response_data = response.json()
+        self.assertFalse(response_data["success"])
+        self.assertEqual(
+            response_data["error"]["non_field_errors"][0],
+            "'end' must be greater than or equal to 'start'.",
+        )
+
+        response = self.client.get(reverse("fibonacci-range", args=[0, 10]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["start"][0], "Ensure this value is greater than or equal to 1."
+        )
@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.blacklist_index import BlacklistIndex
+from sequence_manager.fibonacci.utils.sequences import FibonacciNumberSequence
+
+
+class FibonacciNumberSequenceTests(SimpleTestCase):
+
+    def setUp(self):
+        self.fib_nums = FibonacciSequenceService().get_all_fib_numbers(999)
+
+    def test_len_excludes_blacklisted_numbers(self):
+        """Test the length counts only visible positions within the bounds."""
+        sequence = FibonacciNumberSequence(1000, blacklist=BlacklistIndex({3, 500, 1001, 2000}))
+        self.assertEqual(len(sequence), 998)
+
+    def test_slice_matches_materialized_list(self):
+        """Test a deep window equals the same window of the fully materialized list."""
+        blacklisted_numbers = {1, 10, 11, 12, 700, 702}
+        expected = [
+            {"number": idx + 1, "value": num}
+            for idx, num in enumerate(self.fib_nums)
+            if (idx + 1) not in blacklisted_numbers
+        ]
+        sequence = FibonacciNumberSequence(1000, blacklist=BlacklistIndex(blacklisted_numbers))
+
+        for offset, size in ((0, 20), (5, 10), (690, 25), (980, 100)):
+            self.assertListEqual(sequence[offset : offset + size], expected[offset : offset + size])
+
+    def test_single_item_access(self):
+        """Test integer indexing, including negative indexes."""
+        sequence = FibonacciNumberSequence(10, blacklist=BlacklistIndex({10}))
+        self.assertDictEqual(sequence[0], {"number": 1, "value": 0})
+        self.assertDictEqual(sequence[-1], {"number": 9, "value": 21})
+        with self.assertRaises(IndexError):
+            sequence[9]
+
+    def test_custom_start(self):
+        """Test a sequence that does not start at the first position."""
+        sequence = FibonacciNumberSequence(600, start=500)
+        self.assertEqual(len(sequence), 101)
+        self.assertDictEqual(sequence[0], {"number": 500, "value": self.fib_nums[499]})
+
+    def test_iteration_matches_slicing(self):
+        """Test streaming iteration yields the same items as a full slice."""
+        sequence = FibonacciNumberSequence(300, start=7, blacklist=BlacklistIndex({7, 8, 100, 300}))
+        self.assertListEqual(list(sequence), sequence[:])
+
+
+class BlacklistIndexTests(SimpleTestCase):
+
+    def setUp(self):
+        self.blacklisted_numbers = {2, 3, 4, 9, 15, 16, 40}
+        self.index = BlacklistIndex(self.blacklisted_numbers)
+
+    def test_membership_and_counts(self):
+        """Test membership and the number of visible positions within bounds."""
+        self.assertIn(9, self.index)
+        self.assertNotIn(10, self.index)
+        self.assertEqual(self.index.count_blacklisted(3, 16), 5)
+        self.assertEqual(self.index.count_visible(1, 50), 43)
+        self.assertEqual(self.index.count_visible(10, 5), 0)
+
+    def test_get_position_matches_linear_scan(self):
+        """Test every visible offset maps to the same position as a linear scan would find."""
+        for start in (1, 2, 5, 16, 17):
+            visible = [num for num in range(start, 60) if num not in self.blacklisted_numbers]
+            for offset, position in enumerate(visible):
+                self.assertEqual(self.index.get_position(offset, start=start), position)
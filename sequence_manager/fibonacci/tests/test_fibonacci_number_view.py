@@ -1,10 +1,14 @@
+import base64
 import logging
+from unittest import mock
 
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+
 
 class FibonacciNumberViewTests(TestCase):
 
@@ -47,3 +51,91 @@ class FibonacciNumberViewTests(TestCase):
         response_data = response.json()
         self.assertFalse(response_data["success"])
         self.assertEqual(response_data["error"], "This number is blacklisted and cannot be used.")
+
+    def test_get_fib_number_exceeding_result_size(self):
+        """Test getting fibonacci number whose value exceeds the result size budget."""
+        with mock.patch.object(FibonacciComputationExecutor, "max_result_bytes", 1024):
+            response = self.client.get(reverse("fibonacci-number", args=[20_000]))
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        response_data = response.json()
+        self.assertFalse(response_data["success"])
+        self.assertEqual(
+            response_data["error"],
+            "The requested Fibonacci number exceeds the allowed result size.",
+        )
+
+    def test_get_fib_number_mod(self):
+        """Test getting the residue of a fibonacci number for a given modulus."""
+        response = self.client.get(reverse("fibonacci-number", args=[1000]), {"mod": 1000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json()["data"], {"number": 1000, "modulus": 1000, "value": 626}
+        )
+
+    def test_get_fib_number_mod_beyond_result_size(self):
+        """Test residues are returned for positions whose full value exceeds the size budget."""
+        with mock.patch.object(FibonacciComputationExecutor, "max_result_bytes", 1024):
+            response = self.client.get(reverse("fibonacci-number", args=[10**30]), {"mod": 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["value"], 6)
+
+    def test_get_fib_number_mod_validation_error(self):
+        """Test getting the residue of a fibonacci number for an invalid modulus."""
+        response = self.client.get(reverse("fibonacci-number", args=[10]), {"mod": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response_data = response.json()
+        self.assertFalse(response_data["success"])
+        self.assertEqual(
+            response_data["error"]["mod"][0], "Ensure this value is greater than or equal to 1."
+        )
+
+    def test_get_fib_number_value_encodings(self):
+        """Test getting fibonacci number as hex or base64 strings."""
+        for value_encoding, value in (("hex", "1a"), ("base64", "Gg=="), ("decimal", 26)):
+            response = self.client.get(
+                reverse("fibonacci-number", args=[1000]),
+                {"mod": 100, "value_encoding": value_encoding},
+            )
+            self.assertEqual(response.json()["data"]["value"], value)
+
+        response = self.client.get(reverse("fibonacci-number", args=[1]), {"value_encoding": "hex"})
+        self.assertDictEqual(response.json()["data"], {"number": 1, "value": "0"})
+
+        response = self.client.get(
+            reverse("fibonacci-number", args=[94]), {"value_encoding": "base64"}
+        )
+        self.assertEqual(
+            int.from_bytes(base64.b64decode(response.json()["data"]["value"]), "big"),
+            12200160415121876738,
+        )
+
+    def test_get_fib_number_approx(self):
+        """Test getting the digits of a fibonacci number in the approximate mode."""
+        response = self.client.get(
+            reverse("fibonacci-number", args=[1001]), {"mode": "approx", "significant_digits": 5}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json()["data"],
+            {
+                "number": 1001,
+                "mode": "approx",
+                "digit_count": 209,
+                "leading_digits": "43466",
+                "trailing_digits": "28875",
+                "scientific": "4.3466e208",
+            },
+        )
+
+    def test_get_fib_number_approx_validation_error(self):
+        """Test the approximate mode cannot be combined with a modulus."""
+        response = self.client.get(
+            reverse("fibonacci-number", args=[1001]), {"mode": "approx", "mod": 10}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["error"]["non_field_errors"][0],
+            "'mod' cannot be combined with the approx mode.",
+        )
@@ -0,0 +1,195 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.engines import (
+    FAST_DOUBLING_ENGINE,
+    ITERATIVE_ENGINE,
+    PISANO_MAX_MODULUS,
+    fib_pair_mod,
+    get_pisano_period_multiple,
+)
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache, get_int_bytes
+
+
+class FibonacciSequenceServiceEngineTests(SimpleTestCase):
+
+    def setUp(self):
+        self.fast_service = FibonacciSequenceService(engine=FAST_DOUBLING_ENGINE)
+        self.reference_service = FibonacciSequenceService(engine=ITERATIVE_ENGINE)
+        # Values cached by one engine would otherwise be returned by the other one
+        self.cache_patch = mock.patch.object(
+            FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)
+        )
+        self.cache_patch.start()
+
+    def tearDown(self):
+        self.cache_patch.stop()
+
+    def test_get_fib_number_known_values(self):
+        """Test both engines return the well-known first Fibonacci numbers."""
+        expected = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+        for service in (self.fast_service, self.reference_service):
+            self.assertListEqual([service.get_fib_number(idx) for idx in range(12)], expected)
+
+    def test_engines_agree_on_consecutive_indexes(self):
+        """Test the fast doubling engine matches the reference engine for every small index."""
+        fib_nums = self.reference_service.get_all_fib_numbers(2000)
+        for idx, fib_num in enumerate(fib_nums):
+            self.assertEqual(self.fast_service.get_fib_number(idx), fib_num, msg=f"index {idx}")
+
+    def test_engines_agree_on_large_indexes(self):
+        """Test the engines agree on sparse large indexes, including powers of two boundaries."""
+        for idx in (4095, 4096, 4097, 10_000, 12_345, 25_000, 32_767, 50_001):
+            self.assertEqual(
+                self.fast_service.get_fib_pair(idx),
+                self.reference_service.get_fib_pair(idx),
+                msg=f"index {idx}",
+            )
+
+    def test_get_fib_pair_returns_consecutive_numbers(self):
+        """Test the pair holds F(n) and F(n + 1)."""
+        self.assertEqual(self.fast_service.get_fib_pair(0), (0, 1))
+        self.assertEqual(self.fast_service.get_fib_pair(10), (55, 89))
+
+    def test_get_fib_numbers_for_scattered_indexes(self):
+        """Test batch lookups match single lookups for close and distant indexes."""
+        indexes = [5000, 3, 300, 301, 10, 3, 0, 4000, 4100]
+        fib_nums = self.fast_service.get_fib_numbers(indexes)
+
+        self.assertSetEqual(set(fib_nums), set(indexes))
+        for idx in indexes:
+            self.assertEqual(fib_nums[idx], self.reference_service.get_fib_number(idx))
+
+    def test_negative_index(self):
+        """Test a negative index is rejected by both engines."""
+        for service in (self.fast_service, self.reference_service):
+            with self.assertRaises(ValueError):
+                service.get_fib_number(-1)
+
+    def test_unknown_engine(self):
+        """Test an unknown engine name is rejected."""
+        with self.assertRaises(ValueError):
+            FibonacciSequenceService(engine="unknown")
+
+
+class FibonacciResultCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.cache = ByteBudgetLRUCache(4 * get_int_bytes(2**80))
+
+    def test_service_memoises_values(self):
+        """Test repeated lookups of the same index are served from the result cache."""
+        with mock.patch.object(FibonacciSequenceService, "result_cache", self.cache):
+            service = FibonacciSequenceService()
+            with mock.patch.object(service, "get_fib_pair", wraps=service.get_fib_pair) as get_pair:
+                self.assertEqual(service.get_fib_number(100), 354224848179261915075)
+                self.assertEqual(service.get_fib_number(100), 354224848179261915075)
+            get_pair.assert_called_once_with(100)
+
+            stats = service.get_cache_stats()
+            self.assertEqual(stats["hit_ratio"], 0.5)
+            self.assertEqual(stats["resident_bytes"], get_int_bytes(354224848179261915075))
+
+    def test_eviction_is_based_on_bytes(self):
+        """Test the least recently used entries are evicted once the byte budget is exceeded."""
+        for key in range(4):
+            self.cache.set(key, 2**80)
+        self.cache.get(0)
+        self.cache.set("big", 2**160)
+
+        self.assertIsNone(self.cache.get(1))
+        self.assertIsNone(self.cache.get(2))
+        self.assertEqual(self.cache.get(0), 2**80)
+        self.assertEqual(self.cache.get("big"), 2**160)
+        self.assertLessEqual(self.cache.resident_bytes, self.cache.max_bytes)
+        self.assertEqual(self.cache.get_stats()["evictions"], 2)
+
+    def test_value_exceeding_budget_is_not_cached(self):
+        """Test a value bigger than the whole budget is neither cached nor evicts anything."""
+        self.cache.set(1, 1)
+        self.cache.set(2, 2**10_000)
+
+        self.assertIsNone(self.cache.get(2))
+        self.assertEqual(self.cache.get(1), 1)
+        self.assertEqual(self.cache.resident_bytes, get_int_bytes(1))
+
+
+class FibonacciModularTests(SimpleTestCase):
+
+    def setUp(self):
+        self.service = FibonacciSequenceService()
+        self.fib_nums = FibonacciSequenceService(engine=ITERATIVE_ENGINE).get_all_fib_numbers(1000)
+
+    def test_get_fib_number_mod_matches_full_values(self):
+        """Test residues match the full values, with and without Pisano reduction."""
+        for modulus in (1, 2, 3, 10, 97, 1000, 2**61 - 1, 10**18):
+            for idx in (0, 1, 2, 5, 60, 61, 255, 256, 999):
+                for reduce_period in (True, False):
+                    self.assertEqual(
+                        self.service.get_fib_number_mod(idx, modulus, reduce_period=reduce_period),
+                        self.fib_nums[idx] % modulus,
+                        msg=f"index {idx}, modulus {modulus}",
+                    )
+
+    def test_pisano_period_multiple(self):
+        """Test the sequence modulo m repeats after the computed period multiple."""
+        for modulus in range(1, 500):
+            period = get_pisano_period_multiple(modulus)
+            self.assertEqual(fib_pair_mod(period, modulus), (0, 1 % modulus), msg=modulus)
+
+        self.assertEqual(get_pisano_period_multiple(10), 60)
+        self.assertIsNone(get_pisano_period_multiple(PISANO_MAX_MODULUS + 1))
+
+    def test_get_fib_number_mod_for_huge_index(self):
+        """Test residues of huge indexes agree with and without Pisano reduction."""
+        index = 10**1000 + 7
+        for modulus in (10**9 + 7, 2**32, PISANO_MAX_MODULUS * 10):
+            self.assertEqual(
+                self.service.get_fib_number_mod(index, modulus),
+                self.service.get_fib_number_mod(index, modulus, reduce_period=False),
+            )
+
+    def test_get_fib_number_mod_invalid_arguments(self):
+        """Test a negative index or a non-positive modulus is rejected."""
+        with self.assertRaises(ValueError):
+            self.service.get_fib_number_mod(-1, 10)
+        with self.assertRaises(ValueError):
+            self.service.get_fib_number_mod(10, 0)
+
+
+class FibonacciApproximationTests(SimpleTestCase):
+
+    def setUp(self):
+        self.service = FibonacciSequenceService()
+
+    def test_get_fib_number_approx_matches_exact_values(self):
+        """Test the approximation agrees with the exact digits around the exact-index limit."""
+        for idx in (0, 1, 10, 500, 999, 1000, 1001, 4321, 20_000):
+            digits = str(self.service.get_fib_number(idx))
+            approx = self.service.get_fib_number_approx(idx, significant_digits=15)
+
+            self.assertEqual(approx["digit_count"], len(digits), msg=f"index {idx}")
+            self.assertEqual(approx["leading_digits"], digits[:15], msg=f"index {idx}")
+            self.assertEqual(approx["trailing_digits"], digits[-15:], msg=f"index {idx}")
+
+    def test_get_fib_number_approx_scientific(self):
+        """Test the scientific notation is built from the leading digits and the exponent."""
+        self.assertEqual(self.service.get_fib_number_approx(0)["scientific"], "0e0")
+        self.assertEqual(self.service.get_fib_number_approx(10)["scientific"], "5.5e1")
+        self.assertEqual(
+            self.service.get_fib_number_approx(1000, significant_digits=5)["scientific"],
+            "4.3466e208",
+        )
+
+    def test_get_fib_number_approx_for_huge_index(self):
+        """Test billions-scale indexes are described without computing the value."""
+        approx = self.service.get_fib_number_approx(10**9, significant_digits=20)
+
+        self.assertEqual(approx["digit_count"], 208_987_640)
+        self.assertEqual(approx["leading_digits"], "79523178745546834678")
+        self.assertEqual(
+            approx["trailing_digits"],
+            str(self.service.get_fib_number_mod(10**9, 10**20)).zfill(20),
+        )
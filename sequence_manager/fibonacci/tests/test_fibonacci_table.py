@@ -0,0 +1,116 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.engines import FAST_DOUBLING_ENGINE, FIB_PAIR_ENGINES
+from sequence_manager.fibonacci.utils.fib_table import FibonacciTable
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+
+
+class FibonacciTableTests(SimpleTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "fib.table")
+        self.table = FibonacciTable(self.path)
+        self.service = FibonacciSequenceService()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_build_command_writes_table(self):
+        """Test the management command writes a table matching the computed values."""
+        out = StringIO()
+        call_command("build_fib_table", size=500, path=self.path, stdout=out)
+
+        self.assertIn("500 positions", out.getvalue())
+        self.assertEqual(len(self.table), 500)
+        for idx in (0, 1, 2, 10, 93, 94, 256, 499):
+            self.assertEqual(self.table.get_fib_number(idx), self.service.get_fib_number(idx))
+        self.assertEqual(self.table.get_fib_pair(498), self.service.get_fib_pair(498))
+
+    def test_build_command_rejects_invalid_arguments(self):
+        """Test the management command fails without a path or with a too small size."""
+        with self.assertRaises(CommandError):
+            call_command("build_fib_table", size=10, path="")
+        with self.assertRaises(CommandError):
+            call_command("build_fib_table", size=1, path=self.path)
+
+    def test_lookups_outside_the_table(self):
+        """Test indexes not covered by the table, or a missing file, return None."""
+        self.assertEqual(len(self.table), 0)
+        self.assertIsNone(self.table.get_fib_number(1))
+
+        self.table.build(10)
+        self.assertIsNone(self.table.get_fib_number(10))
+        self.assertIsNone(self.table.get_fib_number(-1))
+        self.assertIsNone(self.table.get_fib_pair(9))
+
+    def test_rebuilt_table_is_remapped(self):
+        """Test readers notice a table replaced by a rebuild."""
+        self.table.build(10)
+        self.assertIsNone(self.table.get_fib_number(50))
+
+        FibonacciTable(self.path).build(100)
+        self.assertEqual(self.table.get_fib_number(50), 12586269025)
+
+    def test_service_serves_values_from_table(self):
+        """Test the service reads covered values instead of computing them."""
+        self.table.build(1000)
+        fib_pair = mock.Mock(side_effect=self.service.get_fib_pair)
+
+        with (
+            mock.patch.object(FibonacciSequenceService, "table", self.table),
+            mock.patch.object(FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)),
+            mock.patch.dict(FIB_PAIR_ENGINES, {FAST_DOUBLING_ENGINE: fib_pair}),
+        ):
+            service = FibonacciSequenceService(engine=FAST_DOUBLING_ENGINE)
+
+            self.assertEqual(service.get_fib_number(100), 354224848179261915075)
+            self.assertEqual(service.get_fib_pair(998), self.table.get_fib_pair(998))
+            fib_pair.assert_not_called()
+
+            self.assertEqual(service.get_fib_pair(999), self.service.get_fib_pair(999))
+            fib_pair.assert_called_once_with(999)
+
+
+class FibonacciTableViewTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.table = FibonacciTable(os.path.join(self.tmp_dir.name, "fib.table"))
+        self.table.build(1000)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_endpoints_serve_values_from_table(self):
+        """Test the single and list endpoints read covered values without computing them."""
+        with (
+            mock.patch.object(FibonacciSequenceService, "table", self.table),
+            mock.patch.object(FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)),
+            mock.patch(
+                "sequence_manager.fibonacci.executors.compute_fib_number"
+            ) as compute_fib_number,
+        ):
+            response = self.client.get(reverse("fibonacci-number", kwargs={"number": 101}))
+            self.assertEqual(response.json()["data"]["value"], 354224848179261915075)
+            compute_fib_number.assert_not_called()
+
+            response = self.client.get(
+                reverse("fibonacci-list", kwargs={"number": 1000}), {"page": 10, "page_size": 10}
+            )
+            self.assertEqual(response.status_code, 200)
+
+        self.assertListEqual(
+            [item["value"] for item in response.json()["data"]["results"]],
+            [self.table.get_fib_number(idx) for idx in range(90, 100)],
+        )
@@ -0,0 +1,78 @@
+import json
+import random
+import sys
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.utils.json_encoders import (
+    DECIMAL_THRESHOLD_BITS,
+    IntegerTooLongError,
+    LargeIntJSONEncoder,
+    int_to_decimal_str,
+)
+
+
+class LargeIntEncodingTests(SimpleTestCase):
+
+    def setUp(self):
+        # Lifted only to compare against `str()` and to parse the rendered payloads
+        self.max_str_digits = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+
+    def tearDown(self):
+        sys.set_int_max_str_digits(self.max_str_digits)
+
+    def test_int_to_decimal_str_matches_str(self):
+        """Test the divide-and-conquer conversion matches `str()` for small and large values."""
+        rng = random.Random(42)
+        for bits in (1, 64, DECIMAL_THRESHOLD_BITS, DECIMAL_THRESHOLD_BITS + 1, 20_000, 65_537):
+            value = rng.getrandbits(bits) | (1 << (bits - 1))
+            self.assertEqual(int_to_decimal_str(value), str(value), msg=f"{bits} bits")
+            self.assertEqual(int_to_decimal_str(-value), str(-value), msg=f"{bits} bits")
+
+        for value in (0, 10**20_000, 10**20_000 - 1):
+            self.assertEqual(int_to_decimal_str(value), str(value))
+
+    def test_int_to_decimal_str_digit_limit(self):
+        """Test values with more digits than allowed are rejected."""
+        self.assertEqual(int_to_decimal_str(10**9999, max_digits=10_000), str(10**9999))
+        with self.assertRaises(IntegerTooLongError):
+            int_to_decimal_str(10**10_000, max_digits=10_000)
+        with self.assertRaises(IntegerTooLongError):
+            int_to_decimal_str(10**50_000, max_digits=10_000)
+
+    def test_encoder_keeps_large_ints_as_numbers(self):
+        """Test large ints nested in the payload are rendered as JSON numbers."""
+        value = FibonacciSequenceService().get_fib_number(50_000)
+        data = {"results": [{"number": 50_001, "value": value}], "flag": True, "value": 1}
+
+        self.assertEqual(json.loads(json.dumps(data, cls=LargeIntJSONEncoder)), data)
+
+
+class LargeIntResponseTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_get_fib_number_beyond_int_max_str_digits(self):
+        """Test values longer than the interpreter digit limit are rendered instead of failing."""
+        response = self.client.get(reverse("fibonacci-number", args=[30_001]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        digits = response.content.split(b'"value": ')[1].rstrip(b"}")
+        self.assertGreater(len(digits), sys.get_int_max_str_digits())
+        self.assertEqual(
+            int_to_decimal_str(FibonacciSequenceService().get_fib_number(30_000)).encode(), digits
+        )
+
+    def test_get_fib_number_exceeding_digit_limit(self):
+        """Test values longer than the configured digit limit are rejected upfront."""
+        with mock.patch.object(FibonacciComputationExecutor, "max_result_digits", 1000):
+            response = self.client.get(reverse("fibonacci-number", args=[5000]))
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
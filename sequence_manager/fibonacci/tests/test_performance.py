@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+import tracemalloc
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.services import BlacklistService
+
+
+# Budgets generous enough for a slow CI box, yet orders of magnitude below the cost of
+# materialising the sequences requested below
+LIST_TIME_BUDGET = 2.0
+LIST_MEMORY_BUDGET = 16 * 1024 * 1024
+
+
+class QueryCountTests(TestCase):
+    """Pins the database round trips of the read endpoints once the blacklist cache is warm."""
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+        BlacklistService.snapshot_cache.clear()
+        BlacklistService().add_many_to_blacklist([3, 5])
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        BlacklistService.snapshot_cache.clear()
+
+    def assert_warm_queries(self, num: int, url: str, data: dict | None = None, **headers):
+        """Sends a request to warm the caches up, then asserts the queries of a second one."""
+        response = self.client.get(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(num):
+            response = self.client.get(url, data, headers=headers)
+        return response
+
+    def test_single_endpoint(self):
+        """Test the single-value endpoint only checks the blacklist version."""
+        self.assert_warm_queries(1, reverse("fibonacci-number", args=[100]))
+        self.assert_warm_queries(1, reverse("fibonacci-number", args=[100]), {"mod": 1000})
+
+    def test_list_and_range_endpoints(self):
+        """Test the list and range endpoints only check the blacklist version."""
+        self.assert_warm_queries(1, reverse("fibonacci-list", args=[1000]), {"page": 3})
+        self.assert_warm_queries(1, reverse("fibonacci-range", args=[500, 900]))
+        self.assert_warm_queries(
+            1, reverse("fibonacci-list", args=[1000]), {"pagination": "cursor"}
+        )
+
+    def test_not_modified(self):
+        """Test a revalidated request costs a single query as well."""
+        url = reverse("fibonacci-list", args=[1000])
+        etag = self.client.get(url)["ETag"]
+
+        response = self.assert_warm_queries(1, url, If_None_Match=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_no_queries_within_version_check_interval(self):
+        """Test no query is made while the version check interval has not elapsed."""
+        with mock.patch.object(BlacklistService.snapshot_cache, "version_check_interval", 60):
+            self.assert_warm_queries(0, reverse("fibonacci-number", args=[100]))
+            self.assert_warm_queries(0, reverse("fibonacci-list", args=[1000]), {"page": 3})
+            self.assert_warm_queries(0, reverse("fibonacci-range", args=[500, 900]))
+
+
+class ListBudgetTests(TestCase):
+    """Fails if the list endpoints go back to materialising the whole sequence."""
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+        BlacklistService.snapshot_cache.clear()
+        BlacklistService().add_many_to_blacklist(range(2, 2000, 2))
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        BlacklistService.snapshot_cache.clear()
+
+    def assert_within_budgets(self, func):
+        """Runs the function and asserts its duration and its memory peak."""
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        try:
+            result = func()
+            duration = time.perf_counter() - started_at
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(duration, LIST_TIME_BUDGET)
+        self.assertLess(peak_memory, LIST_MEMORY_BUDGET)
+        return result
+
+    def test_page_of_a_huge_list(self):
+        """Test a page of a ten-million-position list is served within the budgets."""
+        url = reverse("fibonacci-list", args=[10_000_000])
+
+        response = self.assert_within_budgets(
+            lambda: self.client.get(url, {"page": 50, "page_size": 100})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(data["count"], 10_000_000 - 999)
+        self.assertEqual(data["results"][0]["number"], 5900)
+
+    def test_page_of_a_far_range(self):
+        """Test a page far into the sequence is served without walking up to it."""
+        url = reverse("fibonacci-range", args=[200_000, 10_000_000])
+
+        response = self.assert_within_budgets(lambda: self.client.get(url, {"page_size": 10}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'"results": [{"number": 200000, "value": ', response.content)
+
+    def test_stream_of_a_huge_list(self):
+        """Test the first records of a ten-million-position stream are produced lazily."""
+        url = reverse("fibonacci-list", args=[10_000_000])
+
+        def read_first_records():
+            response = self.client.get(url, {"format": "ndjson"})
+            content = response.streaming_content
+            return response, [next(content) for _ in range(2000)]
+
+        response, records = self.assert_within_budgets(read_first_records)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(records[-1])["number"], 2999)
@@ -0,0 +1,129 @@
+import logging
+import os
+import pstats
+import tempfile
+import tracemalloc
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.utils.middleware import ProfilingMiddleware
+
+
+class ProfilingMiddlewareTests(TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.url = reverse("fibonacci-list", args=[200])
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.tmp_dir.cleanup()
+
+    def get(self, headers=None, url=None, **settings):
+        """Sends a list request through a client whose middleware uses the given settings."""
+        settings = {
+            "profile_dir": self.tmp_dir.name,
+            "header_token": "secret",
+            "sample_rate": 0,
+            "latency_threshold": 0,
+            **settings,
+        }
+        with mock.patch.multiple(ProfilingMiddleware, **settings):
+            response = APIClient().get(url or self.url, headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_disabled_without_directory_or_trigger(self):
+        """Test the middleware removes itself when profiling is not configured."""
+        for settings in ({"profile_dir": ""}, {"header_token": "", "sample_rate": 0}):
+            with (
+                mock.patch.multiple(ProfilingMiddleware, **settings),
+                self.assertRaises(MiddlewareNotUsed),
+            ):
+                ProfilingMiddleware(lambda request: None)
+
+    def test_cpu_profile_with_privileged_header(self):
+        """Test a request with the profiling token dumps its pstats file."""
+        response = self.get(headers={"X-Profile-Token": "secret"})
+
+        dump_path = os.path.join(self.tmp_dir.name, response["X-Profile-Dump"])
+        self.assertRegex(response["X-Profile-Dump"], r"-fibonacci-list-\d+ms-[0-9a-f]{8}\.prof$")
+        stats = pstats.Stats(dump_path)
+        self.assertTrue(any("get_items_from" in func[2] for func in stats.stats))
+
+    def test_memory_snapshot(self):
+        """Test the memory mode dumps a tracemalloc snapshot."""
+        response = self.get(headers={"X-Profile-Token": "secret", "X-Profile-Mode": "memory"})
+
+        self.assertTrue(response["X-Profile-Dump"].endswith(".snapshot"))
+        snapshot = tracemalloc.Snapshot.load(
+            os.path.join(self.tmp_dir.name, response["X-Profile-Dump"])
+        )
+        self.assertTrue(snapshot.statistics("filename"))
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_sampled_requests(self):
+        """Test requests are profiled according to the sample rate."""
+        response = self.get(sample_rate=1, header_token="")
+        self.assertIn("X-Profile-Dump", response)
+
+    def test_no_dump(self):
+        """Test requests with a wrong token or below the latency threshold are not dumped."""
+        response = self.get(headers={"X-Profile-Token": "wrong"})
+        self.assertNotIn("X-Profile-Dump", response)
+
+        response = self.get(headers={"X-Profile-Token": "secret"}, latency_threshold=60)
+        self.assertNotIn("X-Profile-Dump", response)
+
+        self.assertListEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_async_views_are_not_cpu_profiled(self):
+        """Test requests to async views are not dumped with an empty CPU profile."""
+        url = reverse("async-fibonacci-list", args=[200])
+        response = self.get(headers={"X-Profile-Token": "secret"}, url=url)
+        self.assertNotIn("X-Profile-Dump", response)
+        self.assertListEqual(os.listdir(self.tmp_dir.name), [])
+
+        response = self.get(
+            headers={"X-Profile-Token": "secret", "X-Profile-Mode": "memory"}, url=url
+        )
+        self.assertTrue(response["X-Profile-Dump"].endswith(".snapshot"))
+
+    async def test_async_middleware_chain(self):
+        """Test profiling works in an async chain, which unprofiled requests pass without a hop."""
+        settings = {
+            "profile_dir": self.tmp_dir.name,
+            "header_token": "secret",
+            "sample_rate": 0,
+            "latency_threshold": 0,
+        }
+        with mock.patch.multiple(ProfilingMiddleware, **settings):
+            self.assertTrue(iscoroutinefunction(ProfilingMiddleware(self.async_get_response)))
+
+            client = AsyncClient()
+            with mock.patch("sequence_manager.utils.middleware.sync_to_async") as sync_to_async:
+                response = await client.get(self.url)
+                response = await client.get(
+                    reverse("async-fibonacci-list", args=[200]),
+                    headers={"X-Profile-Token": "secret"},
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("X-Profile-Dump", response)
+            sync_to_async.assert_not_called()
+
+            response = await client.get(self.url, headers={"X-Profile-Token": "secret"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = pstats.Stats(os.path.join(self.tmp_dir.name, response["X-Profile-Dump"]))
+        self.assertTrue(any("get_items_from" in func[2] for func in stats.stats))
+
+    @staticmethod
+    async def async_get_response(request):
+        return None
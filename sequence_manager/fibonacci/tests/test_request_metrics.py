@@ -0,0 +1,141 @@
+import logging
+import re
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.services import BlacklistService, FibonacciSequenceService
+from sequence_manager.fibonacci.utils.blacklist_cache import BlacklistSnapshotCache
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+from sequence_manager.fibonacci.utils.single_flight import SingleFlight
+from sequence_manager.utils.metrics import (
+    Histogram,
+    registry,
+    start_request_timings,
+    stop_request_timings,
+    timed_phase,
+)
+
+
+class MetricsTests(SimpleTestCase):
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test histograms are rendered with cumulative buckets, their sum and count."""
+        histogram = Histogram("latency_seconds", "Latency.", ("endpoint",), buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(("list",), value)
+
+        self.assertListEqual(
+            list(histogram.collect()),
+            [
+                'latency_seconds_bucket{endpoint="list",le="0.1"} 2',
+                'latency_seconds_bucket{endpoint="list",le="1"} 3',
+                'latency_seconds_bucket{endpoint="list",le="+Inf"} 4',
+                'latency_seconds_sum{endpoint="list"} 3.65',
+                'latency_seconds_count{endpoint="list"} 4',
+            ],
+        )
+
+    def test_timed_phase(self):
+        """Test phases are only recorded within a request and nested phases are counted once."""
+        with timed_phase("compute"):
+            pass
+
+        timings, token = start_request_timings()
+        try:
+            with timed_phase("compute"):
+                with timed_phase("compute"):
+                    pass
+                with timed_phase("serialize"):
+                    pass
+        finally:
+            stop_request_timings(token)
+
+        self.assertListEqual(list(timings.phases), ["serialize", "compute"])
+        self.assertGreater(timings.phases["compute"], timings.phases["serialize"])
+
+
+class RequestTimingMiddlewareTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        logging.disable(logging.CRITICAL)
+        registry.clear()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        registry.clear()
+
+    def test_server_timing_header(self):
+        """Test responses report the time spent in every phase of the request."""
+        with mock.patch.object(FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)):
+            response = self.client.get(reverse("fibonacci-number", args=[1000]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        phases = dict(
+            re.match(r"(\w+);dur=([\d.]+)", entry).groups()
+            for entry in response["Server-Timing"].split(", ")
+        )
+        self.assertTrue(
+            {"validate", "blacklist", "compute", "serialize", "db", "total"} <= set(phases)
+        )
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="\d+ quer(y|ies)"')
+        self.assertGreaterEqual(
+            float(phases["total"]),
+            max(float(duration) for name, duration in phases.items() if name != "total"),
+        )
+
+    def test_metrics_endpoint(self):
+        """Test the request counters and histograms are exposed in the Prometheus text format."""
+        self.client.get(reverse("fibonacci-number", args=[10]))
+        self.client.get(reverse("fibonacci-number", args=[0]))
+        self.client.get(reverse("fibonacci-list", args=[20]))
+
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+
+        content = response.content.decode()
+        self.assertIn("# TYPE http_request_duration_seconds histogram", content)
+        self.assertIn(
+            'http_requests_total{endpoint="fibonacci-number",method="GET",status="200"} 1', content
+        )
+        self.assertIn(
+            'http_requests_total{endpoint="fibonacci-number",method="GET",status="400"} 1', content
+        )
+        self.assertIn(
+            'http_request_duration_seconds_count{endpoint="fibonacci-list",method="GET"} 1', content
+        )
+        self.assertIn(
+            'http_request_phase_duration_seconds_count{endpoint="fibonacci-list",phase="compute"} 1',
+            content,
+        )
+        self.assertRegex(content, r'http_request_db_queries_sum\{endpoint="fibonacci-list"\} [1-9]')
+        self.assertIn('http_response_size_bytes_count{endpoint="fibonacci-list"} 1', content)
+
+    def test_cache_metrics(self):
+        """Test the result cache, coalescing and blacklist snapshot stats are exposed."""
+        with (
+            mock.patch.multiple(
+                FibonacciSequenceService,
+                result_cache=ByteBudgetLRUCache(1024),
+                single_flight=SingleFlight(),
+            ),
+            mock.patch.object(BlacklistService, "snapshot_cache", BlacklistSnapshotCache()),
+        ):
+            self.client.get(reverse("fibonacci-number", args=[1000]))
+            self.client.get(reverse("fibonacci-number", args=[1000]))
+            content = self.client.get(reverse("metrics")).content.decode()
+
+        self.assertIn("# TYPE fib_result_cache_lookups_total counter", content)
+        self.assertIn('fib_result_cache_lookups_total{result="hit"} 1', content)
+        self.assertIn('fib_result_cache_lookups_total{result="miss"} 1', content)
+        self.assertIn("fib_result_cache_entries 1", content)
+        self.assertIn('fib_result_cache_bytes{kind="max"} 1024', content)
+        self.assertIn("# TYPE fib_coalescing_calls_total counter", content)
+        self.assertIn("fib_coalescing_in_flight 0", content)
+        self.assertIn('blacklist_snapshot_lookups_total{result="miss"} 1', content)
+        self.assertIn("blacklist_snapshot_size 0", content)
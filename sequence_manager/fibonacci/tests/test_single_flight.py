@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache
+from sequence_manager.fibonacci.utils.sequences import FibonacciNumberSequence
+from sequence_manager.fibonacci.utils.single_flight import SingleFlight
+
+
+class SingleFlightTests(SimpleTestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.release = threading.Event()
+
+    def wait_for_calls(self, count: int):
+        deadline = time.monotonic() + 5
+        while self.single_flight.calls < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def run_concurrently(self, count: int, func, *args) -> list:
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            futures = [pool.submit(self.single_flight.do, "key", func, *args) for _ in range(count)]
+            self.wait_for_calls(count)
+            self.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    def test_concurrent_threads_share_one_execution(self):
+        """Test concurrent calls with the same key are computed once and share the result."""
+        compute = mock.Mock(side_effect=lambda: self.release.wait() and object())
+
+        results = self.run_concurrently(8, compute)
+
+        compute.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertDictEqual(
+            self.single_flight.get_stats(),
+            {"calls": 8, "executions": 1, "coalesced": 7, "in_flight": 0},
+        )
+
+    def test_exception_is_shared(self):
+        """Test every coalesced caller receives the exception raised by the execution."""
+
+        def compute():
+            self.release.wait()
+            raise ValueError("failed")
+
+        results = self.run_concurrently(4, compute)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(self.single_flight.executions, 1)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test a finished execution is forgotten, so the next call computes again."""
+        self.assertEqual(self.single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(self.single_flight.do("key", lambda: 2), 2)
+        self.assertEqual(self.single_flight.do("other", lambda: 3), 3)
+        self.assertEqual(self.single_flight.coalesced, 0)
+
+    def test_concurrent_tasks_share_one_execution(self):
+        """Test concurrent asyncio tasks with the same key are computed once."""
+        compute = mock.AsyncMock(return_value=42)
+
+        async def run():
+            return await asyncio.gather(
+                *(self.single_flight.ado("key", compute) for _ in range(5)),
+                self.single_flight.ado("other", compute),
+            )
+
+        self.assertListEqual(asyncio.run(run()), [42] * 6)
+        self.assertEqual(compute.await_count, 2)
+        self.assertDictEqual(
+            self.single_flight.get_stats(),
+            {"calls": 6, "executions": 2, "coalesced": 4, "in_flight": 0},
+        )
+
+    def test_cancelled_task_does_not_cancel_shared_execution(self):
+        """Test cancelling the task that started an execution does not cancel it for others."""
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def run():
+            first = asyncio.ensure_future(self.single_flight.ado("key", compute))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(self.single_flight.ado("key", compute))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()), 42)
+
+
+class FibonacciCoalescingTests(SimpleTestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.patches = [
+            mock.patch.object(FibonacciSequenceService, "single_flight", self.single_flight),
+            mock.patch.object(FibonacciSequenceService, "coalesce_threshold", 100),
+            mock.patch.object(FibonacciSequenceService, "result_cache", ByteBudgetLRUCache(0)),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_small_indexes_are_not_coalesced(self):
+        """Test indexes below the threshold bypass the single-flight."""
+        FibonacciComputationExecutor().get_fib_number(99)
+        FibonacciSequenceService().get_fib_pair(99)
+        self.assertEqual(self.single_flight.calls, 0)
+
+    def test_executor_coalesces_same_index(self):
+        """Test concurrent executor calls for the same index share one computation."""
+        executor = FibonacciComputationExecutor()
+        expected = FibonacciSequenceService().get_fib_number(500)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            with mock.patch.object(
+                FibonacciComputationExecutor,
+                "_compute_fib_number",
+                side_effect=lambda index: time.sleep(0.05) or expected,
+            ) as compute:
+                results = list(pool.map(executor.get_fib_number, [500] * 4))
+
+        self.assertListEqual(results, [expected] * 4)
+        self.assertLess(compute.call_count, 4)
+        self.assertEqual(self.single_flight.coalesced, 4 - compute.call_count)
+
+    def test_executor_coalesces_same_index_async(self):
+        """Test concurrent async executor calls for the same index share one computation."""
+        executor = FibonacciComputationExecutor()
+
+        async def run():
+            return await asyncio.gather(*(executor.aget_fib_number(500) for _ in range(3)))
+
+        results = asyncio.run(run())
+
+        self.assertDictEqual(
+            FibonacciSequenceService().get_coalescing_stats(),
+            {"calls": 3, "executions": 1, "coalesced": 2, "in_flight": 0},
+        )
+        self.assertListEqual(results, [FibonacciSequenceService().get_fib_number(500)] * 3)
+
+    def test_sequence_window_is_coalesced(self):
+        """Test windows of a large sequence are computed through the single-flight."""
+        fib_nums = FibonacciNumberSequence(1000, start=200)
+
+        window = fib_nums[:5]
+
+        # The window itself and the jump seeding it
+        self.assertEqual(self.single_flight.executions, 2)
+        self.assertListEqual(window, list(fib_nums)[:5])
@@ -1,8 +1,17 @@
 from django.urls import path
 
+from sequence_manager.fibonacci.async_views import (
+    AsyncBlacklistNumberView,
+    AsyncFibonacciNumberListView,
+    AsyncFibonacciNumberRangeView,
+    AsyncFibonacciNumberView,
+)
 from sequence_manager.fibonacci.views import (
+    BlacklistBulkView,
     BlacklistNumberView,
+    FibonacciNumberBatchView,
     FibonacciNumberListView,
+    FibonacciNumberRangeView,
     FibonacciNumberView,
 )
 
@@ -14,5 +23,32 @@ urlpatterns = [
         FibonacciNumberListView.as_view(),
         name="fibonacci-list",
     ),
+    path(
+        "api/v1/fibonacci/range/<int:start>/<int:end>/",
+        FibonacciNumberRangeView.as_view(),
+        name="fibonacci-range",
+    ),
+    path("api/v1/fibonacci/batch/", FibonacciNumberBatchView.as_view(), name="fibonacci-batch"),
     path("api/v1/blacklist/<int:number>/", BlacklistNumberView.as_view(), name="manage-blacklist"),
+    path("api/v1/blacklist/bulk/", BlacklistBulkView.as_view(), name="manage-blacklist-bulk"),
+    path(
+        "api/v1/async/fibonacci/<int:number>/",
+        AsyncFibonacciNumberView.as_view(),
+        name="async-fibonacci-number",
+    ),
+    path(
+        "api/v1/async/fibonacci/list/<int:number>/",
+        AsyncFibonacciNumberListView.as_view(),
+        name="async-fibonacci-list",
+    ),
+    path(
+        "api/v1/async/fibonacci/range/<int:start>/<int:end>/",
+        AsyncFibonacciNumberRangeView.as_view(),
+        name="async-fibonacci-range",
+    ),
+    path(
+        "api/v1/async/blacklist/<int:number>/",
+        AsyncBlacklistNumberView.as_view(),
+        name="async-manage-blacklist",
+    ),
 ]
@@ -9,3 +9,18 @@ class BlacklistConflictApiException(APIException):
 class BlacklistNotFoundApiException(APIException):
     status_code = 404
     default_detail = "This number is not found in the blacklist."
+
+
+class ComputationTooLargeApiException(APIException):
+    status_code = 413
+    default_detail = "The requested Fibonacci number exceeds the allowed result size."
+
+
+class ResponseTooLargeApiException(APIException):
+    status_code = 413
+    default_detail = "The requested Fibonacci numbers together exceed the allowed response size."
+
+
+class ComputationUnavailableApiException(APIException):
+    status_code = 503
+    default_detail = "The requested Fibonacci number could not be computed in time."
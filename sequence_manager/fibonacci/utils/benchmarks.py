@@ -0,0 +1,229 @@
+import json
+import math
+import platform
+import random
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+
+import django
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from sequence_manager.fibonacci.services import BlacklistService, FibonacciSequenceService
+from sequence_manager.utils.json_encoders import LargeIntJSONEncoder
+
+
+# Blacklist lookups are too fast to be timed one by one, so every sample times a batch of them
+BLACKLIST_LOOKUPS_PER_SAMPLE = 100
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings (in milliseconds) and memory peak (in bytes) of a benchmark scenario."""
+
+    name: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    peak_memory_bytes: int
+
+
+def get_percentile(sorted_samples: list[float], percentile: float) -> float:
+    """Returns the nearest-rank percentile of samples sorted in ascending order."""
+    rank = math.ceil(percentile / 100 * len(sorted_samples))
+    return sorted_samples[min(max(rank, 1), len(sorted_samples)) - 1]
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], object] | None = None,
+) -> BenchmarkResult:
+    """Times a scenario and measures the memory it allocates at its peak.
+
+    The scenario first runs once untimed under `tracemalloc`, which also warms it up. It then runs
+    `repeat` timed times without tracing, as tracing slows allocations down considerably.
+
+    Args:
+        name (str): The name of the scenario.
+        func (Callable[[], object]): Runs the scenario once.
+        repeat (int): The number of timed runs.
+        setup (Callable[[], object] | None, optional): Runs untimed before every run, e.g. to
+            clear caches so that every run measures the cold path.
+
+    Returns:
+        BenchmarkResult: The percentiles of the timings and the memory peak.
+    """
+    if setup is not None:
+        setup()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+    func()
+    peak_memory = tracemalloc.get_traced_memory()[1] - baseline_memory
+    if not was_tracing:
+        tracemalloc.stop()
+
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started_at = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started_at) * 1000)
+
+    samples.sort()
+    return BenchmarkResult(
+        name=name,
+        samples=len(samples),
+        p50_ms=round(get_percentile(samples, 50), 4),
+        p95_ms=round(get_percentile(samples, 95), 4),
+        min_ms=round(samples[0], 4),
+        max_ms=round(samples[-1], 4),
+        peak_memory_bytes=max(peak_memory, 0),
+    )
+
+
+def run_benchmarks(
+    repeat: int = 20,
+    fib_indexes: Iterable[int] = (1_000, 100_000, 1_000_000),
+    all_fib_indexes: Iterable[int] = (1_000, 10_000),
+    page_depths: Iterable[int] = (1, 100, 1_000),
+    blacklist_sizes: Iterable[int] = (0, 1_000, 100_000, 1_000_000),
+    json_indexes: Iterable[int] = (10_000, 100_000, 1_000_000),
+    page_size: int = 100,
+    log: Callable[[str], object] | None = None,
+) -> dict:
+    """Runs the benchmark scenarios of the hot paths against the current database.
+
+    The scenarios time the Fibonacci service, the list endpoint at several page depths through the
+    in-process test client, blacklist lookups and snapshot reloads with blacklists of growing size
+    and the JSON rendering of large values. Blacklisted numbers are added to the database, so this
+    must only run against a disposable database.
+
+    Args:
+        repeat (int, optional): The number of timed runs of every scenario.
+        fib_indexes (Iterable[int], optional): The indexes timed with `get_fib_number`, each run
+            starts with an empty result cache.
+        all_fib_indexes (Iterable[int], optional): The indexes timed with `get_all_fib_numbers`.
+        page_depths (Iterable[int], optional): The page numbers requested from the list endpoint.
+        blacklist_sizes (Iterable[int], optional): The sizes of the blacklists, in ascending order.
+        json_indexes (Iterable[int], optional): The indexes whose values are rendered to JSON.
+        page_size (int, optional): The page size of the list requests.
+        log (Callable[[str], object] | None, optional): Called with the name of every scenario
+            before it runs.
+
+    Returns:
+        dict: The environment of the run and the results of the scenarios keyed by their name.
+    """
+    client = APIClient()
+    fib_service = FibonacciSequenceService()
+    blacklist_service = BlacklistService()
+    rng = random.Random(42)
+    results: list[BenchmarkResult] = []
+
+    def run(name: str, func: Callable[[], object], setup: Callable[[], object] | None = None):
+        if log is not None:
+            log(name)
+        results.append(measure(name, func, repeat, setup=setup))
+
+    def get_list_page(number: int, page: int):
+        response = client.get(
+            reverse("fibonacci-list", args=[number]), {"page": page, "page_size": page_size}
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"The list request failed with status {response.status_code}.")
+        return response.content
+
+    for index in fib_indexes:
+        run(
+            f"get_fib_number[{index}]",
+            lambda index=index: fib_service.get_fib_number(index),
+            setup=fib_service.result_cache.clear,
+        )
+
+    for index in all_fib_indexes:
+        run(
+            f"get_all_fib_numbers[{index}]",
+            lambda index=index: fib_service.get_all_fib_numbers(index),
+        )
+
+    list_number = max(page_depths, default=1) * page_size
+    for page in page_depths:
+        run(f"list_page[page={page}]", lambda page=page: get_list_page(list_number, page))
+
+    blacklist_size = 0
+    for size in sorted(blacklist_sizes):
+        # Every other position is blacklisted, so the blacklist covers the requested pages
+        if size > blacklist_size:
+            blacklist_service.add_many_to_blacklist(range(2 * blacklist_size + 2, 2 * size + 1, 2))
+            blacklist_size = size
+
+        lookups = [rng.randint(1, 2 * size + 2) for _ in range(BLACKLIST_LOOKUPS_PER_SAMPLE)]
+        run(
+            f"blacklist_lookup[size={size}]",
+            lambda lookups=lookups: [blacklist_service.is_blacklisted(num) for num in lookups],
+        )
+        run(
+            f"blacklist_reload[size={size}]",
+            blacklist_service.get_blacklist_index,
+            setup=blacklist_service.snapshot_cache.invalidate,
+        )
+        run(f"list_page[blacklist={size}]", lambda: get_list_page(2 * page_size, 1))
+
+    for index in json_indexes:
+        payload = {"number": index + 1, "value": fib_service.get_fib_number(index)}
+        run(
+            f"render_json[{index}]",
+            lambda payload=payload: json.dumps(payload, cls=LargeIntJSONEncoder),
+        )
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "scenarios": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float = 0.2) -> dict:
+    """Compares benchmark results with a saved baseline run.
+
+    Args:
+        results (dict): The output of `run_benchmarks`.
+        baseline (dict): A previous output of `run_benchmarks`.
+        tolerance (float, optional): The relative slowdown of the p50 or p95 timings (or growth of
+            the memory peak) above which a scenario is reported as a regression.
+
+    Returns:
+        dict: The ratios to the baseline of every scenario present in both runs, and the names of
+            the regressed scenarios.
+    """
+    ratios = {}
+    regressions = []
+    baseline_scenarios = baseline.get("scenarios", {})
+
+    for name, result in results["scenarios"].items():
+        base = baseline_scenarios.get(name)
+        if base is None:
+            continue
+
+        ratios[name] = {
+            key: round(result[key] / base[key], 4) if base[key] else None
+            for key in ("p50_ms", "p95_ms", "peak_memory_bytes")
+        }
+        if any(ratio is not None and ratio > 1 + tolerance for ratio in ratios[name].values()):
+            regressions.append(name)
+
+    return {"tolerance": tolerance, "ratios": ratios, "regressions": regressions}
@@ -0,0 +1,191 @@
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sequence_manager.fibonacci.utils.blacklist_index import BlacklistIndex
+
+
+@dataclass(frozen=True)
+class BlacklistSnapshot:
+    """Immutable in-memory copy of the blacklist at a given version."""
+
+    version: int
+    updated_at: datetime | None
+    numbers: frozenset[int]
+    index: BlacklistIndex
+
+
+class BlacklistSnapshotCache:
+    """Process-wide cache of the blacklist keyed by the blacklist version.
+
+    Readers pass callables returning the current version state, i.e. the version and the time it
+    was last modified, and the blacklisted numbers. The numbers are only loaded again when the
+    version differs from the one of the cached snapshot, so a hot read costs at most a single
+    primary key lookup. When `version_check_interval` is positive, the
+    version itself is only re-read once the interval (in seconds) has elapsed.
+    """
+
+    def __init__(self, version_check_interval: float = 0):
+        self.version_check_interval = version_check_interval
+        self._lock = threading.Lock()
+        self._snapshot: BlacklistSnapshot | None = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def get(
+        self,
+        get_version_state: Callable[[], tuple[int, datetime | None]],
+        load_numbers: Callable[[], Iterable[int]],
+    ) -> BlacklistSnapshot:
+        """Returns the up-to-date blacklist snapshot, reloading it if the version has changed.
+
+        Args:
+            get_version_state (Callable[[], tuple[int, datetime | None]]): Returns the current
+                blacklist version and the time it was last modified.
+            load_numbers (Callable[[], Iterable[int]]): Returns all blacklisted numbers.
+
+        Returns:
+            BlacklistSnapshot: The snapshot matching the current version.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_check_skippable():
+            self.hits += 1
+            return snapshot
+
+        # The version is read before the numbers, so a concurrent write can only make the
+        # snapshot newer than its version, which results in an extra reload and never a stale read
+        version, updated_at = get_version_state()
+        if snapshot is not None and snapshot.version == version:
+            self._checked_at = time.monotonic()
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            self.misses += 1
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                numbers = frozenset(load_numbers())
+                snapshot = BlacklistSnapshot(version, updated_at, numbers, BlacklistIndex(numbers))
+                self._snapshot = snapshot
+                self.reloads += 1
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    async def aget(
+        self,
+        get_version_state: Callable[[], Awaitable[tuple[int, datetime | None]]],
+        load_numbers: Callable[[], Awaitable[Iterable[int]]],
+    ) -> BlacklistSnapshot:
+        """Async version of `get` taking coroutine functions instead of callables.
+
+        No lock is held while awaiting, so concurrent tasks noticing the same version change may
+        reload the snapshot more than once. Like with `get`, the version is read before the numbers.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_check_skippable():
+            self.hits += 1
+            return snapshot
+
+        version, updated_at = await get_version_state()
+        if snapshot is not None and snapshot.version == version:
+            self._checked_at = time.monotonic()
+            self.hits += 1
+            return snapshot
+
+        self.misses += 1
+        numbers = frozenset(await load_numbers())
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = BlacklistSnapshot(version, updated_at, numbers, BlacklistIndex(numbers))
+                self._snapshot = snapshot
+                self.reloads += 1
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    def invalidate(self):
+        """Drops the cached snapshot so that the next read reloads it."""
+        with self._lock:
+            self._snapshot = None
+
+    def clear(self):
+        """Drops the cached snapshot and resets the counters."""
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+            self.hits = self.misses = self.reloads = 0
+
+    def get_stats(self) -> dict:
+        """Returns the cache counters and the version of the cached snapshot.
+
+        Returns:
+            dict: The hit, miss and reload counters, the cached version and its size.
+        """
+        snapshot = self._snapshot
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "version": snapshot.version if snapshot is not None else None,
+            "size": len(snapshot.numbers) if snapshot is not None else 0,
+        }
+
+    def _is_check_skippable(self) -> bool:
+        if self.version_check_interval <= 0:
+            return False
+        return time.monotonic() - self._checked_at < self.version_check_interval
+
+
+class BlacklistVersionStateCache:
+    """Process-wide cache of the blacklist version state read from the database.
+
+    It lets readers which do not go through the snapshot cache, such as the array store, compare
+    their data with the database. With a positive `version_check_interval`, the state is only read
+    again once the interval (in seconds) has elapsed, otherwise it is read on every call.
+    """
+
+    def __init__(self, version_check_interval: float = 0):
+        self.version_check_interval = version_check_interval
+        self._state: tuple[int, datetime | None] | None = None
+        self._checked_at = 0.0
+
+    def get(
+        self, get_version_state: Callable[[], tuple[int, datetime | None]]
+    ) -> tuple[int, datetime | None]:
+        """Returns the cached version state, reading it again once the interval has elapsed.
+
+        Args:
+            get_version_state (Callable[[], tuple[int, datetime | None]]): Returns the current
+                blacklist version and the time it was last modified.
+
+        Returns:
+            tuple[int, datetime | None]: The blacklist version and its modification time.
+        """
+        state = self._state
+        if state is None or not self._is_check_skippable():
+            state = get_version_state()
+            self._state, self._checked_at = state, time.monotonic()
+        return state
+
+    async def aget(
+        self, get_version_state: Callable[[], Awaitable[tuple[int, datetime | None]]]
+    ) -> tuple[int, datetime | None]:
+        """Async version of `get` taking a coroutine function instead of a callable."""
+        state = self._state
+        if state is None or not self._is_check_skippable():
+            state = await get_version_state()
+            self._state, self._checked_at = state, time.monotonic()
+        return state
+
+    def invalidate(self):
+        """Drops the cached state so that the next read queries it."""
+        self._state = None
+
+    def _is_check_skippable(self) -> bool:
+        if self.version_check_interval <= 0:
+            return False
+        return time.monotonic() - self._checked_at < self.version_check_interval
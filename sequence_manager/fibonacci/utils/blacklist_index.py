@@ -0,0 +1,60 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+
+class BlacklistIndex:
+    """Index over the sorted blacklisted positions of the Fibonacci sequence.
+
+    The index answers membership, counting and offset-to-position questions in O(log b), where b
+    is the number of blacklisted positions. This allows the paginators to find the exact number
+    of visible items and the real position of any page offset without walking the sequence.
+    """
+
+    def __init__(self, blacklisted_numbers: Iterable[int] = ()):
+        """Initializes the index.
+
+        Args:
+            blacklisted_numbers (Iterable[int], optional): The blacklisted positions (1-based).
+                Defaults to ().
+        """
+        self._numbers = sorted(set(blacklisted_numbers))
+        # `number - idx` is non-decreasing for distinct sorted numbers, which lets us bisect on the
+        # count of blacklisted positions preceding a visible one
+        self._shifted_numbers = [number - idx for idx, number in enumerate(self._numbers)]
+
+    def __contains__(self, number: int) -> bool:
+        idx = bisect_left(self._numbers, number)
+        return idx < len(self._numbers) and self._numbers[idx] == number
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __iter__(self):
+        return iter(self._numbers)
+
+    def count_blacklisted(self, start: int, stop: int) -> int:
+        """Returns the number of blacklisted positions within `start`..`stop` (inclusive)."""
+        if stop < start:
+            return 0
+        return bisect_right(self._numbers, stop) - bisect_left(self._numbers, start)
+
+    def count_visible(self, start: int, stop: int) -> int:
+        """Returns the number of non-blacklisted positions within `start`..`stop` (inclusive)."""
+        if stop < start:
+            return 0
+        return stop - start + 1 - self.count_blacklisted(start, stop)
+
+    def get_position(self, offset: int, start: int = 1) -> int:
+        """Maps a 0-based offset among the visible positions to the real sequence position.
+
+        Args:
+            offset (int): The 0-based offset among the visible positions counted from `start`.
+            start (int, optional): The first position (1-based) the offset is relative to.
+                Defaults to 1.
+
+        Returns:
+            int: The position of the `offset`-th visible position that is not less than `start`.
+        """
+        # Rank of the requested position among all visible positions starting from 1
+        rank = start - 1 - bisect_left(self._numbers, start) + offset + 1
+        return rank + bisect_right(self._shifted_numbers, rank)
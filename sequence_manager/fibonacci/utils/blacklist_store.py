@@ -0,0 +1,127 @@
+import fcntl
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+
+
+class BlacklistArrayStore:
+    """Blacklist stored as a memory-mapped array file shared by all worker processes of a host.
+
+    The file starts with a fixed-size header holding a magic value, the blacklist version and the
+    number of blacklisted positions, followed by the positions as a sorted array of uint32 in the
+    native byte order of the host. Readers map the file read-only and answer membership checks
+    with a binary search over the mapping, so a lookup costs O(log b) without any database access
+    or per-worker copy of the blacklist. The file size and the cost of a reload only depend on the
+    number b of blacklisted positions, not on the largest of them.
+
+    Writers build a complete new file next to the current one and atomically swap it in with
+    `os.replace`. Readers notice the swap by the changed file identity and map the new file, while
+    mappings of the old file stay valid for anyone still using them.
+    """
+
+    MAGIC = b"FIBBLK02"
+    HEADER = struct.Struct("<8sQQ")
+    ITEM_TYPECODE = "I"
+    MAX_NUMBER = 2**32 - 1
+
+    def __init__(self, path: str):
+        """Initializes the store.
+
+        Args:
+            path (str): The path of the array file.
+        """
+        self.path = path
+        self._mapping: tuple[tuple[int, int, int], memoryview, int] | None = None
+
+    def exists(self) -> bool:
+        """Checks whether the array file has been published."""
+        return os.path.exists(self.path)
+
+    def contains(self, number: int) -> bool:
+        """Checks whether the given position is in the array.
+
+        Args:
+            number (int): The position to check.
+
+        Returns:
+            bool: True if the position is blacklisted, False otherwise.
+        """
+        numbers, _ = self._get_mapping()
+        idx = bisect_left(numbers, number)
+        return idx < len(numbers) and numbers[idx] == number
+
+    def get_version(self) -> int:
+        """Returns the blacklist version the array file was built from."""
+        return self._get_mapping()[1]
+
+    def iter_numbers(self) -> Iterator[int]:
+        """Yields all blacklisted positions in ascending order."""
+        return iter(self._get_mapping()[0])
+
+    def publish(self, load: Callable[[], tuple[int, Iterable[int]]]):
+        """Rebuilds the array file and atomically replaces the current one.
+
+        Writers are serialized with an exclusive lock on a sibling lock file, and the blacklist is
+        loaded while the lock is held, so a slower writer can never replace a newer file with an
+        older blacklist.
+
+        Args:
+            load (Callable[[], tuple[int, Iterable[int]]]): Returns the current blacklist version
+                and the blacklisted positions.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                version, numbers = load()
+                self._write(directory, version, numbers)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, directory: str, version: int, numbers: Iterable[int]):
+        numbers = sorted(set(numbers))
+        if numbers and not 0 <= numbers[0] <= numbers[-1] <= self.MAX_NUMBER:
+            raise ValueError("Blacklisted positions must fit in an unsigned 32-bit integer.")
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".blacklist-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(self.HEADER.pack(self.MAGIC, version, len(numbers)))
+                tmp_file.write(array(self.ITEM_TYPECODE, numbers).tobytes())
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _get_mapping(self) -> tuple[memoryview, int]:
+        """Returns the mapped positions and the version, remapping the file if it was replaced."""
+        stat = os.stat(self.path)
+        file_id = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+        mapping = self._mapping
+        if mapping is None or mapping[0] != file_id:
+            with open(self.path, "rb") as array_file:
+                mm = mmap.mmap(array_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, count = self.HEADER.unpack_from(mm)
+            if magic != self.MAGIC:
+                raise ValueError(f"'{self.path}' is not a blacklist array file.")
+
+            # The view keeps the mapping alive, the previous one is left to the garbage collector
+            # as other threads may still be reading from it
+            end = self.HEADER.size + count * array(self.ITEM_TYPECODE).itemsize
+            numbers = memoryview(mm)[self.HEADER.size : end].cast(self.ITEM_TYPECODE)
+            mapping = (file_id, numbers, version)
+            self._mapping = mapping
+
+        return mapping[1], mapping[2]
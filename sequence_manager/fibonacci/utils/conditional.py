@@ -0,0 +1,69 @@
+import functools
+import hashlib
+
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views.decorators.http import condition
+from rest_framework.request import Request
+
+from sequence_manager.fibonacci.services import BlacklistService
+from sequence_manager.utils.constants import HTTP_CACHE_MAX_AGE
+
+
+def get_blacklist_etag(request: Request, *args, **kwargs) -> str:
+    """Builds a strong ETag for a response that only depends on the request and the blacklist.
+
+    The tag covers the endpoint, its path parameters, all query parameters (page, page size,
+    cursor, encodings...), the negotiated format, whether the response is gzip-compressed and the
+    blacklist version pinned for the request.
+    """
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    parts = [
+        request.resolver_match.url_name if request.resolver_match else request.path,
+        repr(sorted(kwargs.items())),
+        repr(sorted(request.GET.lists())),
+        accepted_renderer.format if accepted_renderer is not None else "",
+        "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""),
+        BlacklistService().get_version_state()[0],
+    ]
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def conditional_on_blacklist(view_method):
+    """Makes a GET handler of an `APIView` conditional on the blacklist version.
+
+    The blacklist version state is pinned for the whole request, so the ETag, the Last-Modified
+    header and the response are derived from the same blacklist version, which is only read once.
+    Requests whose `If-None-Match` header still matches are answered with 304 Not Modified before
+    the handler runs, so no Fibonacci number is computed or serialized. `If-Modified-Since` is not
+    evaluated, as two blacklist changes within the same second share their Last-Modified time.
+
+    Successful responses are public but must be revalidated (`no-cache`), so a reverse proxy can
+    absorb repeated requests with cheap 304s and never serves a number after it is blacklisted. A
+    positive `HTTP_CACHE_MAX_AGE` lets caches serve responses for that many seconds instead, at the
+    cost of serving blacklisted numbers for up to as long.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request: Request, *args, **kwargs):
+        @condition(etag_func=get_blacklist_etag)
+        def conditional_view(request, *args, **kwargs):
+            return view_method(self, request, *args, **kwargs)
+
+        with BlacklistService().pin_version_state() as (_, updated_at):
+            response = conditional_view(request, *args, **kwargs)
+
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+        if response.status_code in (200, 304):
+            if updated_at is not None:
+                response["Last-Modified"] = http_date(updated_at.timestamp())
+            if HTTP_CACHE_MAX_AGE > 0:
+                patch_cache_control(response, public=True, max_age=HTTP_CACHE_MAX_AGE)
+            else:
+                patch_cache_control(response, public=True, no_cache=True)
+        else:
+            # Errors such as timeouts are transient, they must not be revalidated or cached
+            response.headers.pop("ETag", None)
+        return response
+
+    return wrapper
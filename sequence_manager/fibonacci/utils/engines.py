@@ -0,0 +1,253 @@
+import decimal
+import functools
+import math
+import time
+from collections.abc import Iterable
+
+
+FAST_DOUBLING_ENGINE = "fast_doubling"
+ITERATIVE_ENGINE = "iterative"
+
+# Number of bits added to F(n) by every step of the sequence, log2 of the golden ratio
+BITS_PER_INDEX = math.log2((1 + math.sqrt(5)) / 2)
+
+# Number of decimal digits added to F(n) by every step of the sequence, log10 of the golden ratio
+DIGITS_PER_INDEX = math.log10((1 + math.sqrt(5)) / 2)
+
+# Gaps up to this size are walked step by step, larger ones are jumped over with the engine
+STEP_LIMIT = 256
+
+# Below this index F(n) is computed exactly, as Binet's formula ignores the psi^n / sqrt(5) term
+APPROX_EXACT_INDEX_LIMIT = 1000
+
+# Moduli up to this value are factorized by trial division to reduce indexes by a Pisano period
+PISANO_MAX_MODULUS = 10**10
+
+# How many iterative steps are taken between two checks of the CPU deadline
+_DEADLINE_CHECK_INTERVAL = 4096
+
+
+class ComputationBudgetExceeded(Exception):
+    """Raised when a computation uses up its CPU-time budget."""
+
+    pass
+
+
+def _check_deadline(cpu_deadline: float | None):
+    if cpu_deadline is not None and time.process_time() > cpu_deadline:
+        raise ComputationBudgetExceeded("The CPU-time budget of the computation has been exceeded.")
+
+
+def estimate_fib_bytes(index: int) -> int:
+    """Returns an upper estimate of the number of bytes needed to store F(index)."""
+    return int(index * BITS_PER_INDEX) // 8 + 1
+
+
+def estimate_fib_digits(index: int) -> int:
+    """Returns an upper estimate of the number of decimal digits of F(index)."""
+    return int(index * DIGITS_PER_INDEX) + 1
+
+
+def fib_pair_fast_doubling(index: int, cpu_deadline: float | None = None) -> tuple[int, int]:
+    """Returns the pair (F(index), F(index + 1)) using the fast doubling method.
+
+    The identities F(2k) = F(k) * (2 * F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2 are
+    applied once per bit of the index, so only O(log n) big-int multiplications are performed.
+
+    Args:
+        index (int): The index in the Fibonacci sequence (0-based). Must not be negative.
+        cpu_deadline (float, optional): The `time.process_time()` value after which the
+            computation is aborted. Defaults to None (no deadline).
+
+    Returns:
+        tuple[int, int]: The Fibonacci numbers at positions `index` and `index + 1`.
+
+    Raises:
+        ComputationBudgetExceeded: If the CPU deadline passes during the computation.
+    """
+    fib_k, fib_k1 = 0, 1
+    for bit in bin(index)[2:]:
+        _check_deadline(cpu_deadline)
+        fib_2k = fib_k * ((fib_k1 << 1) - fib_k)
+        fib_2k1 = fib_k * fib_k + fib_k1 * fib_k1
+        if bit == "1":
+            fib_k, fib_k1 = fib_2k1, fib_2k + fib_2k1
+        else:
+            fib_k, fib_k1 = fib_2k, fib_2k1
+    return fib_k, fib_k1
+
+
+def fib_pair_iterative(index: int, cpu_deadline: float | None = None) -> tuple[int, int]:
+    """Returns the pair (F(index), F(index + 1)) by walking the sequence one step at a time.
+
+    This is the reference engine: it performs O(n) big-int additions and is kept to cross-check
+    the faster engines.
+
+    Args:
+        index (int): The index in the Fibonacci sequence (0-based). Must not be negative.
+        cpu_deadline (float, optional): The `time.process_time()` value after which the
+            computation is aborted. Defaults to None (no deadline).
+
+    Returns:
+        tuple[int, int]: The Fibonacci numbers at positions `index` and `index + 1`.
+
+    Raises:
+        ComputationBudgetExceeded: If the CPU deadline passes during the computation.
+    """
+    fib_k, fib_k1 = 0, 1
+    for step in range(index):
+        if step % _DEADLINE_CHECK_INTERVAL == 0:
+            _check_deadline(cpu_deadline)
+        fib_k, fib_k1 = fib_k1, fib_k + fib_k1
+    return fib_k, fib_k1
+
+
+def fib_pair_mod(index: int, modulus: int) -> tuple[int, int]:
+    """Returns the pair (F(index) mod m, F(index + 1) mod m) using modular fast doubling.
+
+    The fast doubling identities are applied modulo `modulus`, so every step works on ints smaller
+    than the modulus squared and the cost is O(log n) regardless of the size of F(index).
+
+    Args:
+        index (int): The index in the Fibonacci sequence (0-based). Must not be negative.
+        modulus (int): The modulus. Must be a positive integer.
+
+    Returns:
+        tuple[int, int]: The residues of the Fibonacci numbers at `index` and `index + 1`.
+    """
+    fib_k, fib_k1 = 0, 1 % modulus
+    for bit in bin(index)[2:]:
+        fib_2k = fib_k * ((fib_k1 << 1) - fib_k) % modulus
+        fib_2k1 = (fib_k * fib_k + fib_k1 * fib_k1) % modulus
+        if bit == "1":
+            fib_k, fib_k1 = fib_2k1, (fib_2k + fib_2k1) % modulus
+        else:
+            fib_k, fib_k1 = fib_2k, fib_2k1
+    return fib_k, fib_k1
+
+
+def fib_log10(index: int, precision: int) -> decimal.Decimal:
+    """Returns log10(F(index)) from Binet's formula, F(n) = round(phi^n / sqrt(5)).
+
+    The result is n * log10(phi) - log10(sqrt(5)), computed with `precision` significant digits.
+    The neglected psi^n / sqrt(5) term is below 10^-200 in relative terms for indexes from
+    `APPROX_EXACT_INDEX_LIMIT` on. The cost only depends on the precision.
+
+    Args:
+        index (int): The index in the Fibonacci sequence (0-based). Must be positive.
+        precision (int): The number of significant digits of the result.
+
+    Returns:
+        decimal.Decimal: The decimal logarithm of F(index).
+    """
+    context = decimal.Context(prec=precision)
+    sqrt5 = context.sqrt(5)
+    log10_phi = context.log10(context.divide(context.add(1, sqrt5), 2))
+    return context.subtract(context.multiply(index, log10_phi), context.log10(sqrt5))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_pisano_period_multiple(modulus: int) -> int | None:
+    """Returns a multiple of the Pisano period of the modulus, the period of F(n) mod m.
+
+    For m = p1^k1 * ... * pr^kr the Pisano period divides the lcm of pi^(ki - 1) * c(pi), where
+    c(2) = 3, c(5) = 20, c(p) = p - 1 for p = ±1 (mod 10) and c(p) = 2 * (p + 1) for p = ±3
+    (mod 10). The multiple is enough to reduce indexes, so the exact period is not searched for.
+
+    Args:
+        modulus (int): The modulus. Must be a positive integer.
+
+    Returns:
+        int | None: The period multiple, or None if the modulus exceeds `PISANO_MAX_MODULUS` and
+            is too expensive to factorize.
+    """
+    if modulus > PISANO_MAX_MODULUS:
+        return None
+
+    period, remainder, prime = 1, modulus, 2
+    while remainder > 1:
+        if prime * prime > remainder:
+            prime = remainder
+
+        if remainder % prime == 0:
+            prime_power = 1
+            while remainder % prime == 0:
+                remainder //= prime
+                prime_power *= prime
+
+            if prime == 2:
+                cycle = 3
+            elif prime == 5:
+                cycle = 20
+            elif prime % 10 in (1, 9):
+                cycle = prime - 1
+            else:
+                cycle = 2 * (prime + 1)
+            period = math.lcm(period, prime_power // prime * cycle)
+
+        prime += 1 if prime == 2 else 2
+    return period
+
+
+FIB_PAIR_ENGINES = {
+    FAST_DOUBLING_ENGINE: fib_pair_fast_doubling,
+    ITERATIVE_ENGINE: fib_pair_iterative,
+}
+
+
+def fib_numbers_walk(
+    indexes: Iterable[int], engine: str = FAST_DOUBLING_ENGINE, cpu_deadline: float | None = None
+) -> dict[int, int]:
+    """Returns the Fibonacci numbers at many arbitrary, non-negative indexes.
+
+    The indexes are visited in ascending order. Gaps of up to `STEP_LIMIT` are walked step by step
+    from the previous index, while larger ones are jumped over with the given engine.
+
+    Args:
+        indexes (Iterable[int]): The indexes in the Fibonacci sequence (0-based).
+        engine (str, optional): The name of the engine used for jumps. Defaults to fast doubling.
+        cpu_deadline (float, optional): The `time.process_time()` value after which the
+            computation is aborted. Defaults to None (no deadline).
+
+    Returns:
+        dict[int, int]: Maps every distinct index to its Fibonacci number.
+
+    Raises:
+        ComputationBudgetExceeded: If the CPU deadline passes during the computation.
+    """
+    fib_pair = FIB_PAIR_ENGINES[engine]
+
+    fib_nums = {}
+    current, fib_num, next_fib_num = 0, 0, 1
+    for index in sorted(set(indexes)):
+        _check_deadline(cpu_deadline)
+        if index - current > STEP_LIMIT:
+            fib_num, next_fib_num = fib_pair(index, cpu_deadline=cpu_deadline)
+        else:
+            for _ in range(index - current):
+                fib_num, next_fib_num = next_fib_num, fib_num + next_fib_num
+        current = index
+        fib_nums[index] = fib_num
+    return fib_nums
+
+
+def compute_fib_number(index: int, engine: str, cpu_time_budget: float | None = None) -> int:
+    """Computes F(index) within a CPU-time budget, meant to be run in a worker process."""
+    cpu_deadline = time.process_time() + cpu_time_budget if cpu_time_budget else None
+    return FIB_PAIR_ENGINES[engine](index, cpu_deadline=cpu_deadline)[0]
+
+
+def compute_fib_pair(
+    index: int, engine: str, cpu_time_budget: float | None = None
+) -> tuple[int, int]:
+    """Computes (F(index), F(index + 1)) within a CPU-time budget, meant for a worker process."""
+    cpu_deadline = time.process_time() + cpu_time_budget if cpu_time_budget else None
+    return FIB_PAIR_ENGINES[engine](index, cpu_deadline=cpu_deadline)
+
+
+def compute_fib_numbers(
+    indexes: list[int], engine: str, cpu_time_budget: float | None = None
+) -> dict[int, int]:
+    """Computes F(n) for many indexes within a CPU-time budget, meant for a worker process."""
+    cpu_deadline = time.process_time() + cpu_time_budget if cpu_time_budget else None
+    return fib_numbers_walk(indexes, engine=engine, cpu_deadline=cpu_deadline)
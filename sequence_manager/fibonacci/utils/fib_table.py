@@ -0,0 +1,142 @@
+import mmap
+import os
+import struct
+import tempfile
+
+
+class FibonacciTable:
+    """Precomputed Fibonacci numbers stored in a memory-mapped, offset-indexed file.
+
+    The file starts with a fixed-size header holding a magic value and the number of stored
+    values, followed by `count + 1` little-endian offsets and the values themselves. F(index) is
+    stored as its minimal little-endian byte string between the offsets `index` and `index + 1`
+    of the data section, so a lookup is two offset reads and a single `int.from_bytes` call.
+
+    Readers map the file read-only and decode values on demand, so all the worker processes of a
+    host share the page cache instead of holding their own copy of the table. The file is built
+    with `manage.py build_fib_table` and atomically replaced on rebuilds, which readers notice by
+    the changed file identity.
+    """
+
+    MAGIC = b"FIBTAB01"
+    HEADER = struct.Struct("<8sQ")
+    OFFSET = struct.Struct("<Q")
+    OFFSET_PAIR = struct.Struct("<QQ")
+
+    def __init__(self, path: str):
+        """Initializes the table.
+
+        Args:
+            path (str): The path of the table file.
+        """
+        self.path = path
+        self._mapping: tuple[tuple[int, int, int], mmap.mmap, int] | None = None
+
+    def __len__(self) -> int:
+        """Returns the number of stored values, 0 if the file has not been built."""
+        mapping = self._get_mapping()
+        return mapping[1] if mapping is not None else 0
+
+    def exists(self) -> bool:
+        """Checks whether the table file has been built."""
+        return os.path.exists(self.path)
+
+    def get_fib_number(self, index: int) -> int | None:
+        """Returns the stored Fibonacci number at the given index.
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            int | None: The Fibonacci number, or None if the index is not covered by the table.
+        """
+        mapping = self._get_mapping()
+        if mapping is None or not 0 <= index < mapping[1]:
+            return None
+        return self._read(*mapping, index)
+
+    def get_fib_pair(self, index: int) -> tuple[int, int] | None:
+        """Returns the stored pair (F(index), F(index + 1)).
+
+        Args:
+            index (int): The index in the Fibonacci sequence (0-based).
+
+        Returns:
+            tuple[int, int] | None: The pair, or None if the table does not cover both indexes.
+        """
+        mapping = self._get_mapping()
+        if mapping is None or not 0 <= index < mapping[1] - 1:
+            return None
+        return self._read(*mapping, index), self._read(*mapping, index + 1)
+
+    def build(self, count: int) -> int:
+        """Writes a table of F(0)..F(count - 1) and atomically replaces the current file.
+
+        The values are written one by one while walking the sequence, so only the offsets are
+        kept in memory.
+
+        Args:
+            count (int): The number of values to store.
+
+        Returns:
+            int: The size of the written file in bytes.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        data_start = self.HEADER.size + self.OFFSET.size * (count + 1)
+        offsets = [0]
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".fib-table-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.seek(data_start)
+                fib_num, next_fib_num = 0, 1
+                for _ in range(count):
+                    value = fib_num.to_bytes((fib_num.bit_length() + 7) // 8, "little")
+                    tmp_file.write(value)
+                    offsets.append(offsets[-1] + len(value))
+                    fib_num, next_fib_num = next_fib_num, fib_num + next_fib_num
+
+                tmp_file.seek(0)
+                tmp_file.write(self.HEADER.pack(self.MAGIC, count))
+                tmp_file.write(struct.pack(f"<{count + 1}Q", *offsets))
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        return data_start + offsets[-1]
+
+    def _read(self, mm: mmap.mmap, count: int, index: int) -> int:
+        start, end = self.OFFSET_PAIR.unpack_from(mm, self.HEADER.size + self.OFFSET.size * index)
+        data_start = self.HEADER.size + self.OFFSET.size * (count + 1)
+        return int.from_bytes(mm[data_start + start : data_start + end], "little")
+
+    def _get_mapping(self) -> tuple[mmap.mmap, int] | None:
+        """Returns the mapping of the current file, remapping it if the file has been replaced."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        file_id = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+        mapping = self._mapping
+        if mapping is None or mapping[0] != file_id:
+            with open(self.path, "rb") as table_file:
+                mm = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, count = self.HEADER.unpack_from(mm)
+            if magic != self.MAGIC:
+                raise ValueError(f"'{self.path}' is not a Fibonacci table file.")
+
+            # The previous mapping is left to the garbage collector, as other threads may still
+            # be reading from it
+            mapping = (file_id, mm, count)
+            self._mapping = mapping
+
+        return mapping[1], mapping[2]
@@ -1,6 +1,14 @@
+import base64
+import binascii
+import json
+
 from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
+from sequence_manager.fibonacci.utils.result_cache import ByteBudgetLRUCache, get_int_bytes
+from sequence_manager.fibonacci.utils.sequences import FibonacciNumberSequence
+from sequence_manager.utils.constants import CURSOR_STATE_CACHE_BYTES
 from sequence_manager.utils.custom_responses import JsonResponseError, JsonResponseSuccess
 
 
@@ -9,24 +17,120 @@ class FibonacciNumberPagination(PageNumberPagination):
 
     This pagination class allows clients to define the number of results per page
     by including a 'page_size' query parameter in their requests.
+
+    Fibonacci sequences can also be traversed with opaque cursors, by passing `pagination=cursor`
+    for the first page and following the `next` links afterwards. A cursor references the position
+    at which the next page starts, and the (F(k - 1), F(k)) state carried over from the previous
+    page is kept server-side, so each following page costs O(page_size) regardless of its depth.
+    The states are kept in an LRU cache bounded by their size (`CURSOR_STATE_CACHE_BYTES`), as a
+    single state near the largest allowed position takes megabytes.
     """
 
     page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    pagination_query_param = "pagination"
+
+    cursor_states = ByteBudgetLRUCache(CURSOR_STATE_CACHE_BYTES)
 
     def paginate(self, queryset, request):
         """Applies pagination to the given queryset and returns a paginated response.
 
         Args:
-            queryset (QuerySet): The queryset to paginate.
+            queryset (QuerySet | Sequence): The queryset or lazy sequence to paginate.
             request (Request): The incoming request containing pagination parameters.
 
         Returns:
             Response: A paginated response containing the data for the current page.
                       If the page parameters are invalid, returns a JSON error response.
         """
+        if isinstance(queryset, FibonacciNumberSequence) and self.is_cursor_request(request):
+            return self.paginate_by_cursor(queryset, request)
+
         try:
             paginated_data = self.paginate_queryset(queryset, request)
             response = self.get_paginated_response(paginated_data)
             return JsonResponseSuccess(response.data)
         except NotFound as err:
             return JsonResponseError("Invalid page", status=400)
+
+    def is_cursor_request(self, request) -> bool:
+        """Checks whether the client asked for cursor-based pagination."""
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.pagination_query_param) == "cursor"
+        )
+
+    def paginate_by_cursor(self, sequence: FibonacciNumberSequence, request):
+        """Returns the page of the sequence starting at the position referenced by the cursor.
+
+        Args:
+            sequence (FibonacciNumberSequence): The lazy sequence to paginate.
+            request (Request): The incoming request containing the cursor and page size.
+
+        Returns:
+            Response: A paginated response whose `next` and `previous` links carry cursors.
+                      If the cursor is invalid, returns a JSON error response.
+        """
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        try:
+            position = self.decode_cursor(cursor) if cursor else sequence.start
+        except ValueError:
+            return JsonResponseError("Invalid cursor", status=400)
+
+        if not sequence.start <= position <= sequence.stop:
+            return JsonResponseError("Invalid cursor", status=400)
+
+        results, next_position, next_state = sequence.get_items_from(
+            position, page_size, state=self.cursor_states.get(position)
+        )
+
+        next_link = None
+        if sequence.blacklist.count_visible(next_position, sequence.stop):
+            self.cursor_states.set(
+                next_position, next_state, size=sum(get_int_bytes(value) for value in next_state)
+            )
+            next_link = self.get_cursor_link(request, next_position)
+
+        previous_link = None
+        offset = sequence.blacklist.count_visible(sequence.start, position - 1)
+        if offset:
+            previous_position = sequence.blacklist.get_position(
+                max(offset - page_size, 0), start=sequence.start
+            )
+            previous_link = self.get_cursor_link(request, previous_position)
+
+        return JsonResponseSuccess(
+            {
+                "count": len(sequence),
+                "next": next_link,
+                "previous": previous_link,
+                "results": results,
+            }
+        )
+
+    def get_cursor_link(self, request, position: int) -> str:
+        url = request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position))
+
+    def encode_cursor(self, position: int) -> str:
+        payload = json.dumps({"p": position}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> int:
+        """Decodes an opaque cursor into the position it references.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            position = json.loads(payload)["p"]
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError):
+            raise ValueError("Invalid cursor.")
+
+        if not isinstance(position, int) or isinstance(position, bool):
+            raise ValueError("Invalid cursor.")
+        return position
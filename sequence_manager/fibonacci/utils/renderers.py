@@ -0,0 +1,51 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+from sequence_manager.fibonacci.utils.value_encodings import encode_binary_record
+from sequence_manager.utils.json_encoders import LargeIntJSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renderer for newline-delimited JSON, one record per line.
+
+    Registering it on a view makes DRF content negotiation accept both `?format=ndjson` and the
+    `Accept: application/x-ndjson` header. Views stream such responses themselves, the `render`
+    method only covers the case of a regular DRF `Response`.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        records = data if isinstance(data, list) else [data]
+        return "".join(
+            f"{json.dumps(record, cls=LargeIntJSONEncoder)}\n" for record in records
+        ).encode(self.charset)
+
+
+class OctetStreamRenderer(BaseRenderer):
+    """Renderer for the binary list format, length-prefixed little-endian values.
+
+    Registering it on a view makes DRF content negotiation accept both `?format=binary` and the
+    `Accept: application/octet-stream` header. Views stream such responses themselves, the
+    `render` method only covers the case of a regular DRF `Response` holding list items.
+    """
+
+    media_type = "application/octet-stream"
+    format = "binary"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        records = data if isinstance(data, list) else [data]
+        return b"".join(
+            encode_binary_record(record["number"], record["value"]) for record in records
+        )
@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+# Rough cost of an entry besides the digits of its value: the key, the node and the int header
+ENTRY_OVERHEAD_BYTES = 64
+
+
+def get_int_bytes(value: int) -> int:
+    """Returns the number of bytes accounted for a cached big int, based on its bit length."""
+    return (abs(value).bit_length() + 7) // 8 + ENTRY_OVERHEAD_BYTES
+
+
+class ByteBudgetLRUCache:
+    """Thread-safe LRU cache of big ints whose eviction is driven by their total size.
+
+    A count-based limit does not fit Fibonacci numbers, as F(10^6) alone takes about 87 KB while
+    small values take a few bytes. Every entry is accounted with `get_int_bytes`, and the least
+    recently used entries are evicted until the resident bytes fit into `max_bytes` again. Values
+    which alone exceed the budget are not cached at all. Other values, such as tuples of big ints,
+    can be cached by passing their size explicitly.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initializes the cache.
+
+        Args:
+            max_bytes (int): The budget of resident bytes, 0 or less disables the cache.
+        """
+        self.max_bytes = max_bytes
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value for the key and marks it as recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int | None = None):
+        """Caches the value for the key, evicting the least recently used entries if needed.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value, a big int unless `size` is given.
+            size (int | None, optional): The bytes accounted for the value. Defaults to
+                `get_int_bytes(value)`.
+        """
+        if size is None:
+            size = get_int_bytes(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.resident_bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self.resident_bytes += size
+            while self.resident_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.resident_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drops all the entries, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.resident_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Returns the cache counters and its memory usage.
+
+        Returns:
+            dict: The hit, miss and eviction counters, the hit ratio, the number of entries and
+                the resident bytes together with the budget.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,172 @@
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.services import FibonacciSequenceService
+from sequence_manager.fibonacci.utils.blacklist_index import BlacklistIndex
+from sequence_manager.fibonacci.utils.engines import estimate_fib_bytes
+from sequence_manager.fibonacci.utils.value_encodings import DECIMAL_ENCODING, VALUE_ENCODERS
+from sequence_manager.utils.metrics import timed_phase
+
+
+class FibonacciNumberSequence:
+    """Lazy, sliceable sequence of Fibonacci numbers for the positions `start`..`stop`.
+
+    The sequence supports `len()` and slicing, which is all the paginators need, so only the
+    requested window is ever computed. Slicing seeds the window with a single fast F(k), F(k + 1)
+    jump and then iterates over the window, so the cost depends on the page size and not on the
+    upper bound of the sequence. Blacklisted positions are skipped with the help of a
+    `BlacklistIndex`, so deep pages cost the same as the first one. Concurrent requests for the
+    same large window share a single computation through the `single_flight` of the service.
+
+    The jumps go through a `FibonacciComputationExecutor`, so large ones run in its process pool
+    under its CPU-time budget, and windows whose values would together exceed its response-size
+    budget are rejected before anything is computed. Iterating, which streams the sequence
+    without holding it in memory, only bounds the size of every single value.
+
+    Items are returned as dictionaries in the `{"number": <position>, "value": <fib>}` format
+    used by the list endpoint, where positions are 1-based. Values are ints, or strings in the
+    requested `value_encoding` (see `VALUE_ENCODERS`).
+    """
+
+    def __init__(
+        self,
+        stop: int,
+        start: int = 1,
+        blacklist: BlacklistIndex | None = None,
+        service: FibonacciSequenceService | None = None,
+        value_encoding: str = DECIMAL_ENCODING,
+        executor: FibonacciComputationExecutor | None = None,
+    ):
+        """Initializes the sequence.
+
+        Args:
+            stop (int): The last position (inclusive, 1-based) of the sequence.
+            start (int, optional): The first position (inclusive, 1-based). Defaults to 1.
+            blacklist (BlacklistIndex, optional): The index of positions to exclude. Defaults to
+                an empty index.
+            service (FibonacciSequenceService, optional): The service used to seed the windows.
+                Defaults to a service with the default engine.
+            value_encoding (str, optional): The encoding of the values. Defaults to decimal ints.
+            executor (FibonacciComputationExecutor, optional): The executor running the jumps
+                within its budgets. Defaults to an executor of the service.
+
+        Raises:
+            ValueError: If `start` is not a positive integer or the encoding is unknown.
+        """
+        if start < 1:
+            raise ValueError("The 'start' argument must be a positive integer.")
+
+        if value_encoding not in VALUE_ENCODERS:
+            raise ValueError(f"Unknown value encoding '{value_encoding}'.")
+
+        self.start = start
+        self.stop = stop
+        self.service = service or FibonacciSequenceService()
+        self.executor = executor or FibonacciComputationExecutor(self.service)
+        self.blacklist = blacklist if blacklist is not None else BlacklistIndex()
+        self.value_encoding = value_encoding
+        self._encode_value = VALUE_ENCODERS[value_encoding]
+
+    def __len__(self) -> int:
+        return self.blacklist.count_visible(self.start, self.stop)
+
+    def __getitem__(self, key: int | slice) -> dict | list[dict]:
+        if isinstance(key, slice):
+            offset, end, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("Slicing with a step is not supported.")
+            return self._get_window(offset, end - offset)
+
+        length = len(self)
+        offset = key + length if key < 0 else key
+        if not 0 <= offset < length:
+            raise IndexError("Fibonacci sequence index out of range.")
+        return self._get_window(offset, 1)[0]
+
+    def __iter__(self):
+        """Yields the visible items one by one, keeping only two consecutive values in memory.
+
+        The size of the last value and the first pair are checked and computed as soon as the
+        iterator is created, so a streaming response fails with a proper error status instead of
+        breaking off once its headers are sent.
+
+        Raises:
+            ComputationTooLargeApiException: If the last value would exceed the result-size budget.
+            ComputationUnavailableApiException: If the jump exceeds the time budget.
+        """
+        self.executor.check_result_size(self.stop - 1)
+        return self._iter_from(self.start, self.executor.get_fib_pair(self.start - 1))
+
+    def _iter_from(self, position: int, state: tuple[int, int]):
+        fib_num, next_fib_num = state
+        while position <= self.stop:
+            if position not in self.blacklist:
+                yield self._get_item(position, fib_num)
+            position += 1
+            fib_num, next_fib_num = next_fib_num, fib_num + next_fib_num
+
+    @timed_phase("compute")
+    def get_items_from(
+        self, position: int, size: int, state: tuple[int, int] | None = None
+    ) -> tuple[list[dict], int, tuple[int, int]]:
+        """Computes up to `size` visible items starting at the given position.
+
+        Args:
+            position (int): The position (1-based) to start from.
+            size (int): The maximum number of visible items to return.
+            state (tuple[int, int], optional): The pair (F(position - 1), F(position)) carried over
+                from a previous call. Computed with a fast jump when not provided.
+
+        Returns:
+            tuple[list[dict], int, tuple[int, int]]: The items, the position following the last
+                examined one and the state for that position, which lets a subsequent call
+                continue in O(size).
+
+        Raises:
+            ComputationTooLargeApiException: If the last item would exceed the result-size budget.
+            ResponseTooLargeApiException: If the items would exceed the response-size budget.
+            ComputationUnavailableApiException: If the jump exceeds the time budget.
+        """
+        # Only the values actually computed are checked, not the whole sequence up to `stop`
+        count = min(size, self.blacklist.count_visible(position, self.stop))
+        if count > 0:
+            last_position = self.blacklist.get_position(count - 1, start=position)
+            self.executor.check_result_size(last_position - 1)
+            self.executor.check_response_size(count * estimate_fib_bytes(last_position - 1))
+
+        fib_num, next_fib_num = state or self.executor.get_fib_pair(position - 1)
+
+        items = []
+        while len(items) < size and position <= self.stop:
+            if position not in self.blacklist:
+                items.append(self._get_item(position, fib_num))
+            position += 1
+            fib_num, next_fib_num = next_fib_num, fib_num + next_fib_num
+        return items, position, (fib_num, next_fib_num)
+
+    def _get_window(self, offset: int, size: int) -> list[dict]:
+        """Computes `size` visible items starting at the given 0-based visible offset."""
+        if size <= 0:
+            return []
+
+        position = self.blacklist.get_position(offset, start=self.start)
+        if not self.service.is_coalesced(position):
+            return self._compute_window(position, size)
+
+        # The blacklist is part of the key, an index object stays alive while its window is computed
+        key = (
+            "window",
+            self.service.engine,
+            id(self.blacklist),
+            self.value_encoding,
+            position,
+            size,
+            self.stop,
+        )
+        return self.service.single_flight.do(key, self._compute_window, position, size)
+
+    def _compute_window(self, position: int, size: int) -> list[dict]:
+        return self.get_items_from(position, size)[0]
+
+    def _get_item(self, position: int, fib_num: int) -> dict:
+        if self._encode_value is not None:
+            fib_num = self._encode_value(fib_num)
+        return {"number": position, "value": fib_num}
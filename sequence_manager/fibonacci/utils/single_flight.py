@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single execution.
+
+    The first caller of a key executes the work while every concurrent caller of the same key
+    waits for it and receives the same result, or the same exception. Once the work is done, the
+    key is forgotten, so later calls start a new execution. Threads use `do` and asyncio tasks use
+    `ado`, both share the same counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable, *args):
+        """Calls `func(*args)` unless a call for the same key is already in flight.
+
+        Args:
+            key (Hashable): Identifies the work, calls with equal keys are coalesced.
+            func (Callable): The function doing the work.
+            *args: Positional arguments passed to the function.
+
+        Returns:
+            The result of the in-flight call, or of the new call.
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def ado(self, key: Hashable, func: Callable[..., Awaitable], *args):
+        """Awaits `func(*args)` unless a call for the same key is already in flight.
+
+        The work runs in its own task, so cancelling any of the waiting callers, including the
+        one that started it, does not cancel the work for the others.
+
+        Args:
+            key (Hashable): Identifies the work, calls with equal keys are coalesced.
+            func (Callable[..., Awaitable]): The coroutine function doing the work.
+            *args: Positional arguments passed to the function.
+
+        Returns:
+            The result of the in-flight call, or of the new call.
+        """
+        task_key = (id(asyncio.get_running_loop()), key)
+
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = asyncio.ensure_future(func(*args))
+                task.add_done_callback(lambda _: self._forget_task(task_key))
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> dict:
+        """Returns the number of calls, actual executions and coalesced calls.
+
+        Returns:
+            dict: The call counters and the number of executions currently in flight.
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls) + len(self._tasks),
+        }
+
+    def _forget_task(self, task_key: tuple[int, Hashable]):
+        with self._lock:
+            self._tasks.pop(task_key, None)
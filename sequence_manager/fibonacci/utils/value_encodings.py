@@ -0,0 +1,56 @@
+import base64
+import struct
+from collections.abc import Callable
+
+
+DECIMAL_ENCODING = "decimal"
+HEX_ENCODING = "hex"
+BASE64_ENCODING = "base64"
+
+# Header of a record of the binary list format: the position and the byte length of its value
+BINARY_RECORD_HEADER = struct.Struct("<QI")
+
+
+def encode_hex(value: int) -> str:
+    """Returns the lowercase hexadecimal digits of a non-negative integer, without a prefix."""
+    return format(value, "x")
+
+
+def encode_base64(value: int) -> str:
+    """Returns the base64 encoding of the big-endian bytes of a non-negative integer.
+
+    The bytes are in the same order as the hex digits, so both decode with
+    `int.from_bytes(..., "big")`. Zero is encoded as a single zero byte.
+    """
+    return base64.b64encode(value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big")).decode()
+
+
+VALUE_ENCODERS: dict[str, Callable[[int], str] | None] = {
+    DECIMAL_ENCODING: None,
+    HEX_ENCODING: encode_hex,
+    BASE64_ENCODING: encode_base64,
+}
+
+
+def encode_value(value: int, encoding: str) -> int | str:
+    """Returns the value in the given encoding, decimal values are kept as ints."""
+    encoder = VALUE_ENCODERS[encoding]
+    return value if encoder is None else encoder(value)
+
+
+def encode_binary_record(number: int, value: int) -> bytes:
+    """Returns an item of the `application/octet-stream` list format.
+
+    Every record holds the position as an unsigned 64-bit integer and the byte length of the
+    value as an unsigned 32-bit integer, both little-endian, followed by the value itself as
+    little-endian bytes (`int.from_bytes(..., "little")` decodes it).
+
+    Args:
+        number (int): The position (1-based) of the value.
+        value (int): The non-negative Fibonacci number at that position.
+
+    Returns:
+        bytes: The encoded record.
+    """
+    value_bytes = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    return BINARY_RECORD_HEADER.pack(number, len(value_bytes)) + value_bytes
@@ -1,20 +1,41 @@
 import logging
+import re
 
 from django.http import JsonResponse
 from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
-from sequence_manager.fibonacci.serializers import FibonacciNumberSerializer
+from sequence_manager.fibonacci.executors import FibonacciComputationExecutor
+from sequence_manager.fibonacci.serializers import (
+    BlacklistBulkSerializer,
+    FibonacciBatchSerializer,
+    FibonacciNumberQuerySerializer,
+    FibonacciNumberSerializer,
+    NumberRangeSerializer,
+    ValueEncodingSerializer,
+)
 from sequence_manager.fibonacci.services import BlacklistService, FibonacciSequenceService
+from sequence_manager.fibonacci.utils.conditional import conditional_on_blacklist
 from sequence_manager.fibonacci.utils.paginators import FibonacciNumberPagination
-from sequence_manager.utils.custom_responses import JsonResponseError, JsonResponseSuccess
-
+from sequence_manager.fibonacci.utils.renderers import NDJSONRenderer, OctetStreamRenderer
+from sequence_manager.fibonacci.utils.sequences import FibonacciNumberSequence
+from sequence_manager.fibonacci.utils.value_encodings import encode_binary_record, encode_value
+from sequence_manager.utils.custom_responses import (
+    JsonResponseError,
+    JsonResponseSuccess,
+    NDJsonStreamingResponse,
+    OctetStreamingResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+re_accepts_gzip = re.compile(r"\bgzip\b")
+
 
 class FibonacciNumberView(APIView):
 
+    @conditional_on_blacklist
     def get(self, request: Request, number: int, *args, **kwargs):
         """Retrieve the value from the Fibonacci sequence for a given number.
 
@@ -23,9 +44,28 @@ class FibonacciNumberView(APIView):
         Description:
             This endpoint returns the Fibonacci number at the specified position.
 
+            Clients which only need a residue, e.g. the last digits, can pass a modulus `m` with
+            `?mod=<m>` to get F(n) mod m instead. It is computed in O(log n) small-int operations,
+            so positions far beyond the size limit of full values are accepted.
+
+            Dashboards which only need the magnitude of the value can pass `?mode=approx` to get
+            its digit count, its leading and trailing digits and its scientific notation. The
+            leading digits come from Binet's formula and the trailing ones from the modular path,
+            so the response takes constant time even for positions in the billions.
+
         Parameters:
             number (int): The 1-based index in the Fibonacci sequence. Must be a positive integer.
 
+            Query Parameters:
+                mod (int, optional): The modulus, between 1 and 10^18.
+                value_encoding (str, optional): `decimal` (default) for a JSON number, or `hex` or
+                    `base64` (big-endian bytes) for a string which is produced in linear time and
+                    is about 17% (hex) or 45% (base64) shorter.
+                mode (str, optional): `exact` (default) or `approx`, which cannot be combined
+                    with `mod`.
+                significant_digits (int, optional): The number of leading and trailing digits
+                    returned in the `approx` mode, between 1 and 100 (default: 10).
+
         Responses:
             200 OK:
                 Description: Fibonacci number successfully retrieved.
@@ -37,6 +77,27 @@ class FibonacciNumberView(APIView):
                         "value": 3
                     }
                 }
+                Example (with `?mode=approx&significant_digits=5`):
+                {
+                    "success": true,
+                    "data": {
+                        "number": 1001,
+                        "mode": "approx",
+                        "digit_count": 209,
+                        "leading_digits": "43466",
+                        "trailing_digits": "28875",
+                        "scientific": "4.3466e208"
+                    }
+                }
+                Example (with `?mod=1000`):
+                {
+                    "success": true,
+                    "data": {
+                        "number": 1000,
+                        "modulus": 1000,
+                        "value": 626
+                    }
+                }
             400 Bad Request:
                 Description: The input number is invalid (e.g., not greater than 1).
                 Example:
@@ -56,21 +117,65 @@ class FibonacciNumberView(APIView):
                     "success": false,
                     "error": "This number is blacklisted and cannot be used."
                 }
+            413 Content Too Large:
+                Description: The requested Fibonacci number exceeds the allowed result size.
+                Example:
+                {
+                    "success": false,
+                    "error": "The requested Fibonacci number exceeds the allowed result size."
+                }
+            503 Service Unavailable:
+                Description: The computation did not finish within its time budget.
+                Example:
+                {
+                    "success": false,
+                    "error": "The requested Fibonacci number could not be computed in time."
+                }
         """
         serializer = FibonacciNumberSerializer(data={"number": number})
 
         if not serializer.is_valid():
             return JsonResponseError(serializer.errors, message="Validation error", status=400)
 
+        query_serializer = FibonacciNumberQuerySerializer(data=request.query_params)
+
+        if not query_serializer.is_valid():
+            return JsonResponseError(
+                query_serializer.errors, message="Validation error", status=400
+            )
+
         if BlacklistService().is_blacklisted(number):
             return JsonResponseError("This number is blacklisted and cannot be used.", status=403)
 
-        fib_num = FibonacciSequenceService().get_fib_number(number - 1)
-        return JsonResponseSuccess({"number": number, "value": fib_num})
+        if query_serializer.validated_data["mode"] == "approx":
+            significant_digits = query_serializer.validated_data["significant_digits"]
+            approx = FibonacciSequenceService().get_fib_number_approx(
+                number - 1, significant_digits=significant_digits
+            )
+            return JsonResponseSuccess({"number": number, "mode": "approx", **approx})
+
+        modulus = query_serializer.validated_data.get("mod")
+        value_encoding = query_serializer.validated_data["value_encoding"]
+        if modulus is not None:
+            fib_num = FibonacciSequenceService().get_fib_number_mod(number - 1, modulus)
+            return JsonResponseSuccess(
+                {
+                    "number": number,
+                    "modulus": modulus,
+                    "value": encode_value(fib_num, value_encoding),
+                }
+            )
+
+        fib_num = FibonacciComputationExecutor().get_fib_number(number - 1)
+        return JsonResponseSuccess(
+            {"number": number, "value": encode_value(fib_num, value_encoding)}
+        )
 
 
 class FibonacciNumberListView(APIView):
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer, OctetStreamRenderer]
 
+    @conditional_on_blacklist
     def get(self, request: Request, number: int, *args, **kwargs):
         """Retrieve a list of Fibonacci numbers up to a given position, excluding blacklisted values.
 
@@ -81,6 +186,14 @@ class FibonacciNumberListView(APIView):
             omitting any numbers that are currently blacklisted. The results are paginated, and
             clients can customize the page size using the `page_size` query parameter.
 
+            Export clients can request the full sequence without pagination as newline-delimited
+            JSON with `?format=ndjson` or the `Accept: application/x-ndjson` header. The records are
+            streamed as they are computed and are gzip-compressed when the client sends
+            `Accept-Encoding: gzip`. The same applies to the compact binary format requested with
+            `?format=binary` or the `Accept: application/octet-stream` header, in which every
+            record is the position (uint64), the byte length of the value (uint32) and the value,
+            all little-endian.
+
         Parameters:
             number (int): The upper limit (inclusive) of the Fibonacci sequence to return.
                           Must be a positive integer.
@@ -88,6 +201,10 @@ class FibonacciNumberListView(APIView):
             Query Parameters:
                 page (int, optional): The page number to retrieve (default: 1).
                 page_size (int, optional): Number of items per page (default: 100).
+                format (str, optional): Set to `ndjson` or `binary` to stream the whole sequence.
+                value_encoding (str, optional): `decimal` (default), `hex` or `base64` values.
+                pagination (str, optional): Set to `cursor` to traverse the sequence with cursors.
+                cursor (str, optional): The opaque cursor taken from a `next`/`previous` link.
 
         Responses:
             200 OK:
@@ -108,6 +225,13 @@ class FibonacciNumberListView(APIView):
                     }
                 }
 
+            200 OK (format=ndjson):
+                Description: The whole sequence, excluding blacklisted numbers, one record per line.
+                Example:
+                {"number": 1, "value": 0}
+                {"number": 2, "value": 1}
+                ...
+
             400 Bad Request:
                 Description: The input number is invalid (e.g., not greater than 1).
                 Example:
@@ -120,24 +244,186 @@ class FibonacciNumberListView(APIView):
                     },
                     "message": "Validation error"
                 }
+
+            413 Content Too Large:
+                Description: A value, or the values of the requested page together, exceed the
+                    allowed result or response size. A smaller `page_size` may be accepted.
+
+            503 Service Unavailable:
+                Description: The jump to the first value did not finish within its time budget.
         """
         serializer = FibonacciNumberSerializer(data={"number": number})
 
         if not serializer.is_valid():
             return JsonResponseError(serializer.errors, message="Validation error", status=400)
 
-        fib_nums = FibonacciSequenceService().get_all_fib_numbers(number - 1)
+        return self.get_sequence_response(request, number)
+
+    def get_sequence_response(self, request: Request, stop: int, start: int = 1):
+        """Returns the visible Fibonacci numbers between two positions, paginated or streamed."""
+        query_serializer = ValueEncodingSerializer(data=request.query_params)
+
+        if not query_serializer.is_valid():
+            return JsonResponseError(
+                query_serializer.errors, message="Validation error", status=400
+            )
+
+        blacklist = BlacklistService().get_blacklist_index()
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        compress = bool(re_accepts_gzip.search(accept_encoding))
+
+        if request.accepted_renderer.format == OctetStreamRenderer.format:
+            fib_nums = FibonacciNumberSequence(stop, start=start, blacklist=blacklist)
+            records = (encode_binary_record(item["number"], item["value"]) for item in fib_nums)
+            return OctetStreamingResponse(records, compress=compress)
+
+        # Only the requested page is computed, the sequence itself is lazy
+        fib_nums = FibonacciNumberSequence(
+            stop,
+            start=start,
+            blacklist=blacklist,
+            value_encoding=query_serializer.validated_data["value_encoding"],
+        )
+
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return NDJsonStreamingResponse(fib_nums, compress=compress)
+
+        paginator = FibonacciNumberPagination()
+        return paginator.paginate(fib_nums, request)
+
+
+class FibonacciNumberRangeView(FibonacciNumberListView):
+
+    @conditional_on_blacklist
+    def get(self, request: Request, start: int, end: int, *args, **kwargs):
+        """Retrieve the Fibonacci numbers between two positions, excluding blacklisted values.
+
+        GET /api/v1/fibonacci/range/<start>/<end>/
+
+        Description:
+            This endpoint returns the Fibonacci numbers from position `start` up to position `end`,
+            omitting any numbers that are currently blacklisted. The sequence is entered with a
+            fast jump to the `start` position, so the cost only depends on the length of the range
+            (or of the requested page) and not on its distance from the beginning of the sequence.
+            Pagination, cursors and streaming work exactly as for the list endpoint.
+
+        Parameters:
+            start (int): The first position (inclusive). Must be a positive integer.
+            end (int): The last position (inclusive). Must not be less than `start`.
+
+            Query Parameters:
+                page (int, optional): The page number to retrieve (default: 1).
+                page_size (int, optional): Number of items per page (default: 100).
+                format (str, optional): Set to `ndjson` or `binary` to stream the whole range.
+                value_encoding (str, optional): `decimal` (default), `hex` or `base64` values.
+                pagination (str, optional): Set to `cursor` to traverse the range with cursors.
+                cursor (str, optional): The opaque cursor taken from a `next`/`previous` link.
+
+        Responses:
+            200 OK:
+                Description: A paginated list of Fibonacci numbers, excluding blacklisted ones.
+                Example:
+                {
+                    "success": true,
+                    "data": {
+                        "count": 3,
+                        "next": null,
+                        "previous": null,
+                        "results": [
+                            {"number": 10, "value": 34},
+                            {"number": 11, "value": 55},
+                            {"number": 12, "value": 89}
+                        ]
+                    }
+                }
+
+            400 Bad Request:
+                Description: The input positions are invalid (e.g., `end` is less than `start`).
+                Example:
+                {
+                    "success": false,
+                    "error": {
+                        "non_field_errors": [
+                            "'end' must be greater than or equal to 'start'."
+                        ]
+                    },
+                    "message": "Validation error"
+                }
+        """
+        serializer = NumberRangeSerializer(data={"start": start, "end": end})
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        return self.get_sequence_response(request, end, start=start)
+
+
+class FibonacciNumberBatchView(APIView):
+
+    def post(self, request: Request, *args, **kwargs):
+        """Retrieve the values from the Fibonacci sequence for many positions at once.
+
+        POST /api/v1/fibonacci/batch/
+
+        Description:
+            This endpoint returns the Fibonacci numbers at all given positions, in request order.
+            The blacklist is checked once for the whole batch, and blacklisted positions are
+            reported with an error instead of failing the request.
+
+        Body:
+            Either a JSON array of positions, or an object with the following key:
+                numbers (list[int]): The 1-based positions in the Fibonacci sequence.
 
+        Responses:
+            200 OK:
+                Description: Fibonacci numbers successfully retrieved.
+                Example:
+                {
+                    "success": true,
+                    "data": [
+                        {"number": 8, "value": 13},
+                        {"number": 3, "error": "This number is blacklisted and cannot be used."},
+                        {"number": 5, "value": 3}
+                    ]
+                }
+            400 Bad Request:
+                Description: The body is invalid (e.g., a position is not greater than 1).
+                Example:
+                {
+                    "success": false,
+                    "error": {
+                        "numbers": {
+                            "0": ["Ensure this value is greater than or equal to 1."]
+                        }
+                    },
+                    "message": "Validation error"
+                }
+            413 Content Too Large:
+                Description: A value, or all values together, exceed the allowed result or
+                    response size.
+        """
+        data = {"numbers": request.data} if isinstance(request.data, list) else request.data
+        serializer = FibonacciBatchSerializer(data=data)
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        numbers = serializer.validated_data["numbers"]
         blacklisted_numbers = BlacklistService().get_blacklisted_numbers()
 
+        fib_nums = FibonacciComputationExecutor().get_fib_numbers(
+            number - 1 for number in numbers if number not in blacklisted_numbers
+        )
+
         response_data = [
-            {"number": idx + 1, "value": num}
-            for idx, num in enumerate(fib_nums)
-            if (idx + 1) not in blacklisted_numbers
+            (
+                {"number": number, "error": "This number is blacklisted and cannot be used."}
+                if number in blacklisted_numbers
+                else {"number": number, "value": fib_nums[number - 1]}
+            )
+            for number in numbers
         ]
-
-        paginator = FibonacciNumberPagination()
-        return paginator.paginate(response_data, request)
+        return JsonResponseSuccess(response_data)
 
 
 class BlacklistNumberView(APIView):
@@ -248,3 +534,127 @@ class BlacklistNumberView(APIView):
         logger.info(success_message)
 
         return JsonResponseSuccess(success_message)
+
+
+class BlacklistBulkView(APIView):
+    def post(self, request, *args, **kwargs):
+        """Add many Fibonacci numbers to the blacklist in a single transaction.
+
+        POST /api/v1/blacklist/bulk/
+
+        Description:
+            This endpoint adds all given numbers to the blacklist at once. Numbers that are already
+            blacklisted do not fail the request, the outcome is reported for every number instead.
+
+        Body:
+            Either a JSON array of numbers, or an object with the following optional keys:
+                numbers (list[int]): Fibonacci numbers to blacklist.
+                ranges (list[dict]): Inclusive ranges of numbers, e.g. {"start": 10, "end": 20}.
+
+        Responses:
+            200 OK:
+                Description: The numbers were processed.
+                Example:
+                {
+                    "success": true,
+                    "data": {
+                        "processed": 2,
+                        "changed": 1,
+                        "results": [
+                            {"number": 13, "status": "added"},
+                            {"number": 21, "status": "already_blacklisted"}
+                        ]
+                    }
+                }
+
+            400 Bad Request:
+                Description: The body is invalid (e.g., a number is not greater than 1).
+                Example:
+                {
+                    "success": false,
+                    "error": {
+                        "numbers": {
+                            "0": ["Ensure this value is greater than or equal to 1."]
+                        }
+                    },
+                    "message": "Validation error"
+                }
+        """
+        serializer = self.get_serializer(request)
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        outcomes = BlacklistService().add_many_to_blacklist(serializer.get_numbers())
+        response_data = self.get_response_data(outcomes, "added", "already_blacklisted")
+
+        logger.info(f"{response_data['changed']} numbers have been added to the blacklist!")
+
+        return JsonResponseSuccess(response_data)
+
+    def delete(self, request, *args, **kwargs):
+        """Remove many Fibonacci numbers from the blacklist in a single transaction.
+
+        DELETE /api/v1/blacklist/bulk/
+
+        Description:
+            This endpoint removes all given numbers from the blacklist at once. Numbers that are not
+            blacklisted do not fail the request, the outcome is reported for every number instead.
+
+        Body:
+            Either a JSON array of numbers, or an object with the following optional keys:
+                numbers (list[int]): Fibonacci numbers to remove.
+                ranges (list[dict]): Inclusive ranges of numbers, e.g. {"start": 10, "end": 20}.
+
+        Responses:
+            200 OK:
+                Description: The numbers were processed.
+                Example:
+                {
+                    "success": true,
+                    "data": {
+                        "processed": 2,
+                        "changed": 1,
+                        "results": [
+                            {"number": 13, "status": "deleted"},
+                            {"number": 21, "status": "not_found"}
+                        ]
+                    }
+                }
+
+            400 Bad Request:
+                Description: The body is invalid (e.g., no numbers are given).
+                Example:
+                {
+                    "success": false,
+                    "error": {
+                        "non_field_errors": ["At least one number or range is required."]
+                    },
+                    "message": "Validation error"
+                }
+        """
+        serializer = self.get_serializer(request)
+
+        if not serializer.is_valid():
+            return JsonResponseError(serializer.errors, message="Validation error", status=400)
+
+        outcomes = BlacklistService().remove_many_from_blacklist(serializer.get_numbers())
+        response_data = self.get_response_data(outcomes, "deleted", "not_found")
+
+        logger.info(f"{response_data['changed']} numbers have been deleted from the blacklist!")
+
+        return JsonResponseSuccess(response_data)
+
+    def get_serializer(self, request) -> BlacklistBulkSerializer:
+        data = {"numbers": request.data} if isinstance(request.data, list) else request.data
+        return BlacklistBulkSerializer(data=data)
+
+    def get_response_data(self, outcomes: dict[int, bool], changed: str, unchanged: str) -> dict:
+        return {
+            "processed": len(outcomes),
+            "changed": sum(outcomes.values()),
+            "results": [
+                {"number": number, "status": changed if is_changed else unchanged}
+                for number, is_changed in outcomes.items()
+            ],
+        }
@@ -13,9 +13,16 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 
 from sequence_manager.utils.constants import (
+    DB_CONNECT_TIMEOUT,
+    DB_ENGINE,
     DB_HOST,
     DB_NAME,
     DB_PASSWORD,
+    DB_POOL_MAX_IDLE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_TIMEOUT,
     DB_PORT,
     DB_USER,
     DJANGO_SECRET_KEY,
@@ -48,6 +55,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "sequence_manager.utils.middleware.RequestTimingMiddleware",
+    "sequence_manager.utils.middleware.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -99,12 +108,32 @@ DATABASES = {
         "NAME": DB_NAME,
         "USER": DB_USER,
         "PASSWORD": DB_PASSWORD,
-    },
-    "OPTIONS": {
-        "connect_timeout": 30,
+        "OPTIONS": {
+            "connect_timeout": DB_CONNECT_TIMEOUT,
+        },
     },
 }
 
+if DB_POOL_MAX_SIZE > 0:
+    # Connections are still closed at the end of every request, but returned to the pool
+    DATABASES["default"]["ENGINE"] = "sequence_manager.db_backends.mysql"
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "max_idle": DB_POOL_MAX_IDLE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+        "recycle": DB_POOL_RECYCLE,
+        "pre_ping": DB_POOL_PRE_PING,
+    }
+
+if DB_ENGINE == "sqlite":
+    # Local stand-in for the MySQL database, used e.g. by `manage.py bench`
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / f"{DB_NAME}.sqlite3",
+        },
+    }
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -17,7 +17,10 @@ Including another URLconf
 
 from django.urls import include, path
 
+from sequence_manager.views import metrics_view
+
 
 urlpatterns = [
     path("", include("sequence_manager.fibonacci.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -0,0 +1,312 @@
+import functools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from sequence_manager.utils.metrics import registry
+
+
+POOL_WAIT_DURATION = registry.histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled database connection.", ("pool",)
+)
+POOL_CHECKOUTS_TOTAL = registry.counter(
+    "db_pool_checkouts_total", "Number of connections checked out of the pool.", ("pool",)
+)
+POOL_TIMEOUTS_TOTAL = registry.counter(
+    "db_pool_timeouts_total", "Number of checkouts which timed out on an exhausted pool.", ("pool",)
+)
+POOL_CLOSED_TOTAL = registry.counter(
+    "db_pool_closed_total",
+    "Number of pooled connections closed (recycle, ping, discard, overflow).",
+    ("pool", "reason"),
+)
+POOL_CONNECTIONS = registry.gauge(
+    "db_pool_connections", "Number of open pooled connections by state.", ("pool", "state")
+)
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of DB-API connections.
+
+    Connections are opened on demand, up to `max_size`, and up to `max_idle` of them are kept open
+    once released, the ones released above it after a burst are closed. Idle connections are reused in LIFO
+    order, so the least recently used ones are the first to expire. Connections older than
+    `recycle` seconds are closed instead of being reused, and with `pre_ping` an idle connection
+    is checked with `ping` before it is handed out, so connections dropped by the server (e.g.
+    after its `wait_timeout`) are replaced transparently.
+
+    Args:
+        name (str): The name of the pool, used as the label of its metrics.
+        max_idle (int): The maximum number of idle connections kept open.
+        max_size (int): The maximum number of open connections.
+        timeout (float): The seconds to wait for a connection when the pool is exhausted.
+        recycle (float): The age, in seconds, after which a connection is closed, 0 to disable.
+        pre_ping (bool): Whether idle connections are checked before being handed out.
+        ping (Callable[[Any], bool]): Returns whether a connection is still alive.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_idle: int,
+        max_size: int,
+        timeout: float,
+        recycle: float,
+        pre_ping: bool,
+        ping: Callable[[Any], bool],
+    ):
+        self.name = name
+        self.max_idle = min(max_idle, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.ping = ping
+        self._condition = threading.Condition()
+        # Idle connections with their creation time, the most recently released one last
+        self._idle: deque[tuple[Any, float]] = deque()
+        # Creation time of the checked out connections, by connection id
+        self._in_use: dict[int, float] = {}
+        # Open connections, including those being opened
+        self._size = 0
+        self._closed = False
+
+    def acquire(self, connect: Callable[[], Any]) -> tuple[Any, bool]:
+        """Checks a connection out of the pool, opening a new one when none is idle.
+
+        Args:
+            connect (Callable[[], Any]): Opens a new connection.
+
+        Returns:
+            tuple[Any, bool]: The connection and whether it was reused from the pool.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for `timeout` seconds.
+        """
+        started_at = time.monotonic()
+        deadline = started_at + self.timeout
+        while True:
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        if not self._idle and self._size >= self.max_size:
+                            POOL_TIMEOUTS_TOTAL.inc((self.name,))
+                            raise PoolTimeoutError(
+                                f"No connection of the '{self.name}' pool became available "
+                                f"within {self.timeout} seconds."
+                            )
+                if self._idle:
+                    connection, created_at = self._idle.pop()
+                    self._in_use[id(connection)] = created_at
+                else:
+                    connection, created_at = None, None
+                    self._size += 1
+
+            if connection is None:
+                return self._open(connect, started_at), False
+
+            reason = self._get_close_reason(connection, created_at)
+            if reason is None:
+                self._record_checkout(started_at)
+                return connection, True
+            self._close(connection, reason)
+
+    def release(self, connection: Any, discard: bool = False):
+        """Returns a connection to the pool, or closes it.
+
+        Args:
+            connection (Any): A connection checked out of the pool.
+            discard (bool): Whether the connection is in an unknown state and must be closed.
+        """
+        with self._condition:
+            created_at = self._in_use.get(id(connection))
+            if created_at is None:
+                # Not checked out of this pool, e.g. the pool has been replaced in the meantime
+                reason = None
+            elif discard or self._closed:
+                reason = "discard"
+            elif self.recycle and time.monotonic() - created_at >= self.recycle:
+                reason = "recycle"
+            elif len(self._idle) >= self.max_idle:
+                reason = "overflow"
+            else:
+                del self._in_use[id(connection)]
+                self._idle.append((connection, created_at))
+                self._condition.notify()
+                self._update_gauges()
+                return
+
+        if reason is None:
+            _close_quietly(connection)
+        else:
+            self._close(connection, reason)
+
+    def close_all(self):
+        """Closes the idle connections, checked out ones are closed when they are released."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+            self._update_gauges()
+
+        for connection in idle:
+            _close_quietly(connection)
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns the number of idle, checked out and open connections."""
+        with self._condition:
+            return {"idle": len(self._idle), "in_use": len(self._in_use), "size": self._size}
+
+    def _get_close_reason(self, connection: Any, created_at: float) -> str | None:
+        if self.recycle and time.monotonic() - created_at >= self.recycle:
+            return "recycle"
+        if self.pre_ping and not self.ping(connection):
+            return "ping"
+        return None
+
+    def _open(self, connect: Callable[[], Any], started_at: float) -> Any:
+        try:
+            connection = connect()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._in_use[id(connection)] = time.monotonic()
+        self._record_checkout(started_at)
+        return connection
+
+    def _close(self, connection: Any, reason: str):
+        with self._condition:
+            self._in_use.pop(id(connection), None)
+            self._size -= 1
+            self._condition.notify()
+            self._update_gauges()
+
+        POOL_CLOSED_TOTAL.inc((self.name, reason))
+        _close_quietly(connection)
+
+    def _record_checkout(self, started_at: float):
+        POOL_WAIT_DURATION.observe((self.name,), time.monotonic() - started_at)
+        POOL_CHECKOUTS_TOTAL.inc((self.name,))
+        with self._condition:
+            self._update_gauges()
+
+    def _update_gauges(self):
+        POOL_CONNECTIONS.set((self.name, "idle"), len(self._idle))
+        POOL_CONNECTIONS.set((self.name, "in_use"), len(self._in_use))
+
+
+def _close_quietly(connection: Any):
+    try:
+        connection.close()
+    except Exception:
+        # The connection is most likely already broken, there is nothing left to release
+        pass
+
+
+class PooledDatabaseWrapperMixin:
+    """Makes a Django database backend check its connections out of a `ConnectionPool`.
+
+    The pool settings are read from `OPTIONS["pool"]` of the database settings, with the keys of
+    the `ConnectionPool` arguments. Django keeps opening and closing the connection of every
+    request (`CONN_MAX_AGE = 0`), but opening checks a connection out of the pool of the database
+    alias and closing returns it, unless an error occurred or a transaction is still open.
+    """
+
+    _pools: dict[tuple[str, str], ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+    _pool_options: dict = {}
+    _pool: ConnectionPool | None = None
+    _is_reused_connection = False
+
+    def get_connection_params(self) -> dict:
+        conn_params = super().get_connection_params()
+        self._pool_options = conn_params.pop("pool", {})
+        return conn_params
+
+    def get_new_connection(self, conn_params: dict):
+        pool = self.get_pool(conn_params)
+        try:
+            connection, self._is_reused_connection = pool.acquire(
+                functools.partial(super().get_new_connection, conn_params)
+            )
+        except PoolTimeoutError as exc:
+            raise self.Database.OperationalError(str(exc)) from exc
+        # Released to the pool it came from, even if the settings have changed in the meantime
+        self._pool = pool
+        return connection
+
+    def init_connection_state(self):
+        # The session state set up when the connection was opened survives in the pool
+        if not self._is_reused_connection:
+            super().init_connection_state()
+
+    def get_pool(self, conn_params: dict) -> ConnectionPool:
+        """Returns the pool of the database alias and connection parameters, created on first use.
+
+        When the parameters of an alias change, e.g. when the test database replaces `NAME`, a
+        new pool is created and the idle connections of the previous one are closed, so they are
+        never handed out for the new database.
+
+        Args:
+            conn_params (dict): The parameters the connections of the pool are opened with.
+        """
+        key = (self.alias, repr(sorted(conn_params.items())))
+        superseded = []
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                superseded = [
+                    self._pools.pop(other_key)
+                    for other_key in list(self._pools)
+                    if other_key[0] == self.alias
+                ]
+                pool = ConnectionPool(
+                    name=self.alias, ping=self.is_connection_alive, **self._pool_options
+                )
+                self._pools[key] = pool
+
+        for other_pool in superseded:
+            other_pool.close_all()
+        return pool
+
+    @classmethod
+    def is_connection_alive(cls, connection) -> bool:
+        """Returns whether a raw connection still answers a trivial query."""
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except cls.Database.Error:
+            return False
+        return True
+
+    @classmethod
+    def close_pools(cls):
+        """Closes the pools of all database aliases, e.g. before the process exits."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close_all()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        discard = self.errors_occurred or self.in_atomic_block or not self.autocommit
+        with self.wrap_database_errors:
+            self._pool.release(self.connection, discard=discard)
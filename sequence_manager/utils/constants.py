@@ -1,11 +1,51 @@
 from sequence_manager.utils.helpers import get_env_var
 
-
 IS_DEBUG_ON: bool = get_env_var("ENVIRONMENT", required=True).lower() == "dev"
 DJANGO_SECRET_KEY: str = get_env_var("DJANGO_SECRET_KEY", required=True)
 
+DB_ENGINE: str = get_env_var("DB_ENGINE", default="mysql")
 DB_HOST: str = get_env_var("DB_HOST", required=True)
 DB_PORT: str = get_env_var("DB_PORT", required=True)
 DB_NAME: str = get_env_var("DB_NAME", required=True)
 DB_USER: str = get_env_var("DB_USER", required=True)
 DB_PASSWORD: str = get_env_var("DB_PASSWORD", required=True)
+DB_CONNECT_TIMEOUT: int = int(get_env_var("DB_CONNECT_TIMEOUT", default="30"))
+DB_POOL_MAX_IDLE: int = int(get_env_var("DB_POOL_MAX_IDLE", default="2"))
+DB_POOL_MAX_SIZE: int = int(get_env_var("DB_POOL_MAX_SIZE", default="10"))
+DB_POOL_TIMEOUT: float = float(get_env_var("DB_POOL_TIMEOUT", default="10"))
+DB_POOL_RECYCLE: float = float(get_env_var("DB_POOL_RECYCLE", default="3600"))
+DB_POOL_PRE_PING: bool = get_env_var("DB_POOL_PRE_PING", default="true").lower() == "true"
+
+FIB_ENGINE: str = get_env_var("FIB_ENGINE", default="fast_doubling")
+
+BLACKLIST_VERSION_CHECK_INTERVAL: float = float(
+    get_env_var("BLACKLIST_VERSION_CHECK_INTERVAL", default="0")
+)
+BLACKLIST_STORE_PATH: str = get_env_var("BLACKLIST_STORE_PATH")
+
+CURSOR_STATE_CACHE_BYTES: int = int(get_env_var("CURSOR_STATE_CACHE_BYTES", default="16777216"))
+
+BLACKLIST_BULK_MAX_ITEMS: int = int(get_env_var("BLACKLIST_BULK_MAX_ITEMS", default="10000"))
+BLACKLIST_BULK_BATCH_SIZE: int = int(get_env_var("BLACKLIST_BULK_BATCH_SIZE", default="1000"))
+
+FIB_BATCH_MAX_ITEMS: int = int(get_env_var("FIB_BATCH_MAX_ITEMS", default="1000"))
+
+FIB_OFFLOAD_THRESHOLD: int = int(get_env_var("FIB_OFFLOAD_THRESHOLD", default="100000"))
+FIB_OFFLOAD_MAX_WORKERS: int = int(get_env_var("FIB_OFFLOAD_MAX_WORKERS", default="2"))
+FIB_CPU_TIME_BUDGET: float = float(get_env_var("FIB_CPU_TIME_BUDGET", default="5"))
+FIB_COMPUTE_TIMEOUT: float = float(get_env_var("FIB_COMPUTE_TIMEOUT", default="10"))
+FIB_MAX_RESULT_BYTES: int = int(get_env_var("FIB_MAX_RESULT_BYTES", default="1048576"))
+FIB_MAX_RESPONSE_BYTES: int = int(get_env_var("FIB_MAX_RESPONSE_BYTES", default="4194304"))
+FIB_MAX_RESULT_DIGITS: int = int(get_env_var("FIB_MAX_RESULT_DIGITS", default="0"))
+FIB_COALESCE_THRESHOLD: int = int(get_env_var("FIB_COALESCE_THRESHOLD", default="10000"))
+FIB_RESULT_CACHE_BYTES: int = int(get_env_var("FIB_RESULT_CACHE_BYTES", default="33554432"))
+
+FIB_TABLE_PATH: str = get_env_var("FIB_TABLE_PATH")
+FIB_TABLE_SIZE: int = int(get_env_var("FIB_TABLE_SIZE", default="100000"))
+
+HTTP_CACHE_MAX_AGE: int = int(get_env_var("HTTP_CACHE_MAX_AGE", default="0"))
+
+PROFILE_DIR: str = get_env_var("PROFILE_DIR")
+PROFILE_SAMPLE_RATE: float = float(get_env_var("PROFILE_SAMPLE_RATE", default="0"))
+PROFILE_HEADER_TOKEN: str = get_env_var("PROFILE_HEADER_TOKEN")
+PROFILE_LATENCY_THRESHOLD: float = float(get_env_var("PROFILE_LATENCY_THRESHOLD", default="1"))
@@ -1,6 +1,13 @@
+import json
+from collections.abc import Iterable
 from typing import Any
 
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+from sequence_manager.utils.json_encoders import LargeIntJSONEncoder
+from sequence_manager.utils.metrics import timed_phase
 
 
 class JsonResponseSuccess(JsonResponse):
@@ -9,6 +16,7 @@ class JsonResponseSuccess(JsonResponse):
 
     This class is used to return a JSON response indicating a successful operation.
     The response includes a success flag, and associated data object, and an optional message.
+    Large integers in the data are rendered by `LargeIntJSONEncoder` in sub-quadratic time.
 
     Attributes:
         data (Any): A JSON-serializable object containing data.
@@ -21,7 +29,9 @@ class JsonResponseSuccess(JsonResponse):
 
     def __init__(self, data, *args, message=None, **kwargs):
         data = {"success": True, "data": data}
-        super().__init__(data, *args, **kwargs)
+        kwargs.setdefault("encoder", LargeIntJSONEncoder)
+        with timed_phase("serialize"):
+            super().__init__(data, *args, **kwargs)
 
 
 class JsonResponseError(JsonResponse):
@@ -47,3 +57,63 @@ class JsonResponseError(JsonResponse):
             data["message"] = message
 
         super().__init__(data, *args, **kwargs)
+
+
+class NDJsonStreamingResponse(StreamingHttpResponse):
+    """
+    Custom streaming response class for newline-delimited JSON.
+
+    This class is used to stream an iterable of JSON-serializable records, one record per line,
+    without holding the whole payload in memory. The records are serialized only as the response
+    is being sent, and the output can optionally be gzip-compressed on the fly.
+
+    Attributes:
+        records (Iterable): An iterable of JSON-serializable records.
+        compress (bool, optional): Whether to gzip-compress the stream. Defaults to False.
+
+    Example Usage:
+        NDJsonStreamingResponse(({"number": idx} for idx in range(10)))
+    """
+
+    def __init__(self, records: Iterable, *args, compress: bool = False, **kwargs):
+        kwargs.setdefault("content_type", "application/x-ndjson")
+        content = (
+            f"{json.dumps(record, cls=LargeIntJSONEncoder)}\n".encode() for record in records
+        )
+
+        if compress:
+            content = compress_sequence(content)
+
+        super().__init__(content, *args, **kwargs)
+
+        patch_vary_headers(self, ("Accept-Encoding",))
+        if compress:
+            self["Content-Encoding"] = "gzip"
+
+
+class OctetStreamingResponse(StreamingHttpResponse):
+    """
+    Custom streaming response class for binary content.
+
+    This class is used to stream an iterable of byte chunks without holding the whole payload in
+    memory. The output can optionally be gzip-compressed on the fly.
+
+    Attributes:
+        chunks (Iterable[bytes]): An iterable of byte chunks.
+        compress (bool, optional): Whether to gzip-compress the stream. Defaults to False.
+
+    Example Usage:
+        OctetStreamingResponse(idx.to_bytes(8, "little") for idx in range(10))
+    """
+
+    def __init__(self, chunks: Iterable[bytes], *args, compress: bool = False, **kwargs):
+        kwargs.setdefault("content_type", "application/octet-stream")
+
+        if compress:
+            chunks = compress_sequence(chunks)
+
+        super().__init__(chunks, *args, **kwargs)
+
+        patch_vary_headers(self, ("Accept-Encoding",))
+        if compress:
+            self["Content-Encoding"] = "gzip"
@@ -0,0 +1,128 @@
+import decimal
+import functools
+import math
+import re
+import secrets
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from sequence_manager.utils.constants import FIB_MAX_RESULT_DIGITS
+
+
+# Ints up to this size are converted with `str()`, which is fast for them and stays well below
+# the default `sys.get_int_max_str_digits()` limit of 4300 digits
+DECIMAL_THRESHOLD_BITS = 8192
+
+# Chunks of up to this size are converted to `Decimal` directly
+_CHUNK_BITS = 128
+
+_PLACEHOLDER_PREFIX = "__large_int__"
+
+_DECIMAL_CONTEXT = decimal.Context(
+    prec=decimal.MAX_PREC,
+    Emax=decimal.MAX_EMAX,
+    Emin=decimal.MIN_EMIN,
+    traps=[decimal.Inexact, decimal.Overflow],
+)
+
+
+class IntegerTooLongError(ValueError):
+    """Raised when an integer has more decimal digits than allowed."""
+
+    pass
+
+
+@functools.lru_cache(maxsize=256)
+def _get_power_of_two(exponent: int) -> decimal.Decimal:
+    """Returns 2**exponent as an exact `Decimal`, the powers are shared by all conversions."""
+    if exponent <= _CHUNK_BITS:
+        return _DECIMAL_CONTEXT.power(2, exponent)
+
+    half = exponent >> 1
+    return _DECIMAL_CONTEXT.multiply(_get_power_of_two(half), _get_power_of_two(exponent - half))
+
+
+def _int_to_decimal(value: int, bits: int) -> decimal.Decimal:
+    if bits <= _CHUNK_BITS:
+        return decimal.Decimal(value)
+
+    half = bits >> 1
+    high = value >> half
+    low = value - (high << half)
+    return _DECIMAL_CONTEXT.add(
+        _int_to_decimal(low, half),
+        _DECIMAL_CONTEXT.multiply(_int_to_decimal(high, bits - half), _get_power_of_two(half)),
+    )
+
+
+def int_to_decimal_str(value: int, max_digits: int = 0) -> str:
+    """Returns the decimal representation of an integer in sub-quadratic time.
+
+    CPython converts ints to strings in quadratic time and refuses to convert ints longer than
+    `sys.get_int_max_str_digits()`. Large values are therefore split into halves by their bits
+    recursively, and the halves are recombined with exact `Decimal` arithmetic, whose
+    multiplication is sub-quadratic and whose string conversion is linear. The powers of two used
+    to recombine the halves are cached, so converting many values of similar size, such as the
+    items of a page, reuses them.
+
+    Args:
+        value (int): The integer to convert.
+        max_digits (int, optional): The maximum number of digits allowed, 0 for no limit. This
+            limit replaces the interpreter one, which does not apply to this conversion.
+
+    Returns:
+        str: The decimal representation of the value.
+
+    Raises:
+        IntegerTooLongError: If the value has more than `max_digits` digits.
+    """
+    bits = abs(value).bit_length()
+    # A value of n bits has at least floor((n - 1) * log10(2)) + 1 digits
+    if max_digits and math.floor((bits - 1) * math.log10(2)) + 1 > max_digits:
+        raise IntegerTooLongError(f"The integer exceeds the limit of {max_digits} digits.")
+
+    if bits <= DECIMAL_THRESHOLD_BITS:
+        result = str(value)
+    else:
+        sign = "-" if value < 0 else ""
+        result = sign + str(_int_to_decimal(abs(value), bits))
+
+    if max_digits and len(result.lstrip("-")) > max_digits:
+        raise IntegerTooLongError(f"The integer exceeds the limit of {max_digits} digits.")
+
+    return result
+
+
+class LargeIntJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder which renders large integers with `int_to_decimal_str`.
+
+    The `json` module offers no hook for the representation of ints, so large ints are first
+    replaced with unique placeholder strings, the payload is encoded as usual and the quoted
+    placeholders are then substituted with the digits. The values therefore stay JSON numbers.
+    """
+
+    max_digits: int = FIB_MAX_RESULT_DIGITS
+
+    def encode(self, o) -> str:
+        large_ints: list[str] = []
+        token = f"{_PLACEHOLDER_PREFIX}{secrets.token_hex(8)}_"
+        text = super().encode(self._replace_large_ints(o, large_ints, token))
+
+        if not large_ints:
+            return text
+
+        placeholder_re = re.compile(f'"{token}(\\d+)"')
+        return placeholder_re.sub(lambda match: large_ints[int(match[1])], text)
+
+    def _replace_large_ints(self, o, large_ints: list[str], token: str):
+        if isinstance(o, dict):
+            return {key: self._replace_large_ints(val, large_ints, token) for key, val in o.items()}
+
+        if isinstance(o, (list, tuple)):
+            return [self._replace_large_ints(item, large_ints, token) for item in o]
+
+        if type(o) is int and o.bit_length() > DECIMAL_THRESHOLD_BITS:
+            large_ints.append(int_to_decimal_str(o, max_digits=self.max_digits))
+            return f"{token}{len(large_ints) - 1}"
+
+        return o
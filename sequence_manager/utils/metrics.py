@@ -0,0 +1,324 @@
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+from django.db.backends.signals import connection_created
+
+
+# Upper bounds of the histogram buckets, the `+Inf` bucket is always added
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: Iterable[str], label_values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{_escape_label_value(str(value))}"'
+        for name, value in zip(label_names, label_values)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Thread-safe counter with labels, rendered in the Prometheus text format."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1):
+        """Increments the counter of the given label values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, label_values: tuple[str, ...] = ()) -> float:
+        """Returns the counter of the given label values."""
+        return self._values.get(label_values, 0)
+
+    def collect(self) -> Iterator[str]:
+        """Yields the samples of the counter."""
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Thread-safe gauge with labels, rendered in the Prometheus text format."""
+
+    type_name = "gauge"
+
+    def set(self, label_values: tuple[str, ...], value: float):
+        """Sets the gauge of the given label values."""
+        with self._lock:
+            self._values[label_values] = value
+
+
+class CallbackMetric:
+    """Metric whose samples are read from a callback whenever the metrics are rendered.
+
+    It exposes counters and sizes kept by other objects, such as caches, without updating a
+    metric on their hot paths.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        label_names: tuple[str, ...] = (),
+        type_name: str = "gauge",
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.label_names = label_names
+        self.type_name = type_name
+
+    def collect(self) -> Iterator[str]:
+        """Yields the samples returned by the callback."""
+        for label_values, value in self.callback():
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+    def clear(self):
+        # The values belong to the object the callback reads from
+        pass
+
+
+class Histogram:
+    """Thread-safe histogram with labels, rendered in the Prometheus text format.
+
+    Observations are only counted into their bucket, so a histogram takes constant memory per
+    label combination whatever the number of observations.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # Per label values: the (non-cumulative) count of every bucket, the sum and the count
+        self._values: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+
+    def observe(self, label_values: tuple[str, ...], value: float):
+        """Records an observation for the given label values."""
+        bucket_idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(
+                label_values, ([0] * (len(self.buckets) + 1), 0, 0)
+            )
+            counts[bucket_idx] += 1
+            self._values[label_values] = (counts, total + value, count + 1)
+
+    def get_count(self, label_values: tuple[str, ...] = ()) -> int:
+        """Returns the number of observations for the given label values."""
+        return self._values.get(label_values, ((), 0, 0))[2]
+
+    def collect(self) -> Iterator[str]:
+        """Yields the cumulative bucket samples, the sum and the count of the histogram."""
+        with self._lock:
+            values = sorted(
+                (key, (list(val[0]), val[1], val[2])) for key, val in self._values.items()
+            )
+
+        for label_values, (counts, total, count) in values:
+            cumulative = 0
+            for upper_bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*self.label_names, "le"), (*label_values, _format_value(upper_bound))
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """Holds the metrics of the process and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Gauge | CallbackMetric | Histogram] = {}
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        """Registers a counter, or returns the one already registered under the name."""
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        """Registers a gauge, or returns the one already registered under the name."""
+        return self._register(Gauge(name, documentation, label_names))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        label_names: tuple[str, ...] = (),
+        type_name: str = "gauge",
+    ) -> CallbackMetric:
+        """Registers a metric read from a callback, or returns the one registered under the name.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            callback (Callable): Returns the `(label_values, value)` pairs of the metric.
+            label_names (tuple[str, ...], optional): The names of the labels. Defaults to ().
+            type_name (str, optional): `gauge` (default) or `counter`.
+        """
+        return self._register(CallbackMetric(name, documentation, callback, label_names, type_name))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Registers a histogram, or returns the one already registered under the name."""
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Resets the values of all metrics."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _register(self, metric):
+        return self._metrics.setdefault(metric.name, metric)
+
+
+registry = MetricsRegistry()
+
+
+class RequestTimings:
+    """Collects the time spent in every phase of a request and its database queries."""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.db_queries = 0
+        self.db_time = 0.0
+        # Queries of async views run in worker threads
+        self._lock = threading.Lock()
+        self._active_phases: set[str] = set()
+
+    def add_phase(self, name: str, duration: float):
+        """Adds a duration, in seconds, to a phase."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0) + duration
+
+    def add_query(self, duration: float):
+        """Records a database query which took the given duration, in seconds."""
+        with self._lock:
+            self.db_queries += 1
+            self.db_time += duration
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> tuple[RequestTimings, Token]:
+    """Starts collecting the timings of the current request, returns them with a reset token."""
+    timings = RequestTimings()
+    return timings, _request_timings.set(timings)
+
+
+def stop_request_timings(token: Token):
+    """Stops collecting the timings started with `start_request_timings`."""
+    _request_timings.reset(token)
+
+
+@contextmanager
+def timed_phase(name: str):
+    """Adds the time spent in the block, or in the decorated function, to a request phase.
+
+    It does nothing outside of a request timed by `RequestTimingMiddleware`. Nested blocks of the
+    same phase, e.g. a timed method calling another one, are only counted once.
+
+    Args:
+        name (str): The name of the phase, as reported in the `Server-Timing` header.
+    """
+    timings = _request_timings.get()
+    if timings is None or name in timings._active_phases:
+        yield
+        return
+
+    timings._active_phases.add(name)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings._active_phases.discard(name)
+        timings.add_phase(name, time.perf_counter() - started_at)
+
+
+def count_query(execute, sql, params, many, context):
+    """Database execute wrapper recording every query into the timings of the current request."""
+    timings = _request_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add_query(time.perf_counter() - started_at)
+
+
+def install_query_counter(connection):
+    """Installs `count_query` on a database connection, unless it is already installed."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    install_query_counter(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="install_query_counter")
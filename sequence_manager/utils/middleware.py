@@ -0,0 +1,279 @@
+import cProfile
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponseBase
+from django.urls import Resolver404, resolve
+
+from sequence_manager.utils.constants import (
+    PROFILE_DIR,
+    PROFILE_HEADER_TOKEN,
+    PROFILE_LATENCY_THRESHOLD,
+    PROFILE_SAMPLE_RATE,
+)
+from sequence_manager.utils.metrics import (
+    QUERY_COUNT_BUCKETS,
+    SIZE_BUCKETS,
+    RequestTimings,
+    install_query_counter,
+    registry,
+    start_request_timings,
+    stop_request_timings,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_TOTAL = registry.counter(
+    "http_requests_total", "Number of handled requests.", ("endpoint", "method", "status")
+)
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "Time spent handling requests.", ("endpoint", "method")
+)
+REQUEST_PHASE_DURATION = registry.histogram(
+    "http_request_phase_duration_seconds",
+    "Time spent in every phase of the requests (validate, blacklist, compute, serialize, db).",
+    ("endpoint", "phase"),
+)
+REQUEST_DB_QUERIES = registry.histogram(
+    "http_request_db_queries",
+    "Number of database queries per request.",
+    ("endpoint",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes",
+    "Size of the response bodies, streamed responses excluded.",
+    ("endpoint",),
+    buckets=SIZE_BUCKETS,
+)
+
+
+class RequestTimingMiddleware:
+    """Measures every request and reports its phase timings.
+
+    The time spent in the phases marked with `timed_phase` (validation, blacklist lookup,
+    computation and serialization), in database queries and in total is sent in the
+    `Server-Timing` header, and recorded into the per-endpoint histograms exposed on `/metrics`.
+    Streamed responses are produced after the middleware returns, so their body is not covered.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        # Connections opened before the middleware was loaded missed the `connection_created` hook
+        for connection in connections.all(initialized_only=True):
+            install_query_counter(connection)
+
+        timings, token = start_request_timings()
+        started_at = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_request_timings(token)
+
+        self.record(request, response, timings, time.perf_counter() - started_at)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        timings, token = start_request_timings()
+        started_at = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_request_timings(token)
+
+        self.record(request, response, timings, time.perf_counter() - started_at)
+        return response
+
+    def record(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        timings: RequestTimings,
+        duration: float,
+    ):
+        """Adds the `Server-Timing` header to the response and records the request metrics."""
+        match = request.resolver_match
+        # Unmatched paths share a label, so scanners cannot blow up the number of series
+        endpoint = (match.url_name or match.view_name) if match else "unmatched"
+
+        server_timing = [f"{name};dur={phase * 1000:.3f}" for name, phase in timings.phases.items()]
+        if timings.db_queries:
+            queries = "query" if timings.db_queries == 1 else "queries"
+            server_timing.append(
+                f'db;dur={timings.db_time * 1000:.3f};desc="{timings.db_queries} {queries}"'
+            )
+        server_timing.append(f"total;dur={duration * 1000:.3f}")
+        response["Server-Timing"] = ", ".join(server_timing)
+
+        REQUESTS_TOTAL.inc((endpoint, request.method, str(response.status_code)))
+        REQUEST_DURATION.observe((endpoint, request.method), duration)
+        for name, phase in timings.phases.items():
+            REQUEST_PHASE_DURATION.observe((endpoint, name), phase)
+        REQUEST_PHASE_DURATION.observe((endpoint, "db"), timings.db_time)
+        REQUEST_DB_QUERIES.observe((endpoint,), timings.db_queries)
+        if not response.streaming:
+            RESPONSE_SIZE.observe((endpoint,), len(response.content))
+
+
+class ProfilingMiddleware:
+    """Profiles sampled or explicitly requested requests and dumps the slow ones.
+
+    A request is profiled when it carries the `X-Profile-Token` header with the configured
+    `PROFILE_HEADER_TOKEN`, or when it is picked with the `PROFILE_SAMPLE_RATE` probability. Its
+    view then runs under `cProfile`, or under `tracemalloc` when the request sends
+    `X-Profile-Mode: memory`, and if it takes longer than `PROFILE_LATENCY_THRESHOLD` seconds the
+    pstats file or the tracemalloc snapshot is written to `PROFILE_DIR`. The name of the file is
+    returned in the `X-Profile-Dump` header.
+
+    Both profilers are process-wide, so only one request is profiled at a time and concurrent
+    ones are served normally. `cProfile` only sees the thread it was enabled in, while async views
+    run on the event loop, so requests to async views are not CPU profiled (the memory mode still
+    applies to them). In an async middleware chain (ASGI), requests which are not profiled are
+    passed on without leaving the event loop, and profiled ones run in a thread which also runs
+    the sync view, so that the profiler sees it. Without `PROFILE_DIR`, or with neither a token nor a sample rate, the
+    middleware removes itself from the chain and costs nothing.
+    """
+
+    profile_dir: str = PROFILE_DIR
+    sample_rate: float = PROFILE_SAMPLE_RATE
+    header_token: str = PROFILE_HEADER_TOKEN
+    latency_threshold: float = PROFILE_LATENCY_THRESHOLD
+
+    sync_capable = True
+    async_capable = True
+
+    _lock = threading.Lock()
+
+    def __init__(self, get_response):
+        if not self.profile_dir or (self.sample_rate <= 0 and not self.header_token):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profiler = self.get_profiler(request)
+        if profiler is None or not self._lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            return profiler(request, self.get_response)
+        finally:
+            self._lock.release()
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        profiler = self.get_profiler(request)
+        if profiler is None or not self._lock.acquire(blocking=False):
+            return await self.get_response(request)
+
+        try:
+            # Thread-sensitive sync views called from this thread run in it, under the profiler
+            return await sync_to_async(profiler)(request, async_to_sync(self.get_response))
+        finally:
+            self._lock.release()
+
+    def get_profiler(self, request: HttpRequest) -> Callable | None:
+        """Returns the profiling method to run the request with, or None to serve it normally."""
+        if not self.is_profiled(request):
+            return None
+        if request.headers.get("X-Profile-Mode") == "memory":
+            return self.trace_memory
+        if self.is_async_view(request):
+            return None
+        return self.profile_cpu
+
+    def is_profiled(self, request: HttpRequest) -> bool:
+        """Returns whether the request has to be profiled."""
+        token = request.headers.get("X-Profile-Token")
+        if token and self.header_token:
+            return secrets.compare_digest(token.encode(), self.header_token.encode())
+
+        return random.random() < self.sample_rate
+
+    def is_async_view(self, request: HttpRequest) -> bool:
+        """Returns whether the request is routed to an async view, which cProfile cannot see."""
+        try:
+            match = resolve(request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            return False
+        return iscoroutinefunction(match.func)
+
+    def profile_cpu(
+        self, request: HttpRequest, get_response: Callable[[HttpRequest], HttpResponseBase]
+    ) -> HttpResponseBase:
+        """Runs the request under `cProfile` and dumps the pstats file of a slow request."""
+        profiler = cProfile.Profile()
+        started_at = time.perf_counter()
+        profiler.enable()
+        try:
+            response = get_response(request)
+        finally:
+            profiler.disable()
+
+        duration = time.perf_counter() - started_at
+        if duration >= self.latency_threshold:
+            path = self.get_dump_path(request, duration, "prof")
+            profiler.dump_stats(path)
+            self.report_dump(request, response, path)
+        return response
+
+    def trace_memory(
+        self, request: HttpRequest, get_response: Callable[[HttpRequest], HttpResponseBase]
+    ) -> HttpResponseBase:
+        """Runs the request under `tracemalloc` and dumps the snapshot of a slow request."""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        started_at = time.perf_counter()
+        try:
+            response = get_response(request)
+            duration = time.perf_counter() - started_at
+            snapshot = tracemalloc.take_snapshot() if duration >= self.latency_threshold else None
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        if snapshot is not None:
+            path = self.get_dump_path(request, duration, "snapshot")
+            snapshot.dump(path)
+            self.report_dump(request, response, path)
+        return response
+
+    def get_dump_path(self, request: HttpRequest, duration: float, extension: str) -> str:
+        """Returns a unique path in the profile directory, named after the request."""
+        match = request.resolver_match
+        endpoint = (match.url_name or match.view_name) if match else "unmatched"
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{endpoint}-{duration * 1000:.0f}ms-"
+            f"{uuid.uuid4().hex[:8]}.{extension}"
+        )
+        os.makedirs(self.profile_dir, exist_ok=True)
+        return os.path.join(self.profile_dir, name)
+
+    def report_dump(self, request: HttpRequest, response: HttpResponseBase, path: str):
+        logger.info(f"Profile of {request.method} {request.get_full_path()} written to '{path}'.")
+        response["X-Profile-Dump"] = os.path.basename(path)
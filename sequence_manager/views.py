@@ -0,0 +1,15 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from sequence_manager.utils.metrics import registry
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Exposes the metrics of the process in the Prometheus text format.
+
+    GET /metrics
+
+    Every worker process keeps its own metrics, so each of them has to be scraped.
+    """
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")